@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+"""
+generate the screen column width tables used by urwid.old_str_util and
+the str_util extension module from the unicodedata module
+
+usage: bin/gen_width_tables.py
+
+Writes urwid/width_table.py and source/width_table.h.  Run it with the
+newest Python available, the tables follow its version of the Unicode
+database.
+"""
+from __future__ import print_function
+
+import os
+import sys
+import unicodedata
+
+try:
+    unichr
+except NameError:
+    unichr = chr
+
+PAGE_SHIFT = 8
+PAGE_SIZE = 1 << PAGE_SHIFT
+MAX_CODE_POINT = 0x10ffff
+
+# unassigned code points in these ranges are reserved for wide characters
+DEFAULT_WIDE = [
+    (0x3400, 0x4dbf),
+    (0x4e00, 0x9fff),
+    (0xf900, 0xfaff),
+    (0x20000, 0x2fffd),
+    (0x30000, 0x3fffd),
+    ]
+
+
+def char_width(o):
+    """
+    Return the screen column width for code point o.
+    """
+    if o in (0x0e, 0x0f):
+        # shift out and shift in select the DEC special graphics set
+        return 0
+    if o < 0x7f:
+        # treat control characters the same as ascii
+        return 1
+    if o < 0xa0:
+        return 0
+    c = unichr(o)
+    cat = unicodedata.category(c)
+    if cat in ('Mn', 'Me') or (cat == 'Cf' and o != 0xad):
+        # combining marks and format characters, except soft hyphen
+        return 0
+    if 0x1160 <= o <= 0x11ff:
+        # hangul jamo vowels and final consonants join the previous
+        # character
+        return 0
+    if unicodedata.east_asian_width(c) in ('W', 'F'):
+        return 2
+    if cat == 'Cn':
+        for low, high in DEFAULT_WIDE:
+            if low <= o <= high:
+                return 2
+    return 1
+
+
+def build_tables():
+    """
+    Return (ranges, pages, blocks) where ranges is a list of
+    (last code point, width) for runs of code points with the same
+    width, pages is a block number for each page of code points and
+    blocks is a list of the distinct pages of widths.
+    """
+    widths = [char_width(o) for o in range(MAX_CODE_POINT + 1)]
+
+    ranges = []
+    for o, w in enumerate(widths):
+        if ranges and ranges[-1][1] == w:
+            ranges[-1] = (o, w)
+        else:
+            ranges.append((o, w))
+
+    block_numbers = {}
+    blocks = []
+    pages = []
+    for start in range(0, MAX_CODE_POINT + 1, PAGE_SIZE):
+        block = tuple(widths[start:start + PAGE_SIZE])
+        if block not in block_numbers:
+            block_numbers[block] = len(blocks)
+            blocks.append(block)
+        pages.append(block_numbers[block])
+    assert len(blocks) <= 256, "block numbers don't fit in a byte"
+    return ranges, pages, blocks
+
+
+def rows(values, per_row):
+    for i in range(0, len(values), per_row):
+        yield values[i:i + per_row]
+
+
+def python_table(ranges, pages, blocks):
+    out = [
+        "# generated by bin/gen_width_tables.py from Unicode %s data, "
+        "do not edit" % unicodedata.unidata_version,
+        "",
+        "from urwid.compat import B, bytes3",
+        "",
+        "PAGE_SHIFT = %d" % PAGE_SHIFT,
+        "",
+        "# (last code point, width) for each run of code points with "
+        "the same width",
+        "widths = ["]
+    for r in ranges:
+        out.append("    %r," % (r,))
+    out.append("    ]")
+    out.append("")
+    out.append("# block of widths for each page of code points")
+    out.append("_pages = [")
+    for row in rows(pages, 16):
+        out.append("    " + " ".join(["%d," % p for p in row]))
+    out.append("    ]")
+    out.append("")
+    out.append("# widths for each block, one digit per code point")
+    out.append("_blocks = (")
+    for n, block in enumerate(blocks):
+        out.append("    # block %d" % n)
+        for row in rows(block, 64):
+            out.append('    "%s"' % "".join([str(w) for w in row]))
+    out.append("    )")
+    out.append("")
+    out.append("width_pages = bytearray(_pages)")
+    out.append("width_blocks = bytearray(B(_blocks).translate(")
+    out.append("    bytes3([max(i - 48, 0) for i in range(256)])))")
+    out.append("del _pages, _blocks")
+    return "\n".join(out) + "\n"
+
+
+def c_table(ranges, pages, blocks):
+    out = [
+        "/* generated by bin/gen_width_tables.py from Unicode %s data, "
+        "do not edit */" % unicodedata.unidata_version,
+        "",
+        "#define WIDTH_PAGE_SHIFT %d" % PAGE_SHIFT,
+        "#define WIDTH_MAX_CODE_POINT 0x%x" % MAX_CODE_POINT,
+        "",
+        "/* block of widths for each page of code points */",
+        "static const unsigned char width_pages[%d] = {" % len(pages)]
+    for row in rows(pages, 16):
+        out.append("    " + " ".join(["%d," % p for p in row]))
+    out.append("};")
+    out.append("")
+    out.append("/* widths for each block */")
+    out.append("static const unsigned char width_blocks[%d] = {" %
+        (len(blocks) * PAGE_SIZE))
+    for n, block in enumerate(blocks):
+        out.append("    /* block %d */" % n)
+        for row in rows(block, 32):
+            out.append("    " + "".join(["%d," % w for w in row]))
+    out.append("};")
+    return "\n".join(out) + "\n"
+
+
+def main():
+    top = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+    ranges, pages, blocks = build_tables()
+    with open(os.path.join(top, "urwid", "width_table.py"), "w") as f:
+        f.write(python_table(ranges, pages, blocks))
+    with open(os.path.join(top, "source", "width_table.h"), "w") as f:
+        f.write(c_table(ranges, pages, blocks))
+    print("%d ranges, %d pages, %d blocks" % (len(ranges), len(pages),
+        len(blocks)), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
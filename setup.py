@@ -43,7 +43,8 @@ setup_d = {
     'version':release,
     'author':"Ian Ward",
     'author_email':"ian@excess.org",
-    'ext_modules':[Extension('urwid.str_util', sources=['source/str_util.c'])],
+    'ext_modules':[Extension('urwid.str_util', sources=['source/str_util.c'],
+        depends=['source/width_table.h'])],
     'packages':['urwid', 'urwid.tests'],
     'url':"http://urwid.org/",
     'license':"LGPL",
@@ -39,47 +39,13 @@
 #define FMT_N "n"
 #endif
 
-static int widths_len = 2*38;
-static const int widths[] = {
-    126, 1,
-    159, 0,
-    687, 1,
-    710, 0,
-    711, 1,
-    727, 0,
-    733, 1,
-    879, 0,
-    1154, 1,
-    1161, 0,
-    4347, 1,
-    4447, 2,
-    7467, 1,
-    7521, 0,
-    8369, 1,
-    8426, 0,
-    9000, 1,
-    9002, 2,
-    11021, 1,
-    12350, 2,
-    12351, 1,
-    12438, 2,
-    12442, 0,
-    19893, 2,
-    19967, 1,
-    55203, 2,
-    63743, 1,
-    64106, 2,
-    65039, 1,
-    65059, 0,
-    65131, 2,
-    65279, 1,
-    65376, 2,
-    65500, 1,
-    65510, 2,
-    120831, 1,
-    262141, 2,
-    1114109, 1
-};
+// Python 3.3+ stores unicode strings with 1, 2 or 4 bytes per character
+#if PY_VERSION_HEX >= 0x03030000
+#define PEP393
+#endif
+
+/* width_pages and width_blocks, see bin/gen_width_tables.py */
+#include "width_table.h"
 
 
 static short byte_encoding = ENC_UTF8;
@@ -151,18 +117,11 @@ ord -- ordinal";
 
 static int Py_GetWidth(long int ord)
 {
-    int i;
-
-    if ((ord == 0xe) || (ord == 0xf))
-            return 0;
+    if ((ord < 0) || (ord > WIDTH_MAX_CODE_POINT))
+        return 1;
 
-    for (i=0; i<widths_len; i+=2)
-    {
-        if (ord <= widths[i])
-            return widths[i+1];
-    }
-    
-    return 1;
+    return width_blocks[(width_pages[ord >> WIDTH_PAGE_SHIFT]
+        << WIDTH_PAGE_SHIFT) | (ord & ((1 << WIDTH_PAGE_SHIFT) - 1))];
 }
 
 
@@ -466,6 +425,44 @@ static PyObject * within_double_byte(PyObject *self, PyObject *args)
 }
 
 
+//======================================================================
+// unicode text access
+
+#ifdef PEP393
+// run statement for each of the kinds of PEP 393 string, with
+// "type" defined as the type of one character
+#define FOR_EACH_KIND(kind, statement) \
+    switch (kind) { \
+    case PyUnicode_1BYTE_KIND: { typedef Py_UCS1 type; statement; break; } \
+    case PyUnicode_2BYTE_KIND: { typedef Py_UCS2 type; statement; break; } \
+    default: { typedef Py_UCS4 type; statement; break; } \
+    }
+#endif
+
+
+static int Py_UnicodePrepare(PyObject *text, Py_ssize_t *start_offs,
+                             Py_ssize_t *end_offs)
+{
+    // Make unicode text ready to be read and keep offsets inside it.
+    Py_ssize_t text_len;
+
+#ifdef PEP393
+#if PY_VERSION_HEX < 0x030c0000
+    if (PyUnicode_READY(text) == -1)
+        return -1;
+#endif
+    text_len = PyUnicode_GET_LENGTH(text);
+#else
+    text_len = PyUnicode_GET_SIZE(text);
+#endif
+    if (*end_offs > text_len)
+        *end_offs = text_len;
+    if (*start_offs < 0)
+        *start_offs = 0;
+    return 0;
+}
+
+
 //======================================================================
 char is_wide_char_doc[] =
 "is_wide_char(string/unicode text, int offs) -> bool iswide\n\n\
@@ -476,13 +473,24 @@ offs -- offset";
 static int Py_IsWideChar(PyObject *text, Py_ssize_t offs)
 {
     const unsigned char *str;
+#ifndef PEP393
     Py_UNICODE *ustr;
+#endif
     Py_ssize_t ret[2], str_len;
 
     if (PyUnicode_Check(text))  //text_py is unicode string
     {
+#ifdef PEP393
+        if (offs < 0 || offs >= PyUnicode_GetLength(text)) {
+            PyErr_SetString(PyExc_IndexError,
+                "is_wide_char: offset out of range");
+            return -1;
+        }
+        return (Py_GetWidth((long int)PyUnicode_READ_CHAR(text, offs)) == 2);
+#else
         ustr = PyUnicode_AS_UNICODE(text);
         return (Py_GetWidth((long int)ustr[offs]) == 2);
+#endif
     }
 
 #ifndef PYTHON3
@@ -655,16 +663,29 @@ static Py_ssize_t Py_CalcWidth(PyObject *text, Py_ssize_t start_offs,
 {
     unsigned char * str;
     Py_ssize_t i, ret[2], str_len;
-    int screencols;
+    Py_ssize_t screencols;
+#ifdef PEP393
+    const void *data;
+#else
     Py_UNICODE *ustr;
+#endif
 
     if (PyUnicode_Check(text))  //text_py is unicode string
     {
-        ustr = PyUnicode_AS_UNICODE(text);
+        if (Py_UnicodePrepare(text, &start_offs, &end_offs) == -1)
+            return -1;
         screencols = 0;
- 
+#ifdef PEP393
+        data = PyUnicode_DATA(text);
+        FOR_EACH_KIND(PyUnicode_KIND(text),
+            for(i=start_offs; i<end_offs; i++)
+                screencols += Py_GetWidth(((const type *)data)[i]))
+#else
+        ustr = PyUnicode_AS_UNICODE(text);
+
         for(i=start_offs; i<end_offs; i++) 
             screencols += Py_GetWidth(ustr[i]);
+#endif
 
         return screencols;
     }
@@ -708,17 +729,18 @@ static Py_ssize_t Py_CalcWidth(PyObject *text, Py_ssize_t start_offs,
 static PyObject * calc_width(PyObject *self, PyObject *args)
 {
     PyObject *text;
-    int start_offs, end_offs;
-    long ret;
+    Py_ssize_t start_offs, end_offs;
+    Py_ssize_t ret;
 
-    if (!PyArg_ParseTuple(args, "Oii", &text, &start_offs, &end_offs))
+    if (!PyArg_ParseTuple(args, "O" FMT_N FMT_N, &text, &start_offs,
+                          &end_offs))
         return NULL; 
 
     ret = Py_CalcWidth(text, start_offs, end_offs);
     if (ret==-1) //an error occured
         return NULL;
 
-    return Py_BuildValue("l", ret);
+    return Py_BuildValue(FMT_N, ret);
 }
 
 
@@ -742,26 +764,41 @@ static int Py_CalcTextPos(PyObject *text, Py_ssize_t start_offs,
     unsigned char * str;
     Py_ssize_t i, dummy[2], str_len;
     int screencols, width;
+#ifdef PEP393
+    const void *data;
+#else
     Py_UNICODE *ustr;
+#endif
 
     if (PyUnicode_Check(text))  //text_py is unicode string
     {
-        ustr = PyUnicode_AS_UNICODE(text);
+        if (Py_UnicodePrepare(text, &start_offs, &end_offs) == -1)
+            return -1;
         screencols = 0;
+#ifdef PEP393
+        data = PyUnicode_DATA(text);
+        i = start_offs;
+        FOR_EACH_KIND(PyUnicode_KIND(text),
+            for(; i<end_offs; i++)
+            {
+                width = Py_GetWidth(((const type *)data)[i]);
+                if (width+screencols > pref_col)
+                    break;
+                screencols += width;
+            })
+#else
+        ustr = PyUnicode_AS_UNICODE(text);
  
         for(i=start_offs; i<end_offs; i++)
         {
             width = Py_GetWidth(ustr[i]);
             
             if (width+screencols > pref_col)
-            {
-                ret[0] = i;
-                ret[1] = screencols;
-                return 0;
-            }
+                break;
 
             screencols += width;
         }
+#endif
         
         ret[0] = i;
         ret[1] = screencols;
@@ -40,8 +40,10 @@ from urwid.listbox import (ListWalkerError, ListWalker, PollingListWalker,
 from urwid.graphics import (BigText, LineBox, BarGraphMeta, BarGraphError,
     BarGraph, GraphVScale, ProgressBar, scale_bar_values)
 from urwid.canvas import (CanvasCache, CanvasError, Canvas, TextCanvas,
-    BlankCanvas, SolidCanvas, CompositeCanvas, CanvasCombine, CanvasOverlay,
-    CanvasJoin)
+    PackedTextCanvas, BlankCanvas, SolidCanvas, CompositeCanvas,
+    CanvasCombine, CanvasOverlay, CanvasJoin)
+from urwid.snapshot import (SnapshotError, SnapshotWriter, SnapshotReader,
+    SnapshotFrame)
 from urwid.font import (get_all_fonts, Font, Thin3x3Font, Thin4x3Font,
     HalfBlock5x4Font, HalfBlock6x5Font, HalfBlockHeavy6x5Font, Thin6x6Font,
     HalfBlock7x7Font)
@@ -59,7 +61,7 @@ try:
 except ImportError:
     pass
 from urwid.text_layout import (TextLayout, StandardTextLayout, default_layout,
-    LayoutSegment)
+    LayoutSegment, LayoutCache, layout_cache)
 from urwid.display_common import (UPDATE_PALETTE_ENTRY, DEFAULT, BLACK,
     DARK_RED, DARK_GREEN, BROWN, DARK_BLUE, DARK_MAGENTA, DARK_CYAN,
     LIGHT_GRAY, DARK_GRAY, LIGHT_RED, LIGHT_GREEN, YELLOW, LIGHT_BLUE,
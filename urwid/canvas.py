@@ -20,13 +20,51 @@
 # Urwid web site: http://excess.org/urwid/
 
 import weakref
+from array import array
+from bisect import bisect_right
 
 from urwid.util import rle_len, rle_append_modify, rle_join_modify, rle_product, \
-    calc_width, calc_text_pos, apply_target_encoding, trim_text_attr_cs
-from urwid.text_layout import trim_line, LayoutSegment
+    calc_width, calc_text_pos, apply_target_encoding, plain_target_text, \
+    trim_text_attr_cs, LRUCache
+from urwid.text_layout import trim_line
 from urwid.compat import bytes
 
 
+# names of the counters CanvasCache collects for each (widget class, size)
+CACHE_STATS = ('hits', 'misses', 'stores', 'refused', 'invalidated',
+    'collected', 'evicted')
+(_HITS, _MISSES, _STORES, _REFUSED, _INVALIDATED, _COLLECTED,
+    _EVICTED) = range(len(CACHE_STATS))
+
+
+class _cache_method(object):
+    """
+    Method descriptor used by :class:`CanvasCache`.
+
+    Looked up on an instance it behaves like a normal method.  Looked
+    up on the CanvasCache class it is bound to the current cache (see
+    :meth:`CanvasCache.get_current`), or to every live cache when
+    all_caches is True, so code written for the original class-level
+    cache keeps working.
+    """
+    def __init__(self, fn, all_caches=False):
+        self.fn = fn
+        self.all_caches = all_caches
+        self.__doc__ = fn.__doc__
+
+    def __get__(self, obj, cls):
+        if obj is not None:
+            return self.fn.__get__(obj, cls)
+        if not self.all_caches:
+            return self.fn.__get__(cls.get_current(), cls)
+        fn = self.fn
+        def call_all(*args, **kwargs):
+            for cache in list(cls._instances.keys()):
+                fn(cache, *args, **kwargs)
+        call_all.__doc__ = fn.__doc__
+        return call_all
+
+
 class CanvasCache(object):
     """
     Cache for rendered canvases.  Automatically populated and
@@ -39,18 +77,130 @@ class CanvasCache(object):
     after redrawing the screen, keeping the canvases from being
     garbage collected.
 
+    Optionally the most recently used canvases may also be kept
+    alive by a bounded tier of strong references, see
+    :meth:`set_limits`.  This lets canvases of widgets that are not
+    on the current screen (eg. a hidden tab) survive until they
+    are shown again.
+
+    Each :class:`MainLoop` owns a CanvasCache instance and makes it
+    the current cache while it renders and handles input, so
+    several main loops in one process (eg. one per remote session)
+    do not share cached canvases, limits or statistics.  Widgets
+    rendered outside of a main loop use a default instance.
+
+    Calling :meth:`store`, :meth:`fetch` or :meth:`set_limits` on
+    the CanvasCache class uses the current cache.  Calling
+    :meth:`invalidate` or :meth:`clear` on the class applies to
+    every cache.
+
+    Widget._invalidate() goes through :meth:`invalidate_later`.
+    While a main loop is running invalidations are queued and applied
+    together by :meth:`flush_invalidations` before the next fetch,
+    normally when the main loop draws the screen.  Otherwise they are
+    applied immediately.
+
+    When :attr:`compact_cells` is not None the composite canvases
+    stored are compacted with :meth:`CompositeCanvas.compact`, so
+    that drawing them again (eg. a large ListBox that has not
+    changed) iterates over their content more quickly.  Canvases
+    with more than compact_cells columns * rows are not copied.
+
+    :attr:`generation` is a counter increased by every invalidation.
+    If it has not changed since a canvas was cached then that canvas
+    is still up to date, which lets the main loop skip rendering
+    entirely when nothing has changed.
+
+    While :attr:`collect_stats` is True each cache counts hits,
+    misses, stores, stores refused because a child widget's canvas
+    was not cached, and canvases removed by invalidation, garbage
+    collection or the strong tier's limits, per widget class and
+    size.  See :meth:`get_stats` and :meth:`reset_stats`.
+
     _widgets[widget] = {(wcls, size, focus): weakref.ref(canvas), ...}
     _refs[weakref.ref(canvas)] = (widget, wcls, size, focus)
-    _deps[widget} = [dependent_widget, ...]
+    _deps[widget] = set([dependent_widget, ...])
+    _rdeps[dependent_widget] = set([widget, ...])
+    _strong = LRUCache({weakref.ref(canvas): canvas, ...}) or None
     """
-    _widgets = {}
-    _refs = {}
-    _deps = {}
-    hits = 0
-    fetches = 0
-    cleanups = 0
+    _instances = weakref.WeakKeyDictionary()
+    _current = None
+    _defer_count = 0
+    _pending = set()
+    generation = 0
+
+    def __init__(self, max_entries=None, max_cells=None,
+            compact_cells=None):
+        """
+        max_entries, max_cells -- limits passed to :meth:`set_limits`
+        compact_cells -- initial value of :attr:`compact_cells`
+        """
+        self.compact_cells = compact_cells
+        self._widgets = {}
+        self._refs = {}
+        self._deps = {}
+        self._rdeps = {}
+        self._strong = None
+        self._occluded = {}
+        self.collect_stats = True
+        self.reset_stats()
+
+        # callbacks must not keep this cache alive
+        cache_ref = weakref.ref(self)
+        def cleanup(ref):
+            cache = cache_ref()
+            if cache is not None:
+                cache.cleanup(ref)
+        self._cleanup_callback = cleanup
+        def evicted(ref, canvas):
+            cache = cache_ref()
+            if cache is not None:
+                cache._evicted(ref)
+        self._evict_callback = evicted
+
+        self.set_limits(max_entries, max_cells)
+        CanvasCache._instances[self] = None
+
+    def get_current(cls):
+        """
+        Return the cache used by widget rendering at the moment.
+        """
+        return cls._current
+    get_current = classmethod(get_current)
 
-    def store(cls, wcls, canvas):
+    def set_current(cls, cache):
+        """
+        Make cache the one used by widget rendering and return the
+        cache that was current before.
+        """
+        previous = cls._current
+        cls._current = cache
+        return previous
+    set_current = classmethod(set_current)
+
+    def set_limits(self, max_entries=None, max_cells=None):
+        """
+        Keep strong references to recently used canvases, discarding
+        the least recently used ones when either limit is exceeded.
+
+        max_entries -- maximum number of canvases to keep alive
+        max_cells -- maximum total of columns * rows of the
+            canvases kept alive
+
+        With both limits set to None (the default) no strong
+        references are kept and canvases live only as long as
+        something else holds on to them.
+        """
+        if max_entries is None and max_cells is None:
+            self._strong = None
+        elif self._strong is None:
+            self._strong = LRUCache(max_entries, max_cells,
+                self._evict_callback)
+        else:
+            self._strong.set_limits(max_entries, max_cells)
+    set_limits = _cache_method(set_limits)
+
+    def store(self, wcls, canvas):
         """
         Store a weakref to canvas in the cache.
 
@@ -82,18 +232,30 @@ class CanvasCache(object):
         if depends_on is None and hasattr(canvas, 'children'):
             depends_on = walk_depends(canvas)
         if depends_on:
+            occluded = self._occluded
             for w in depends_on:
-                if w not in cls._widgets:
+                if w not in self._widgets or (w in occluded and
+                        not self.is_cached(occluded[w])):
+                    if self.collect_stats:
+                        self._count(widget, size, _REFUSED)
                     return
+            depends_on = set(depends_on)
             for w in depends_on:
-                cls._deps.setdefault(w,[]).append(widget)
-
-        ref = weakref.ref(canvas, cls.cleanup)
-        cls._refs[ref] = (widget, wcls, size, focus)
-        cls._widgets.setdefault(widget, {})[(wcls, size, focus)] = ref
-    store = classmethod(store)
-
-    def fetch(cls, widget, wcls, size, focus):
+                self._deps.setdefault(w, set()).add(widget)
+            self._rdeps.setdefault(widget, set()).update(depends_on)
+
+        ref = weakref.ref(canvas, self._cleanup_callback)
+        self._refs[ref] = (widget, wcls, size, focus)
+        self._widgets.setdefault(widget, {})[(wcls, size, focus)] = ref
+        if self.collect_stats:
+            self._count(widget, size, _STORES)
+        if self.compact_cells is not None and hasattr(canvas, 'compact'):
+            canvas.compact(self.compact_cells)
+        if self._strong is not None:
+            self._strong.store(ref, canvas, canvas.cols() * canvas.rows())
+    store = _cache_method(store)
+
+    def fetch(self, widget, wcls, size, focus):
         """
         Return the cached canvas or None.
 
@@ -101,75 +263,273 @@ class CanvasCache(object):
         wcls -- widget class that contains render() function
         size, focus -- render() parameters
         """
-        cls.fetches += 1 # collect stats
-
-        sizes = cls._widgets.get(widget, None)
-        if not sizes:
-            return None
-        ref = sizes.get((wcls, size, focus), None)
-        if not ref:
-            return None
-        canv = ref()
+        self.fetches += 1 # collect stats
+        canv, ref = self._lookup(widget, wcls, size, focus)
         if canv:
-            cls.hits += 1 # more stats
+            self.hits += 1 # more stats
+            if self._strong is not None and ref is not None:
+                self._strong.touch(ref)
+            if self.collect_stats:
+                self._count(widget, size, _HITS)
+        elif self.collect_stats:
+            self._count(widget, size, _MISSES)
         return canv
-    fetch = classmethod(fetch)
+    fetch = _cache_method(fetch)
 
-    def invalidate(cls, widget):
+    def _lookup(self, widget, wcls, size, focus):
         """
-        Remove all canvases cached for widget.
+        Return (canvas, weakref) for the cached canvas or (None, ref),
+        without counting the lookup in the statistics or changing
+        which canvases are kept.  See :meth:`fetch`.
         """
-        try:
-            for ref in cls._widgets[widget].values():
-                try:
-                    del cls._refs[ref]
-                except KeyError:
-                    pass
-            del cls._widgets[widget]
-        except KeyError:
-            pass
-        if widget not in cls._deps:
+        if CanvasCache._pending:
+            CanvasCache.flush_invalidations()
+        canv = None
+        ref = None
+        sizes = self._widgets.get(widget, None)
+        if sizes:
+            ref = sizes.get((wcls, size, focus), None)
+            if ref:
+                canv = ref()
+        if not canv and self._occluded:
+            canv = self._occluded.get(widget, None)
+            if canv and canv.widget_info[1:] != (size, focus):
+                canv = None
+        return canv, ref
+    _lookup = _cache_method(_lookup)
+
+    def set_occluded(self, canvases):
+        """
+        Set the canvases used for widgets that are hidden from view
+        and return the ones set before.
+
+        canvases -- {widget: canvas, ...} where canvas was rendered by
+            widget.  :meth:`fetch` returns that canvas when there is no
+            up-to-date one for the same size and focus, so the hidden
+            widget isn't rendered again.  Used by :class:`Overlay`.
+
+        Canvases built from one of these canvases after it is out of
+        date are not stored.
+        """
+        previous = self._occluded
+        self._occluded = canvases
+        return previous
+    set_occluded = _cache_method(set_occluded)
+
+    def is_cached(self, canvas):
+        """
+        Return True if canvas is stored in this cache.
+        """
+        info = getattr(canvas, 'widget_info', None)
+        if not info:
+            return False
+        sizes = self._widgets.get(info[0], None)
+        if not sizes:
+            return False
+        for ref in sizes.values():
+            if ref() is canvas:
+                return True
+        return False
+    is_cached = _cache_method(is_cached)
+
+    def invalidate(self, widget):
+        """
+        Remove all canvases cached for widget and for the widgets
+        that depend on it.
+        """
+        self._invalidate_walk([widget])
+    invalidate = _cache_method(invalidate, all_caches=True)
+
+    def _invalidate_walk(self, pending):
+        """
+        Remove all canvases cached for the widgets in the list pending
+        and their dependants.  Dependants shared by several of the
+        widgets are only visited once.
+
+        ** MODIFIES pending **
+        """
+        CanvasCache.generation += 1
+        widgets = self._widgets
+        deps = self._deps
+        removed = 0
+        while pending:
+            w = pending.pop()
+            sizes = widgets.pop(w, None)
+            if sizes:
+                removed += 1
+                for ref in sizes.values():
+                    info = self._refs.pop(ref, None)
+                    if info and self.collect_stats:
+                        self._count(w, info[2], _INVALIDATED)
+                    if self._strong is not None:
+                        self._strong.pop(ref)
+            self._forget_depends(w)
+            # popping before following the links stops the walk
+            # from visiting a widget's dependants twice
+            dependants = deps.pop(w, None)
+            if dependants:
+                pending.extend(dependants)
+        if removed:
+            self.invalidations += 1
+            self.invalidated_widgets += removed
+
+    def invalidate_later(cls, widget):
+        """
+        Queue widget to be invalidated in every cache by the next
+        :meth:`flush_invalidations` when invalidations are being
+        deferred, otherwise invalidate it immediately.
+        """
+        if cls._defer_count:
+            CanvasCache.generation += 1
+            cls._pending.add(widget)
+        else:
+            cls.invalidate(widget)
+    invalidate_later = classmethod(invalidate_later)
+
+    def flush_invalidations(cls):
+        """
+        Apply all queued invalidations to every cache.
+        """
+        if not cls._pending:
             return
-        dependants = cls._deps.get(widget, [])
-        try:
-            del cls._deps[widget]
-        except KeyError:
-            pass
-        for w in dependants:
-            cls.invalidate(w)
-    invalidate = classmethod(invalidate)
-
-    def cleanup(cls, ref):
-        cls.cleanups += 1 # collect stats
-
-        w = cls._refs.get(ref, None)
-        del cls._refs[ref]
+        widgets = list(cls._pending)
+        cls._pending.clear()
+        for cache in list(cls._instances.keys()):
+            cache._invalidate_walk(list(widgets))
+    flush_invalidations = classmethod(flush_invalidations)
+
+    def defer_invalidation(cls, defer=True):
+        """
+        Start (defer=True) or stop (defer=False) queuing invalidations
+        made with :meth:`invalidate_later`.  Calls are counted so
+        that several main loops may defer at the same time, and
+        queued invalidations are flushed when the last one stops.
+        """
+        if defer:
+            cls._defer_count += 1
+            return
+        cls._defer_count = max(0, cls._defer_count - 1)
+        if not cls._defer_count:
+            cls.flush_invalidations()
+    defer_invalidation = classmethod(defer_invalidation)
+
+    def _forget_depends(self, widget):
+        """
+        Remove the links from the widgets that widget depends on
+        back to widget.
+        """
+        depends_on = self._rdeps.pop(widget, None)
+        if not depends_on:
+            return
+        deps = self._deps
+        for w in depends_on:
+            dependants = deps.get(w)
+            if dependants is None:
+                continue
+            dependants.discard(widget)
+            if not dependants:
+                del deps[w]
+
+    def cleanup(self, ref):
+        self.cleanups += 1 # collect stats
+
+        w = self._refs.pop(ref, None)
         if not w:
             return
         widget, wcls, size, focus = w
-        sizes = cls._widgets.get(widget, None)
+        if self.collect_stats:
+            self._count(widget, size, _COLLECTED)
+        sizes = self._widgets.get(widget, None)
         if not sizes:
             return
-        try:
-            del sizes[(wcls, size, focus)]
-        except KeyError:
-            pass
+        sizes.pop((wcls, size, focus), None)
         if not sizes:
-            try:
-                del cls._widgets[widget]
-                del cls._deps[widget]
-            except KeyError:
-                pass
-    cleanup = classmethod(cleanup)
+            del self._widgets[widget]
+            self._deps.pop(widget, None)
+            self._forget_depends(widget)
 
-    def clear(cls):
+    def _evicted(self, ref):
+        """
+        Called when the strong tier releases the canvas for ref.
+        """
+        w = self._refs.get(ref, None)
+        if w and self.collect_stats:
+            self._count(w[0], w[2], _EVICTED)
+
+    def _count(self, widget, size, index):
+        key = (widget.__class__, size)
+        counts = self._stats.get(key, None)
+        if counts is None:
+            counts = self._stats[key] = [0] * len(CACHE_STATS)
+        counts[index] += 1
+
+    def get_stats(self):
+        """
+        Return a snapshot of the statistics collected by this cache
+        as a dictionary with the following items:
+
+        'fetches', 'hits', 'cleanups' -- totals, also available as
+            attributes of the same names
+        'invalidations' -- number of invalidation walks that removed
+            any canvases
+        'invalidated_widgets' -- widgets that lost their canvases
+            during those walks, including dependants
+        'entries' -- number of canvases cached now
+        'strong_entries', 'strong_cells' -- canvases and columns * rows
+            kept alive by the strong tier (see :meth:`set_limits`)
+        'by_key' -- {(widget class, size): {name: count, ...}, ...}
+            with the names in CACHE_STATS plus 'entries', the number
+            of canvases cached now for that widget class and size
+        """
+        by_key = {}
+        for key, counts in self._stats.items():
+            d = by_key[key] = dict(zip(CACHE_STATS, counts))
+            d['entries'] = 0
+        for widget, wcls, size, focus in self._refs.values():
+            key = (widget.__class__, size)
+            d = by_key.get(key, None)
+            if d is None:
+                d = by_key[key] = dict.fromkeys(CACHE_STATS, 0)
+                d['entries'] = 0
+            d['entries'] += 1
+        strong = self._strong
+        return {
+            'fetches': self.fetches,
+            'hits': self.hits,
+            'cleanups': self.cleanups,
+            'invalidations': self.invalidations,
+            'invalidated_widgets': self.invalidated_widgets,
+            'entries': len(self._refs),
+            'strong_entries': strong is not None and len(strong) or 0,
+            'strong_cells': strong is not None and strong.cost or 0,
+            'by_key': by_key,
+            }
+
+    def reset_stats(self):
+        """
+        Set all the counters reported by :meth:`get_stats` to zero.
+        """
+        self.hits = 0
+        self.fetches = 0
+        self.cleanups = 0
+        self.invalidations = 0
+        self.invalidated_widgets = 0
+        self._stats = {}
+
+    def clear(self):
         """
         Empty the cache.
         """
-        cls._widgets = {}
-        cls._refs = {}
-        cls._deps = {}
-    clear = classmethod(clear)
+        CanvasCache.generation += 1
+        self._widgets = {}
+        self._refs = {}
+        self._deps = {}
+        self._rdeps = {}
+        if self._strong is not None:
+            self._strong.clear()
+    clear = _cache_method(clear, all_caches=True)
+
+CanvasCache.set_current(CanvasCache())
 
 
 
@@ -252,6 +612,78 @@ class Canvas(object):
     def content_delta(self):
         raise NotImplementedError()
 
+    def row_fingerprints(self, trim_left=0, trim_top=0, cols=None,
+            rows=None, attr_map=None):
+        """
+        Return a list with a fingerprint for each row that
+        :meth:`content` would return when called with the same
+        parameters, or None if this canvas can't provide them.
+
+        Fingerprints are cheap to create and compare.  Rows with
+        equal fingerprints have the same content, but rows with the
+        same content may have different fingerprints.  A fingerprint
+        refers to data kept by its canvas instead of copying it.
+        """
+        return None
+
+    def damage(self, other):
+        """
+        Return a list of (left, top, cols, rows) rectangles covering
+        the parts of this canvas that may differ from canvas other,
+        normally the canvas drawn on the screen before this one.
+        Everything outside the rectangles is known to be unchanged.
+
+        Canvases that aren't :attr:`cacheable` may change after they
+        are drawn, so they are always damaged completely.
+        """
+        if other is self and self.cacheable:
+            return []
+        return [(0, 0, self.cols(), self.rows())]
+
+    def damaged_rows(self, other):
+        """
+        Return a list with a value for each row of this canvas, True
+        if any part of the row is damaged (see :meth:`damage`).
+        """
+        damaged = [False] * self.rows()
+        for left, top, cols, rows in self.damage(other):
+            damaged[top:top + rows] = [True] * rows
+        return damaged
+
+    def child_at(self, col, row):
+        """
+        Return (x, y, canvas, position) for the child canvas rendered
+        by a widget that covers (col, row) of this canvas, or None.
+
+        x, y -- where the child canvas is placed on this canvas
+        position -- position of the child widget in its container, as
+            passed to :func:`CanvasCombine` or :func:`CanvasJoin`
+        """
+        return None
+
+    def widget_path(self, col, row):
+        """
+        Return a list of (canvas, position, col, row) tuples for the
+        canvases rendered by widgets that cover (col, row), starting
+        with the outermost.  col and row are translated to be relative
+        to each canvas, and the widget, size and focus that rendered
+        each canvas are available in its :attr:`widget_info`.
+
+        This is a record of the last render, it doesn't call any
+        widget methods.
+        """
+        path = []
+        canv, pos = self, None
+        while True:
+            if canv.widget_info:
+                path.append((canv, pos, col, row))
+            child = canv.child_at(col, row)
+            if child is None:
+                return path
+            x, y, canv, pos = child
+            col -= x
+            row -= y
+
     def get_cursor(self):
         c = self.coords.get("cursor", None)
         if not c:
@@ -309,6 +741,61 @@ class Canvas(object):
 
 
 
+def _pad_text_attr_cs(text, attr, cs, maxcol, check_width):
+    """
+    Check and pad the rows of text, attr and cs passed to a
+    TextCanvas so that every row covers maxcol screen columns.
+    Return (text, attr, cs, maxcol).
+
+    ** MODIFIES the text, attr and cs lists passed **
+    """
+    if text == None:
+        text = []
+
+    if check_width:
+        widths = []
+        for t in text:
+            if type(t) != bytes:
+                raise CanvasError("Canvas text must be plain strings encoded in the screen's encoding", repr(text))
+            widths.append( calc_width( t, 0, len(t)) )
+    else:
+        assert type(maxcol) == int
+        widths = [maxcol] * len(text)
+
+    if maxcol is None:
+        if widths:
+            # find maxcol ourselves
+            maxcol = max(widths)
+        else:
+            maxcol = 0
+
+    if attr == None:
+        attr = [[] for x in range(len(text))]
+    if cs == None:
+        cs = [[] for x in range(len(text))]
+
+    # pad text and attr to maxcol
+    for i in range(len(text)):
+        w = widths[i]
+        if w > maxcol:
+            raise CanvasError("Canvas text is wider than the maxcol specified \n%r\n%r\n%r"%(maxcol,widths,text))
+        if w < maxcol:
+            text[i] = text[i] + bytes().rjust(maxcol-w)
+        a_gap = len(text[i]) - rle_len( attr[i] )
+        if a_gap < 0:
+            raise CanvasError("Attribute extends beyond text \n%r\n%r" % (text[i],attr[i]) )
+        if a_gap:
+            rle_append_modify( attr[i], (None, a_gap))
+
+        cs_gap = len(text[i]) - rle_len( cs[i] )
+        if cs_gap < 0:
+            raise CanvasError("Character Set extends beyond text \n%r\n%r" % (text[i],cs[i]) )
+        if cs_gap:
+            rle_append_modify( cs[i], (None, cs_gap))
+
+    return text, attr, cs, maxcol
+
+
 class TextCanvas(Canvas):
     """
     class for storing rendered text and attributes
@@ -324,49 +811,8 @@ class TextCanvas(Canvas):
         check_width -- check and fix width of all lines in text
         """
         Canvas.__init__(self)
-        if text == None:
-            text = []
-
-        if check_width:
-            widths = []
-            for t in text:
-                if type(t) != bytes:
-                    raise CanvasError("Canvas text must be plain strings encoded in the screen's encoding", repr(text))
-                widths.append( calc_width( t, 0, len(t)) )
-        else:
-            assert type(maxcol) == int
-            widths = [maxcol] * len(text)
-
-        if maxcol is None:
-            if widths:
-                # find maxcol ourselves
-                maxcol = max(widths)
-            else:
-                maxcol = 0
-
-        if attr == None:
-            attr = [[] for x in range(len(text))]
-        if cs == None:
-            cs = [[] for x in range(len(text))]
-
-        # pad text and attr to maxcol
-        for i in range(len(text)):
-            w = widths[i]
-            if w > maxcol:
-                raise CanvasError("Canvas text is wider than the maxcol specified \n%r\n%r\n%r"%(maxcol,widths,text))
-            if w < maxcol:
-                text[i] = text[i] + bytes().rjust(maxcol-w)
-            a_gap = len(text[i]) - rle_len( attr[i] )
-            if a_gap < 0:
-                raise CanvasError("Attribute extends beyond text \n%r\n%r" % (text[i],attr[i]) )
-            if a_gap:
-                rle_append_modify( attr[i], (None, a_gap))
-
-            cs_gap = len(text[i]) - rle_len( cs[i] )
-            if cs_gap < 0:
-                raise CanvasError("Character Set extends beyond text \n%r\n%r" % (text[i],cs[i]) )
-            if cs_gap:
-                rle_append_modify( cs[i], (None, cs_gap))
+        text, attr, cs, maxcol = _pad_text_attr_cs(text, attr, cs,
+            maxcol, check_width)
 
         self._attr = attr
         self._cs = cs
@@ -394,6 +840,18 @@ class TextCanvas(Canvas):
             return x+dx, y+dy
         return None
 
+    def _text_attr_cs(self, trim_top, rows):
+        """
+        Return an iterable of (text, attr, cs) for rows rows starting
+        at row trim_top.
+        """
+        if trim_top or rows < len(self._text):
+            return zip(
+                self._text[trim_top:trim_top+rows],
+                self._attr[trim_top:trim_top+rows],
+                self._cs[trim_top:trim_top+rows])
+        return zip(self._text, self._attr, self._cs)
+
     def content(self, trim_left=0, trim_top=0, cols=None, rows=None,
             attr_map=None):
         """
@@ -415,15 +873,7 @@ class TextCanvas(Canvas):
         assert trim_top >=0 and trim_top < maxrow
         assert rows > 0 and trim_top + rows <= maxrow
 
-        if trim_top or rows < maxrow:
-            text_attr_cs = zip(
-                self._text[trim_top:trim_top+rows],
-                self._attr[trim_top:trim_top+rows],
-                self._cs[trim_top:trim_top+rows])
-        else:
-            text_attr_cs = zip(self._text, self._attr, self._cs)
-
-        for text, a_row, cs_row in text_attr_cs:
+        for text, a_row, cs_row in self._text_attr_cs(trim_top, rows):
             if trim_left or cols < self._maxcol:
                 text, a_row, cs_row = trim_text_attr_cs(
                     text, a_row, cs_row, trim_left,
@@ -438,6 +888,19 @@ class TextCanvas(Canvas):
                 i += run
             yield row
 
+    def row_fingerprints(self, trim_left=0, trim_top=0, cols=None,
+            rows=None, attr_map=None):
+        """
+        Return a list with a fingerprint for each row of
+        :meth:`content` called with the same parameters.
+        """
+        if not cols:
+            cols = self._maxcol - trim_left
+        if not rows:
+            rows = self.rows() - trim_top
+        # comparing rows of the same canvas only compares identities
+        return [(text, a_row, cs_row, trim_left, cols, attr_map)
+            for text, a_row, cs_row in self._text_attr_cs(trim_top, rows)]
 
     def content_delta(self, other):
         """
@@ -452,6 +915,149 @@ class TextCanvas(Canvas):
         return self.content()
 
 
+class PackedTextCanvas(TextCanvas):
+    """
+    A :class:`TextCanvas` that stores its content compactly.
+
+    The text of all rows is kept in a single byte string and the
+    combined attribute and character set runs of all rows in one
+    array of integers, with attributes and character sets replaced
+    by indexes into small tables.  The rows returned by
+    :meth:`content` are built on first use and the same row lists
+    are returned by later calls, so drawing a canvas repeatedly does
+    not allocate new rows.
+
+    The content of a PackedTextCanvas can't be modified after it
+    is created.  The _text, _attr and _cs attributes of
+    :class:`TextCanvas` are available as read-only copies.
+    """
+    def __init__(self, text=None, attr=None, cs=None,
+        cursor=None, maxcol=None, check_width=True):
+        """
+        See :class:`TextCanvas` for parameter details.
+        """
+        Canvas.__init__(self)
+        text, attr, cs, maxcol = _pad_text_attr_cs(text, attr, cs,
+            maxcol, check_width)
+        self.cursor = cursor
+        self._maxcol = maxcol
+        self._num_rows = len(text)
+
+        self._buf = bytes().join(text)
+        # _row_offs[i]:_row_offs[i+1] is the slice of _buf for row i
+        # _run_offs[i]:_run_offs[i+1] is the slice of _runs for row i
+        # _runs is a flat array of (attr index, cs index, length)
+        self._row_offs = row_offs = array('l', [0])
+        self._run_offs = run_offs = array('l', [0])
+        self._runs = runs = array('l')
+        self._attr_table = []
+        self._cs_table = []
+        attr_index = {}
+        cs_index = {}
+        for t, a_row, cs_row in zip(text, attr, cs):
+            row_offs.append(row_offs[-1] + len(t))
+            for (a, c), run in rle_product(a_row, cs_row):
+                ai = attr_index.get(a)
+                if ai is None:
+                    ai = attr_index[a] = len(self._attr_table)
+                    self._attr_table.append(a)
+                ci = cs_index.get(c)
+                if ci is None:
+                    ci = cs_index[c] = len(self._cs_table)
+                    self._cs_table.append(c)
+                runs.extend((ai, ci, run))
+            run_offs.append(len(runs))
+
+        self._row_cache = None
+        self._mapped_cache = None, None
+
+    def rows(self):
+        """Return the number of rows in this canvas."""
+        return self._num_rows
+
+    def _row(self, i):
+        """
+        Return row i as a list of (attr, cs, text) tuples.
+        """
+        buf = self._buf
+        runs = self._runs
+        attr_table = self._attr_table
+        cs_table = self._cs_table
+        offs = self._row_offs[i]
+        row = []
+        for k in range(self._run_offs[i], self._run_offs[i+1], 3):
+            end = offs + runs[k+2]
+            row.append((attr_table[runs[k]], cs_table[runs[k+1]],
+                buf[offs:end]))
+            offs = end
+        return row
+
+    def _rows_content(self):
+        """
+        Return the cached list of all rows.
+        """
+        rows = self._row_cache
+        if rows is None:
+            rows = self._row_cache = [self._row(i)
+                for i in range(self._num_rows)]
+        return rows
+
+    def _text_attr_cs(self, trim_top, rows):
+        for i in range(trim_top, trim_top + rows):
+            a_row = []
+            cs_row = []
+            for a, c, t in self._row(i):
+                rle_append_modify(a_row, (a, len(t)))
+                rle_append_modify(cs_row, (c, len(t)))
+            yield (self._buf[self._row_offs[i]:self._row_offs[i+1]],
+                a_row, cs_row)
+
+    def _get_text(self):
+        return [self._buf[self._row_offs[i]:self._row_offs[i+1]]
+            for i in range(self._num_rows)]
+    _text = property(_get_text)
+    _attr = property(lambda self: [a for t, a, c in
+        self._text_attr_cs(0, self._num_rows)])
+    _cs = property(lambda self: [c for t, a, c in
+        self._text_attr_cs(0, self._num_rows)])
+
+    def content(self, trim_left=0, trim_top=0, cols=None, rows=None,
+            attr_map=None):
+        """
+        Return the canvas content as a list of rows where each row
+        is a list of (attr, cs, text) tuples.
+
+        When the whole canvas is requested the rows returned are
+        shared between calls and must not be modified.
+        """
+        if (trim_left or trim_top or (cols and cols != self._maxcol) or
+                (rows and rows != self._num_rows)):
+            return TextCanvas.content(self, trim_left, trim_top, cols,
+                rows, attr_map)
+        if not attr_map:
+            return iter(self._rows_content())
+        # remember the rows for the last attribute map used, because
+        # the cviews of a cached CompositeCanvas keep the same map
+        last_map, mapped = self._mapped_cache
+        if last_map is not attr_map:
+            mapped = [[(attr_map.get(a, a), c, t) for a, c, t in row]
+                for row in self._rows_content()]
+            self._mapped_cache = attr_map, mapped
+        return iter(mapped)
+
+    def row_fingerprints(self, trim_left=0, trim_top=0, cols=None,
+            rows=None, attr_map=None):
+        """
+        Return a list with a fingerprint for each row of
+        :meth:`content` called with the same parameters.
+        """
+        if not cols:
+            cols = self._maxcol - trim_left
+        if not rows:
+            rows = self._num_rows - trim_top
+        return [(row, trim_left, cols, attr_map) for row in
+            self._rows_content()[trim_top:trim_top + rows]]
+
 
 class BlankCanvas(Canvas):
     """
@@ -472,6 +1078,16 @@ class BlankCanvas(Canvas):
         for i in range(rows):
             yield line
 
+    def row_fingerprints(self, trim_left, trim_top, cols, rows, attr):
+        """
+        Return a list with a fingerprint for each row of
+        :meth:`content` called with the same parameters.
+        """
+        def_attr = None
+        if attr and None in attr:
+            def_attr = attr[None]
+        return [(cols, def_attr)] * rows
+
     def cols(self):
         raise NotImplementedError("BlankCanvas doesn't know its own size!")
 
@@ -517,6 +1133,21 @@ class SolidCanvas(Canvas):
         for i in range(rows):
             yield line
 
+    def row_fingerprints(self, trim_left=0, trim_top=0, cols=None,
+            rows=None, attr=None):
+        """
+        Return a list with a fingerprint for each row of
+        :meth:`content` called with the same parameters.
+        """
+        if cols is None:
+            cols = self.size[0]
+        if rows is None:
+            rows = self.size[1]
+        def_attr = None
+        if attr and None in attr:
+            def_attr = attr[None]
+        return [(self._text, self._cs, cols, def_attr)] * rows
+
     def content_delta(self, other):
         """
         Return the differences between other and this canvas.
@@ -525,13 +1156,52 @@ class SolidCanvas(Canvas):
             return [self.cols()]*self.rows()
         return self.content()
 
+    # recently used canvases returned by shared()
+    _shared = LRUCache(max_items=256)
+
+    def shared(cls, fill_char, cols, rows):
+        """
+        Return a SolidCanvas filled with fill_char that is shared with
+        other callers, creating it if necessary.
+
+        The same canvas object is returned for the same parameters, so
+        it must not be modified or finalized: wrap it with
+        :class:`CompositeCanvas` before returning it from a render()
+        method.  Rendering blank areas and fills this way avoids
+        creating new canvases, and lets :meth:`CompositeCanvas.damage`
+        tell that they are unchanged by comparing canvas identity.
+        """
+        end, col = calc_text_pos(fill_char, 0, len(fill_char), 1)
+        text, cs = apply_target_encoding(fill_char[:end])
+        # key on the encoded text in case the target encoding changes
+        key = (text, cs[0][0], cols, rows)
+        canv = cls._shared.get(key)
+        if canv is None:
+            canv = cls(fill_char, cols, rows)
+            cls._shared.store(key, canv)
+        return canv
+    shared = classmethod(shared)
+
 
 
 
 class CompositeCanvas(Canvas):
     """
     class for storing a combination of canvases
+
+    .. attribute:: compact_cview_cost
+
+       Estimated cost of starting to iterate over one canvas view,
+       in units of joining one row segment, used by :meth:`compact`
+
+    .. attribute:: compact_cells_per_step
+
+       Estimated number of cells copied in the time taken to join
+       one row segment, used by :meth:`compact`
     """
+    compact_cview_cost = 8
+    compact_cells_per_step = 16
+
     def __init__(self, canv=None):
         """
         canv -- a Canvas object to wrap this CompositeCanvas around.
@@ -566,6 +1236,44 @@ class CompositeCanvas(Canvas):
             for shortcut in canv.shortcuts:
                 self.shortcuts[shortcut] = "wrap"
 
+    _child_index = None
+
+    def child_at(self, col, row):
+        """
+        Return (x, y, canvas, position) for the child canvas rendered
+        by a widget that covers (col, row), or None.  Children that
+        were not rendered by a widget, like the ones :func:`CanvasJoin`
+        adds for padding, are looked through.
+
+        The children are indexed the first time this is called, so
+        each later call only takes O(log n) for n children.
+        """
+        index = self._child_index
+        if (index is None or index[0] is not self.children or
+                index[1] is not self.shards):
+            index = (self.children, self.shards, children_index(
+                self.children, self.cols(), self.rows()))
+            self._child_index = index
+        child = children_index_lookup(index[2], col, row)
+        if child is None:
+            return None
+        x, y, canv, pos = child
+        if canv.widget_info is None:
+            inner = canv.child_at(col - x, row - y)
+            if inner is None:
+                return None
+            ix, iy, canv, ipos = inner
+            x += ix
+            y += iy
+            if pos is None:
+                # e.g. CompositeCanvas(canv) wrapping a container's canvas
+                pos = ipos
+        return x, y, canv, pos
+
+    def _translate_children(self, dx, dy):
+        self.children = [(x + dx, y + dy, c, pos)
+            for x, y, c, pos in self.children]
+
     def rows(self):
         for r,cv in self.shards:
             try:
@@ -601,6 +1309,35 @@ class CompositeCanvas(Canvas):
             # prepare next shard tail
             shard_tail = shard_body_tail(num_rows, sbody)
 
+    def row_fingerprints(self):
+        """
+        Return a list with a fingerprint for each row of
+        :meth:`content`, combined from the fingerprints of the canvas
+        views in each row.  Rows that include a canvas that doesn't
+        provide fingerprints have None instead.
+        """
+        result = []
+        shard_tail = []
+        for num_rows, cviews in self.shards:
+            sbody = shard_body(cviews, shard_tail, False)
+            parts = []
+            for done_rows, content_iter, cview in sbody:
+                (trim_left, trim_top, cols, rows, attr_map, canv) = \
+                    cview[:6]
+                fps = None
+                if canv.cacheable:
+                    fps = canv.row_fingerprints(trim_left,
+                        trim_top + done_rows, cols, num_rows, attr_map)
+                if fps is None:
+                    parts = None
+                    break
+                parts.append(fps)
+            if parts is None:
+                result.extend([None] * num_rows)
+            else:
+                result.extend(zip(*parts))
+            shard_tail = shard_body_tail(num_rows, sbody)
+        return result
 
 
     def content_delta(self, other):
@@ -631,6 +1368,46 @@ class CompositeCanvas(Canvas):
             shard_tail = shard_body_tail(num_rows, sbody)
 
 
+    def damage(self, other):
+        """
+        Return a list of (left, top, cols, rows) rectangles covering
+        the parts of this canvas that may differ from canvas other.
+
+        The views of other canvases this canvas is made of are
+        compared with :func:`shards_delta`, so only the views that
+        aren't in the same position in other are damaged.
+        Rectangles above each other with the same columns are joined.
+        """
+        if other is self and self.cacheable:
+            return []
+        cols, rows = self.cols(), self.rows()
+        if (not hasattr(other, 'shards') or other.cols() != cols or
+                other.rows() != rows):
+            return [(0, 0, cols, rows)]
+
+        rects = []
+        ends = {} # (left, cols, bottom row): index in rects
+        row = 0
+        shard_tail = []
+        for num_rows, cviews in shards_delta(self.shards, other.shards):
+            sbody = shard_body(cviews, shard_tail, False)
+            col = 0
+            for done_rows, content_iter, cview in sbody:
+                if not done_rows and cview[5] is not None:
+                    key = (col, cview[2], row)
+                    i = ends.pop(key, None)
+                    if i is None:
+                        i = len(rects)
+                        rects.append((col, row, cview[2], cview[3]))
+                    else:
+                        left, top, w, h = rects[i]
+                        rects[i] = (left, top, w, h + cview[3])
+                    ends[(col, cview[2], row + cview[3])] = i
+                col += cview[2]
+            row += num_rows
+            shard_tail = shard_body_tail(num_rows, sbody)
+        return rects
+
     def trim(self, top, count=None):
         """Trim lines from the top and/or bottom of canvas.
 
@@ -652,6 +1429,8 @@ class CompositeCanvas(Canvas):
             self.shards = shards_trim_rows(self.shards, count)
 
         self.coords = self.translate_coords(0, -top)
+        if top:
+            self._translate_children(0, -top)
 
 
     def trim_end(self, end):
@@ -699,6 +1478,8 @@ class CompositeCanvas(Canvas):
             shards = [(top_rows, new_top_cviews)] + shards[1:]
 
         self.coords = self.translate_coords(left, 0)
+        if left:
+            self._translate_children(left, 0)
         self.shards = shards
 
 
@@ -721,6 +1502,7 @@ class CompositeCanvas(Canvas):
                 [(0,0,cols,top,None,blank_canvas)])] + \
                 self.shards
             self.coords = self.translate_coords(0, top)
+            self._translate_children(0, top)
 
         if bottom > 0:
             if orig_shards is self.shards:
@@ -807,6 +1589,63 @@ class CompositeCanvas(Canvas):
             shards.append((num_rows, new_cviews))
         self.shards = shards
 
+    def compact(self, max_cells=None):
+        """
+        Make iterating over the content of this canvas cheaper.
+
+        Adjacent shards that each show consecutive rows of the same
+        canvas are merged first.  Then if iterating over the
+        remaining shards is estimated to cost more than copying the
+        content once (see :attr:`compact_cview_cost` and
+        :attr:`compact_cells_per_step`) the content is copied into
+        a single :class:`PackedTextCanvas` that replaces all the
+        shards.  Canvases with more than max_cells columns * rows
+        are never copied.
+
+        Children, coords and shortcuts are not changed.  Returns True
+        if the content was copied.
+        """
+        cols = self.cols()
+        self.shards = shards_merge(self.shards, cols)
+
+        rows = self.rows()
+        if max_cells is not None and cols * rows > max_cells:
+            return False
+        # pieces: cviews that need a content iterator each
+        # steps: row segments joined by shard_body_row()
+        pieces = steps = 0
+        pending = []
+        for num_rows, cviews in self.shards:
+            pieces += len(cviews)
+            pending.extend([cv[3] for cv in cviews])
+            steps += num_rows * len(pending)
+            pending = [r - num_rows for r in pending if r > num_rows]
+        if pieces <= 1:
+            return False
+        iter_cost = pieces * self.compact_cview_cost + steps
+        copy_cost = rows + cols * rows // self.compact_cells_per_step
+        if iter_cost <= copy_cost:
+            return False
+
+        text = []
+        attr = []
+        cs = []
+        for row in self.content():
+            t = []
+            a_row = []
+            cs_row = []
+            for a, c, run in row:
+                t.append(run)
+                rle_append_modify(a_row, (a, len(run)))
+                rle_append_modify(cs_row, (c, len(run)))
+            text.append(bytes().join(t))
+            attr.append(a_row)
+            cs.append(cs_row)
+        flat = PackedTextCanvas(text, attr, cs, maxcol=cols,
+            check_width=False)
+        self.shards = [(rows, [(0, 0, cols, rows, None, flat)])]
+        return True
+
     def set_depends(self, widget_list):
         """
         Explicitly specify the list of widgets that this canvas
@@ -819,6 +1658,74 @@ class CompositeCanvas(Canvas):
         self.depends_on = widget_list
 
 
+def children_index(children, cols, rows):
+    """
+    Return an index of the (x, y, canvas, position) children of a
+    composite canvas with size (cols, rows) for
+    :func:`children_index_lookup`.
+
+    Children stacked vertically (CanvasCombine) or horizontally
+    (CanvasJoin) are sorted so they can be found by bisection, other
+    arrangements (CanvasOverlay) are searched in order.
+    """
+    entries = []
+    for x, y, canv, pos in children:
+        left, top = max(x, 0), max(y, 0)
+        right = min(x + canv.cols(), cols)
+        bottom = min(y + canv.rows(), rows)
+        if left < right and top < bottom:
+            entries.append((left, top, right, bottom, x, y, canv, pos))
+
+    for axis in (1, 0):
+        entries_sorted = sorted(entries, key=lambda e: e[axis])
+        for a, b in zip(entries_sorted, entries_sorted[1:]):
+            if a[axis + 2] > b[axis]:
+                break # overlapping
+        else:
+            return (axis, [e[axis] for e in entries_sorted],
+                entries_sorted)
+    return (None, None, entries)
+
+def children_index_lookup(index, col, row):
+    """
+    Return the (x, y, canvas, position) child covering (col, row)
+    from an index created by :func:`children_index`, or None.
+    """
+    axis, starts, entries = index
+    if axis is not None:
+        i = bisect_right(starts, (col, row)[axis]) - 1
+        if i < 0:
+            return None
+        entries = entries[i:i + 1]
+    for left, top, right, bottom, x, y, canv, pos in entries:
+        if left <= col < right and top <= row < bottom:
+            return x, y, canv, pos
+    return None
+
+
+def shards_merge(shards, cols):
+    """
+    Return shards with runs of adjacent shards that each contain a
+    single cview cols wide showing consecutive rows of the same
+    canvas merged into one shard.
+    """
+    new_shards = []
+    for num_rows, cviews in shards:
+        if new_shards and len(cviews) == 1:
+            cv = cviews[0]
+            prev_rows, prev_cviews = new_shards[-1]
+            pcv = prev_cviews[0]
+            if (len(prev_cviews) == 1 and cv[5] is pcv[5] and
+                    cv[2] == pcv[2] == cols and cv[0] == pcv[0] and
+                    cv[4] == pcv[4] and pcv[3] == prev_rows and
+                    cv[3] == num_rows and cv[1] == pcv[1] + pcv[3]):
+                new_shards[-1] = (prev_rows + num_rows,
+                    [pcv[:3] + (pcv[3] + num_rows,) + pcv[4:]])
+                continue
+        new_shards.append((num_rows, cviews))
+    return new_shards
+
+
 def shard_body_row(sbody):
     """
     Return one row, advancing the iterators in sbody.
@@ -897,8 +1804,10 @@ def shard_cviews_delta(cviews, other_cviews):
             yield cv
             cols += cv[2]
             continue
-        # top-left-aligned cviews, compare them
-        if cv[5] is other_cv[5] and cv[:5] == other_cv[:5]:
+        # top-left-aligned cviews, compare them.  canvases that aren't
+        # cacheable may have changed since they were last used
+        if (cv[5] is other_cv[5] and getattr(cv[5], 'cacheable', True)
+                and cv[:5] == other_cv[:5]):
             yield cv[:5]+(None,)+cv[6:]
         else:
             yield cv
@@ -1210,107 +2119,136 @@ def CanvasJoin(l):
     return joined_canvas
 
 
-def apply_text_layout(text, attr, ls, maxcol):
+def _attr_ends(attr):
+    """
+    Return the text offset where each run of attr ends, for finding
+    the run at an offset with bisect_right().
+    """
+    ends = []
+    o = 0
+    for at, run in attr:
+        o += run
+        ends.append(o)
+    return ends
+
+def _attr_runs(attr, ends, start_offs, end_offs):
+    """
+    Return the (attribute, run) list for the text from start_offs to
+    end_offs, using None past the end of attr.  Zero length runs
+    inside the range are kept.
+    """
+    o = []
+    pos = start_offs
+    for i in range(bisect_right(ends, start_offs), len(attr)):
+        at, run = attr[i]
+        off = ends[i] - run
+        if off >= end_offs:
+            break
+        pos = min(ends[i], end_offs)
+        o.append((at, pos - max(off, start_offs)))
+    if pos < end_offs:
+        o.append((None, end_offs - pos))
+    return o
+
+def _attr_at(attr, ends, offs):
+    """
+    Return the attribute of the text at offset offs.
+    """
+    i = bisect_right(ends, offs)
+    if i < len(attr):
+        return attr[i][0]
+    return None
+
+def apply_text_layout(text, attr, ls, maxcol, canvas_class=None):
+    """
+    Return a canvas of class canvas_class (default :class:`TextCanvas`)
+    containing text with attributes attr arranged by the text layout
+    structure ls.
+    """
+    if canvas_class is None:
+        canvas_class = TextCanvas
+    ends = _attr_ends(attr)
+    # when the whole text is already in the target encoding segments
+    # are sliced from it instead of being encoded one at a time
+    plain = plain_target_text(text)
+    empty = bytes()
     t = []
     a = []
     c = []
 
-    class AttrWalk:
-        pass
-    aw = AttrWalk
-    aw.k = 0 # counter for moving through elements of a
-    aw.off = 0 # current offset into text of attr[ak]
-
-    def arange( start_offs, end_offs ):
-        """Return an attribute list for the range of text specified."""
-        if start_offs < aw.off:
-            aw.k = 0
-            aw.off = 0
-        o = []
-        while aw.off < end_offs:
-            if len(attr)<=aw.k:
-                # run out of attributes
-                o.append((None,end_offs-max(start_offs,aw.off)))
-                break
-            at,run = attr[aw.k]
-            if aw.off+run <= start_offs:
-                # move forward through attr to find start_offs
-                aw.k += 1
-                aw.off += run
-                continue
-            if end_offs <= aw.off+run:
-                o.append((at, end_offs-max(start_offs,aw.off)))
-                break
-            o.append((at, aw.off+run-max(start_offs, aw.off)))
-            aw.k += 1
-            aw.off += run
-        return o
-
-
     for line_layout in ls:
         # trim the line to fit within maxcol
-        line_layout = trim_line( line_layout, text, 0, maxcol )
+        line_layout = trim_line(line_layout, text, 0, maxcol)
 
         line = []
         linea = []
         linec = []
 
-        def attrrange( start_offs, end_offs, destw ):
-            """
-            Add attributes based on attributes between
-            start_offs and end_offs.
-            """
-            if start_offs == end_offs:
-                [(at,run)] = arange(start_offs,end_offs)
-                rle_append_modify( linea, ( at, destw ))
-                return
-            if destw == end_offs-start_offs:
-                for at, run in arange(start_offs,end_offs):
-                    rle_append_modify( linea, ( at, run ))
-                return
-            # encoded version has different width
-            o = start_offs
-            for at, run in arange(start_offs, end_offs):
-                if o+run == end_offs:
-                    rle_append_modify( linea, ( at, destw ))
-                    return
-                tseg = text[o:o+run]
-                tseg, cs = apply_target_encoding( tseg )
-                segw = rle_len(cs)
-
-                rle_append_modify( linea, ( at, segw ))
-                o += run
-                destw -= segw
-
-
         for seg in line_layout:
-            #if seg is None: assert 0, ls
-            s = LayoutSegment(seg)
-            if s.end:
-                tseg, cs = apply_target_encoding(
-                    text[s.offs:s.end])
-                line.append(tseg)
-                attrrange(s.offs, s.end, rle_len(cs))
-                rle_join_modify( linec, cs )
-            elif s.text:
-                tseg, cs = apply_target_encoding( s.text )
+            sc, offs = seg[0], seg[1]
+            if len(seg) == 3:
+                end = seg[2]
+                if type(end) == bytes:
+                    tseg, cs = apply_target_encoding(end)
+                    line.append(tseg)
+                    rle_append_modify(linea,
+                        (_attr_at(attr, ends, offs), len(tseg)))
+                    rle_join_modify(linec, cs)
+                    continue
+                if plain is not None:
+                    tseg = plain[offs:end]
+                    destw = end - offs
+                    if destw:
+                        rle_append_modify(linec, (None, destw))
+                else:
+                    tseg, cs = apply_target_encoding(text[offs:end])
+                    destw = rle_len(cs)
+                    rle_join_modify(linec, cs)
                 line.append(tseg)
-                attrrange( s.offs, s.offs, len(tseg) )
-                rle_join_modify( linec, cs )
-            elif s.offs:
-                if s.sc:
-                    line.append(bytes().rjust(s.sc))
-                    attrrange( s.offs, s.offs, s.sc )
+                if destw == end - offs:
+                    for at_run in _attr_runs(attr, ends, offs, end):
+                        rle_append_modify(linea, at_run)
+                    continue
+                # encoded version has different width
+                o = offs
+                for at, run in _attr_runs(attr, ends, offs, end):
+                    if o + run == end:
+                        rle_append_modify(linea, (at, destw))
+                        break
+                    segw = rle_len(apply_target_encoding(
+                        text[o:o + run])[1])
+                    rle_append_modify(linea, (at, segw))
+                    o += run
+                    destw -= segw
+            elif offs:
+                if sc:
+                    line.append(empty.rjust(sc))
+                    rle_append_modify(linea, (_attr_at(attr, ends, offs), sc))
             else:
-                line.append(bytes().rjust(s.sc))
-                linea.append((None, s.sc))
-                linec.append((None, s.sc))
-
-        t.append(bytes().join(line))
+                line.append(empty.rjust(sc))
+                linea.append((None, sc))
+                linec.append((None, sc))
+
+        # pad the row to maxcol here so the canvas doesn't have to
+        # check it again
+        row = empty.join(line)
+        w = calc_width(row, 0, len(row))
+        if w > maxcol:
+            raise CanvasError("Canvas text is wider than the maxcol "
+                "specified \n%r\n%r" % (maxcol, row))
+        if w < maxcol:
+            row += empty.rjust(maxcol - w)
+        gap = len(row) - rle_len(linea)
+        if gap:
+            rle_append_modify(linea, (None, gap))
+        gap = len(row) - rle_len(linec)
+        if gap:
+            rle_append_modify(linec, (None, gap))
+        t.append(row)
         a.append(linea)
         c.append(linec)
 
-    return TextCanvas(t, a, c, maxcol=maxcol)
+    return canvas_class(t, a, c, maxcol=maxcol, check_width=False)
 
 
 
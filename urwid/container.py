@@ -29,8 +29,8 @@ from urwid.decoration import (Padding, Filler, calculate_left_right_padding,
     normalize_valign, normalize_height, simplify_align, simplify_width,
     simplify_valign, simplify_height)
 from urwid.monitored_list import MonitoredList, MonitoredFocusList
-from urwid.canvas import (CompositeCanvas, CanvasOverlay, CanvasCombine,
-    SolidCanvas, CanvasJoin)
+from urwid.canvas import (CanvasCache, CompositeCanvas, CanvasOverlay,
+    CanvasCombine, SolidCanvas, CanvasJoin)
 
 
 class WidgetContainerMixin(object):
@@ -103,6 +103,39 @@ class WidgetContainerMixin(object):
                 return out
             out.append(w)
 
+    def _rendered_child_at(self, size, col, row, focus):
+        """
+        Return (x, y, widget, size, position) for the child widget
+        covering (col, row) according to the canvas from the last
+        render of this widget, or None if that canvas is no longer
+        in the canvas cache or the child can't be found from it.
+
+        Containers use this to route mouse events without calculating
+        their layout again, falling back to their layout when None is
+        returned.  x and y are the position of the child's top left
+        corner, size is the size it was rendered with.  The lookup
+        isn't counted in the canvas cache statistics.
+        """
+        for cls in self.__class__.__mro__:
+            if 'render' in cls.__dict__:
+                break
+        canv, ignore = CanvasCache._lookup(self, cls, size, focus)
+        if canv is None:
+            return None
+        child = canv.child_at(col, row)
+        if child is None:
+            return None
+        x, y, canv, pos = child
+        w, wsize, wfocus = canv.widget_info
+        if pos is None:
+            return None
+        if len(wsize) == 3 and isinstance(wsize[0], tuple):
+            # only some rows were rendered (see Widget.render_rows),
+            # the hidden rows may have changed since then without
+            # invalidating this canvas
+            return None
+        return x, y, w, wsize, pos
+
 class WidgetContainerListContentsMixin(object):
     """
     Mixin class for widget containers whose positions are indexes into
@@ -445,10 +478,29 @@ class OverlayError(Exception):
 class Overlay(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
     """
     Overlay contains two box widgets and renders one on top of the other
+
+    When *top_w* covers all of *bottom_w* then *bottom_w* is not
+    rendered at all, and the canvas rendered doesn't need to be
+    updated when *bottom_w* changes.
+
+    .. attribute:: reuse_hidden_canvases
+       :annotation: = False
+
+       If True the widgets inside *bottom_w* that were completely
+       hidden by *top_w* the last time *bottom_w* was rendered are not
+       rendered again while they stay hidden, even if they have
+       changed, their last canvases are used instead.  This saves
+       rendering expensive widgets under dialogs, but flow widgets
+       that are hidden won't change their number of rows either, which
+       may affect the layout of the visible part of *bottom_w*.
     """
     _selectable = True
     _sizing = frozenset([BOX])
 
+    reuse_hidden_canvases = False
+    _bottom_canvas = None
+    _covered = None
+
     _DEFAULT_BOTTOM_OPTIONS = (
         LEFT, None, RELATIVE, 100, None, 0, 0,
         TOP, None, RELATIVE, 100, None, 0, 0)
@@ -772,9 +824,9 @@ class Overlay(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
         """Render top_w overlayed on bottom_w."""
         left, right, top, bottom = self.calculate_padding_filler(size,
             focus)
-        bottom_c = self.bottom_w.render(size)
-        if not bottom_c.cols() or not bottom_c.rows():
-            return CompositeCanvas(bottom_c)
+        maxcol, maxrow = size
+        if not maxcol or not maxrow:
+            return CompositeCanvas(self.bottom_w.render(size))
 
         top_c = self.top_w.render(
             self.top_w_size(size, left, right, top, bottom), focus)
@@ -784,8 +836,71 @@ class Overlay(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
         if top < 0 or bottom < 0:
             top_c.pad_trim_top_bottom(min(0, top), min(0, bottom))
 
+        covered = (max(0, left), max(0, top), top_c.cols(), top_c.rows())
+        self._covered = size, covered
+        if covered == (0, 0, maxcol, maxrow):
+            # bottom_w is completely hidden
+            return CanvasOverlay(top_c,
+                SolidCanvas.shared(" ", maxcol, maxrow), left, top)
+
+        bottom_c = self._render_bottom(size)
         return CanvasOverlay(top_c, bottom_c, left, top)
 
+    def _render_bottom(self, size, focus=False):
+        """
+        Render bottom_w, reusing the canvases of the widgets it
+        contains that are hidden by top_w if reuse_hidden_canvases
+        is set.
+        """
+        if not self.reuse_hidden_canvases:
+            return self.bottom_w.render(size, focus)
+
+        hidden = self._hidden_canvases(size)
+        if hidden:
+            cache = CanvasCache.get_current()
+            previous = cache.set_occluded(hidden)
+            if previous:
+                # keep the canvases hidden by enclosing overlays too
+                merged = dict(previous)
+                merged.update(hidden)
+                cache.set_occluded(merged)
+            try:
+                canv = self.bottom_w.render(size, focus)
+            finally:
+                cache.set_occluded(previous)
+        else:
+            canv = self.bottom_w.render(size, focus)
+        self._bottom_canvas = canv
+        return canv
+
+    def _hidden_canvases(self, size):
+        """
+        Return {widget: canvas} for the widgets completely hidden by
+        top_w in the last canvas rendered for bottom_w at this size.
+        Canvases showing a pop-up are never included because the
+        pop-up might have been closed.
+        """
+        last = self._bottom_canvas
+        if (last is None or self._covered is None or
+                self._covered[0] != size or
+                last.widget_info[:2] != (self.bottom_w, size)):
+            return {}
+        left, top, cols, rows = self._covered[1]
+        hidden = {}
+        stack = [(0, 0, last)]
+        while stack:
+            x, y, canv = stack.pop()
+            if (canv.widget_info and canv.cacheable and
+                    'pop up' not in canv.coords and
+                    x >= left and y >= top and
+                    x + canv.cols() <= left + cols and
+                    y + canv.rows() <= top + rows):
+                hidden[canv.widget_info[0]] = canv
+                continue
+            for cx, cy, c, pos in getattr(canv, 'children', ()):
+                stack.append((x + cx, y + cy, c))
+        return hidden
+
 
     def mouse_event(self, size, event, button, col, row, focus):
         """Pass event to top_w, ignore if outside of top_w."""
@@ -1527,7 +1642,8 @@ class Pile(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
             if canv:
                 combinelist.append((canv, i, item_focus))
         if not combinelist:
-            return SolidCanvas(" ", size[0], (size[1:]+(0,))[0])
+            return CompositeCanvas(SolidCanvas.shared(" ", size[0],
+                (size[1:]+(0,))[0]))
 
         out = CanvasCombine(combinelist)
         if len(size) == 2 and size[1] != out.rows():
@@ -1536,6 +1652,43 @@ class Pile(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
             out.pad_trim_top_bottom(0, size[1] - out.rows())
         return out
 
+    def render_rows(self, size, first_row, num_rows, focus=False):
+        """
+        Render only the parts of the widgets in this Pile that are in
+        rows *first_row* to *first_row* + *num_rows* - 1.
+
+        See :meth:`Widget.render_rows` for parameter details.
+        """
+        try:
+            item_rows = self.get_item_rows(size, focus)
+        except PileError:
+            item_rows = None
+        if not self.contents or item_rows is None or (
+                len(size) == 2 and sum(item_rows) != size[1]):
+            # render everything, the rows need adjusting
+            return Widget.render_rows(self, size, first_row, num_rows,
+                focus)
+
+        end_row = first_row + num_rows
+        combinelist = []
+        top = 0
+        for i, (w, (f, height)) in enumerate(self.contents):
+            rows = item_rows[i]
+            if top >= end_row:
+                break
+            if rows > 0 and top + rows > first_row:
+                item_focus = self.focus_item == w
+                start = max(0, first_row - top)
+                canv = w.render_rows(
+                    self.get_item_size(size, i, focus, item_rows),
+                    start, min(top + rows, end_row) - top - start,
+                    focus=focus and item_focus)
+                combinelist.append((canv, i, item_focus))
+            top += rows
+        if not combinelist:
+            return CompositeCanvas(SolidCanvas.shared(" ", size[0], 0))
+        return CanvasCombine(combinelist)
+
     def get_cursor_coords(self, size):
         """Return the cursor coordinates of the focus widget."""
         if not self.selectable():
@@ -1664,15 +1817,20 @@ class Pile(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
         Pass the event to the contained widget.
         May change focus on button 1 press.
         """
-        wrow = 0
-        item_rows = self.get_item_rows(size, focus)
-        for i, (r, w) in enumerate(zip(item_rows,
-                (w for (w, options) in self.contents))):
-            if wrow + r > row:
-                break
-            wrow += r
-        else:
-            return False
+        child = self._rendered_child_at(size, col, row, focus)
+        if child is not None:
+            x, wrow, w, tsize, i = child
+        if child is None or self.contents[i][0] is not w:
+            wrow = 0
+            item_rows = self.get_item_rows(size, focus)
+            for i, (r, w) in enumerate(zip(item_rows,
+                    (w for (w, options) in self.contents))):
+                if wrow + r > row:
+                    break
+                wrow += r
+            else:
+                return False
+            tsize = self.get_item_size(size, i, focus, item_rows)
 
         focus = focus and self.focus_item == w
         if is_mouse_press(event) and button == 1:
@@ -1682,7 +1840,6 @@ class Pile(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
         if not hasattr(w, 'mouse_event'):
             return False
 
-        tsize = self.get_item_size(size, i, focus, item_rows)
         return w.mouse_event(tsize, event, button, col, row-wrow,
             focus)
 
@@ -2089,7 +2246,8 @@ class Columns(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
             l.append((canv, i, self.focus_position == i, mc))
 
         if not l:
-            return SolidCanvas(" ", size[0], (size[1:]+(1,))[0])
+            return CompositeCanvas(SolidCanvas.shared(" ", size[0],
+                (size[1:]+(1,))[0]))
 
         canv = CanvasJoin(l)
         if canv.cols() < size[0]:
@@ -2173,6 +2331,20 @@ class Columns(Widget, WidgetContainerMixin, WidgetContainerListContentsMixin):
         Send event to appropriate column.
         May change focus on button 1 press.
         """
+        child = self._rendered_child_at(size, col, row, focus)
+        if child is not None:
+            x, y, w, tsize, i = child
+            if y == 0 and self.contents[i][0] is w:
+                focus = focus and self.focus_col == i
+                if is_mouse_press(event) and button == 1:
+                    if w.selectable():
+                        self.focus_position = i
+
+                if not hasattr(w, 'mouse_event'):
+                    return False
+                return w.mouse_event(tsize, event, button, col - x, row,
+                    focus)
+
         widths = self.column_widths(size)
 
         x = 0
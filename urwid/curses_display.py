@@ -27,9 +27,10 @@ import curses
 import _curses
 
 from urwid import escape
+from urwid import signals
 
 from urwid.display_common import BaseScreen, RealTerminal, AttrSpec, \
-    UNPRINTABLE_TRANS_TABLE
+    UPDATE_PALETTE_ENTRY, UNPRINTABLE_TRANS_TABLE
 from urwid.compat import bytes, PYTHON3
 
 KEY_RESIZE = 410 # curses.KEY_RESIZE (sometimes not defined)
@@ -71,9 +72,18 @@ class Screen(BaseScreen, RealTerminal):
         self.set_input_timeouts()
         self.last_bstate = 0
         self._mouse_tracking_enabled = False
+        # canvas currently shown in the curses window, used for
+        # drawing only the rows that have changed
+        self._drawn_canvas = None
+        signals.connect_signal(self, UPDATE_PALETTE_ENTRY,
+            self._on_update_palette_entry)
 
         self.register_palette_entry(None, 'default','default')
 
+    def _on_update_palette_entry(self, name, *attrspecs):
+        # rows using the entry must be drawn again
+        self._drawn_canvas = None
+
     def set_mouse_tracking(self, enable=True):
         """
         Enable mouse tracking.
@@ -124,6 +134,7 @@ class Screen(BaseScreen, RealTerminal):
         curses.meta(1)
         curses.halfdelay(10) # use set_input_timeouts to adjust
         self.s.keypad(0)
+        self._drawn_canvas = None
 
         if not self._signal_keys_set:
             self._old_signal_keys = self.tty_signal_keys()
@@ -487,9 +498,17 @@ class Screen(BaseScreen, RealTerminal):
 
         assert r.rows() == rows, "canvas size and passed size don't match"
 
+        damaged = None
+        if self._drawn_canvas is not None:
+            # rows outside the damaged areas are already in the window
+            damaged = r.damaged_rows(self._drawn_canvas)
+        self._drawn_canvas = None
+
         y = -1
         for row in r.content():
             y += 1
+            if damaged is not None and not damaged[y]:
+                continue
             try:
                 self.s.move( y, 0 )
             except _curses.error:
@@ -543,6 +562,7 @@ class Screen(BaseScreen, RealTerminal):
 
         self.s.refresh()
         self.keep_cache_alive_link = r
+        self._drawn_canvas = r
 
 
     def clear(self):
@@ -550,6 +570,7 @@ class Screen(BaseScreen, RealTerminal):
         Force the screen to be completely repainted on the next
         call to draw_screen().
         """
+        self._drawn_canvas = None
         self.s.clear()
 
 
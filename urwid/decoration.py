@@ -227,6 +227,19 @@ class AttrMap(delegate_to_widget_mixin('_original_widget'), WidgetDecoration):
         canv.fill_attr_apply(attr_map)
         return canv
 
+    def render_rows(self, size, first_row, num_rows, focus=False):
+        """
+        Render part of the wrapped widget and apply attribute.
+        """
+        attr_map = self._attr_map
+        if focus and self._focus_map is not None:
+            attr_map = self._focus_map
+        canv = self._original_widget.render_rows(size, first_row, num_rows,
+            focus=focus)
+        canv = CompositeCanvas(canv)
+        canv.fill_attr_apply(attr_map)
+        return canv
+
 
 
 class AttrWrap(AttrMap):
@@ -404,6 +417,13 @@ class BoxAdapter(WidgetDecoration):
         canv = CompositeCanvas(canv)
         return canv
 
+    def render_rows(self, size, first_row, num_rows, focus=False):
+        (maxcol,) = size
+        canv = self._original_widget.render_rows((maxcol, self.height),
+            first_row, num_rows, focus)
+        canv = CompositeCanvas(canv)
+        return canv
+
     def __getattr__(self, name):
         """
         Pass calls to box widget.
@@ -564,8 +584,27 @@ class Padding(WidgetDecoration):
             canv = self._original_widget.render((), focus)
         else:
             canv = self._original_widget.render((maxcol,)+size[1:], focus)
+        return self._pad_canvas(size, left, right, canv)
+
+    def render_rows(self, size, first_row, num_rows, focus=False):
+        """
+        Render part of self.original_widget with padding.
+        """
+        if self._width_type == CLIP:
+            return Widget.render_rows(self, size, first_row, num_rows,
+                focus)
+        left, right = self.padding_values(size, focus)
+        maxcol = size[0] - left - right
+        canv = self._original_widget.render_rows((maxcol,)+size[1:],
+            first_row, num_rows, focus)
+        return self._pad_canvas(size, left, right, canv)
+
+    def _pad_canvas(self, size, left, right, canv):
+        """
+        Return canv with left and right padding added.
+        """
         if canv.cols() == 0:
-            canv = SolidCanvas(' ', size[0], canv.rows())
+            canv = SolidCanvas.shared(' ', size[0], canv.rows())
             canv = CompositeCanvas(canv)
             canv.set_depends([self._original_widget])
             return canv
@@ -813,6 +852,12 @@ class Filler(WidgetDecoration):
         top, bottom = self.filler_values(size, focus)
 
         if self.height_type == PACK:
+            if (maxrow and
+                    self._original_widget.rows((maxcol,), focus) > maxrow and
+                    not self._cursor_below(maxcol, maxrow, focus)):
+                # too tall, render only the rows that will be shown
+                return CompositeCanvas(self._original_widget.render_rows(
+                    (maxcol,), 0, maxrow, focus))
             canv = self._original_widget.render((maxcol,), focus)
         else:
             canv = self._original_widget.render((maxcol,maxrow-top-bottom),focus)
@@ -828,6 +873,17 @@ class Filler(WidgetDecoration):
         canv.pad_trim_top_bottom(top, bottom)
         return canv
 
+    def _cursor_below(self, maxcol, maxrow, focus):
+        """
+        Return True if the cursor of original_widget is displayed
+        below its first maxrow rows.
+        """
+        w = self._original_widget
+        if not focus or not hasattr(w, 'get_cursor_coords'):
+            return False
+        coords = w.get_cursor_coords((maxcol,))
+        return coords is not None and coords[1] >= maxrow
+
 
     def keypress(self, size, key):
         """Pass keypress to self.original_widget."""
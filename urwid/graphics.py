@@ -778,7 +778,7 @@ class GraphVScale(Widget):
             rows += c.rows()
             combinelist.append((c, None, False))
         if not combinelist:
-            return SolidCanvas(" ", size[0], size[1])
+            return CompositeCanvas(SolidCanvas.shared(" ", size[0], size[1]))
 
         c = CanvasCombine(combinelist)
         if maxrow - rows:
@@ -851,6 +851,8 @@ class ProgressBar(Widget):
         (maxcol,) = size
         txt = Text(self.get_text(), self.text_align, CLIP)
         c = txt.render((maxcol,))
+        t = c._text[0]
+        cs_row = c._cs[0]
 
         cf = float(self.current) * maxcol / self.done
         ccol = int(cf)
@@ -858,25 +860,25 @@ class ProgressBar(Widget):
         if self.satt is not None:
             cs = int((cf - ccol) * 8)
         if ccol < 0 or (ccol == 0 and cs == 0):
-            c._attr = [[(self.normal, maxcol)]]
+            a = [(self.normal, maxcol)]
         elif ccol >= maxcol:
-            c._attr = [[(self.complete, maxcol)]]
-        elif cs and c._text[0][ccol] == " ":
-            t = c._text[0]
+            a = [(self.complete, maxcol)]
+        elif cs and t[ccol] == " ":
             cenc = self.eighths[cs].encode("utf-8")
-            c._text[0] = t[:ccol] + cenc + t[ccol + 1:]
+            t = t[:ccol] + cenc + t[ccol + 1:]
             a = []
             if ccol > 0:
                 a.append((self.complete, ccol))
             a.append((self.satt, len(cenc)))
             if maxcol - ccol - 1 > 0:
                 a.append((self.normal, maxcol - ccol - 1))
-            c._attr = [a]
-            c._cs = [[(None, len(c._text[0]))]]
+            cs_row = [(None, len(t))]
         else:
-            c._attr = [[(self.complete, ccol),
-                        (self.normal, maxcol - ccol)]]
-        return c
+            a = [(self.complete, ccol),
+                 (self.normal, maxcol - ccol)]
+        # build a new canvas, the one rendered by txt may not be modified
+        return TextCanvas([t], [a], [cs_row], maxcol=maxcol,
+            check_width=False)
 
 
 class PythonLogo(Widget):
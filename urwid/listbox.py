@@ -20,7 +20,7 @@
 # Urwid web site: http://excess.org/urwid/
 
 from urwid.util import is_mouse_press
-from urwid.canvas import SolidCanvas, CanvasCombine
+from urwid.canvas import SolidCanvas, CompositeCanvas, CanvasCombine
 from urwid.widget import Widget, nocache_widget_render_instance, BOX, GIVEN
 from urwid.decoration import calculate_top_bottom_filler, normalize_valign
 from urwid import signals
@@ -456,49 +456,53 @@ class ListBox(Widget, WidgetContainerMixin):
         middle, top, bottom = self.calculate_visible(
             (maxcol, maxrow), focus=focus)
         if middle is None:
-            return SolidCanvas(" ", maxcol, maxrow)
+            return CompositeCanvas(SolidCanvas.shared(" ", maxcol, maxrow))
 
         _ignore, focus_widget, focus_pos, focus_rows, cursor = middle
         trim_top, fill_above = top
         trim_bottom, fill_below = bottom
 
+        fill_above.reverse() # fill_above is in bottom-up order
+        items = [(widget, w_pos, w_rows, False)
+            for widget, w_pos, w_rows in fill_above]
+        items.append((focus_widget, focus_pos, focus_rows, True))
+        items.extend([(widget, w_pos, w_rows, False)
+            for widget, w_pos, w_rows in fill_below])
+
         combinelist = []
         rows = 0
-        fill_above.reverse() # fill_above is in bottom-up order
-        for widget,w_pos,w_rows in fill_above:
-            canvas = widget.render((maxcol,))
-            if w_rows != canvas.rows():
-                raise ListBoxError, "Widget %r at position %r within listbox calculated %d rows but rendered %d!"% (widget,w_pos,w_rows, canvas.rows())
-            rows += w_rows
-            combinelist.append((canvas, w_pos, False))
-
-        focus_canvas = focus_widget.render((maxcol,), focus=focus)
-
-        if focus_canvas.rows() != focus_rows:
-            raise ListBoxError, "Focus Widget %r at position %r within listbox calculated %d rows but rendered %d!"% (focus_widget,focus_pos,focus_rows, focus_canvas.rows())
-        c_cursor = focus_canvas.cursor
-        if cursor != c_cursor:
-            raise ListBoxError, "Focus Widget %r at position %r within listbox calculated cursor coords %r but rendered cursor coords %r!" %(focus_widget,focus_pos,cursor,c_cursor)
-
-        rows += focus_rows
-        combinelist.append((focus_canvas, focus_pos, True))
-
-        for widget,w_pos,w_rows in fill_below:
-            canvas = widget.render((maxcol,))
-            if w_rows != canvas.rows():
-                raise ListBoxError, "Widget %r at position %r within listbox calculated %d rows but rendered %d!"% (widget,w_pos,w_rows, canvas.rows())
-            rows += w_rows
-            combinelist.append((canvas, w_pos, False))
+        for i, (widget, w_pos, w_rows, w_focus) in enumerate(items):
+            first_row = 0
+            num_rows = w_rows
+            if i == 0:
+                first_row = trim_top
+                num_rows -= trim_top
+            if i == len(items) - 1:
+                num_rows -= trim_bottom
+            if num_rows < w_rows:
+                # only render the rows that will be visible
+                canvas = widget.render_rows((maxcol,), first_row, num_rows,
+                    focus=focus and w_focus)
+            else:
+                canvas = widget.render((maxcol,), focus=focus and w_focus)
+                if w_rows != canvas.rows():
+                    if w_focus:
+                        raise ListBoxError, "Focus Widget %r at position %r within listbox calculated %d rows but rendered %d!"% (widget,w_pos,w_rows, canvas.rows())
+                    raise ListBoxError, "Widget %r at position %r within listbox calculated %d rows but rendered %d!"% (widget,w_pos,w_rows, canvas.rows())
+            if w_focus:
+                c_cursor = canvas.cursor
+                if c_cursor is not None:
+                    c_cursor = c_cursor[0], c_cursor[1] + first_row
+                elif cursor is not None and not (
+                        first_row <= cursor[1] < first_row + num_rows):
+                    c_cursor = cursor # cursor was in the rows not rendered
+                if cursor != c_cursor:
+                    raise ListBoxError, "Focus Widget %r at position %r within listbox calculated cursor coords %r but rendered cursor coords %r!" %(widget,w_pos,cursor,c_cursor)
+            rows += num_rows
+            combinelist.append((canvas, w_pos, w_focus))
 
         final_canvas = CanvasCombine(combinelist)
 
-        if trim_top:
-            final_canvas.trim(trim_top)
-            rows -= trim_top
-        if trim_bottom:
-            final_canvas.trim_end(trim_bottom)
-            rows -= trim_bottom
-
         if rows > maxrow:
             raise ListBoxError, "Listbox contents too long!  Probably urwid's fault (please report): %r" % ((top,middle,bottom),)
 
@@ -1534,27 +1538,32 @@ class ListBox(Widget, WidgetContainerMixin):
         May change focus on button 1 press.
         """
         (maxcol, maxrow) = size
-        middle, top, bottom = self.calculate_visible((maxcol, maxrow),
-            focus=True)
-        if middle is None:
-            return False
-
-        _ignore, focus_widget, focus_pos, focus_rows, cursor = middle
-        trim_top, fill_above = top
-        _ignore, fill_below = bottom
-
-        fill_above.reverse() # fill_above is in bottom-up order
-        w_list = ( fill_above +
-            [ (focus_widget, focus_pos, focus_rows) ] +
-            fill_below )
-
-        wrow = -trim_top
-        for w, w_pos, w_rows in w_list:
-            if wrow + w_rows > row:
-                break
-            wrow += w_rows
+        child = self._rendered_child_at(size, col, row, focus)
+        if child is not None:
+            x, wrow, w, tsize, w_pos = child
+            focus_widget, focus_pos = self.body.get_focus()
         else:
-            return False
+            middle, top, bottom = self.calculate_visible((maxcol, maxrow),
+                focus=True)
+            if middle is None:
+                return False
+
+            _ignore, focus_widget, focus_pos, focus_rows, cursor = middle
+            trim_top, fill_above = top
+            _ignore, fill_below = bottom
+
+            fill_above.reverse() # fill_above is in bottom-up order
+            w_list = ( fill_above +
+                [ (focus_widget, focus_pos, focus_rows) ] +
+                fill_below )
+
+            wrow = -trim_top
+            for w, w_pos, w_rows in w_list:
+                if wrow + w_rows > row:
+                    break
+                wrow += w_rows
+            else:
+                return False
 
         focus = focus and w == focus_widget
         if is_mouse_press(event) and button==1:
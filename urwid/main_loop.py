@@ -38,6 +38,7 @@ from urwid.util import StoppingContext, is_mouse_event
 from urwid.compat import PYTHON3
 from urwid.command_map import command_map, REDRAW_SCREEN
 from urwid.wimp import PopUpTarget
+from urwid.canvas import CanvasCache
 from urwid import signals
 from urwid.display_common import INPUT_DESCRIPTORS_CHANGED
 
@@ -89,6 +90,11 @@ class MainLoop(object):
                     instance to allow any widget to open a pop-up anywhere on the screen
     :type pop_ups: boolean
 
+    :param canvas_cache: cache used for canvases rendered by this main loop,
+                         default is a new :class:`CanvasCache` instance;
+                         stored as :attr:`.canvas_cache`
+    :type canvas_cache: :class:`CanvasCache` instance
+
 
     .. attribute:: screen
 
@@ -97,11 +103,16 @@ class MainLoop(object):
     .. attribute:: event_loop
 
         The event loop object this main loop uses for waiting on alarms and IO
+
+    .. attribute:: canvas_cache
+
+        The :class:`CanvasCache` made current while this main loop renders
+        widgets and passes them input.  It is emptied by :meth:`stop`.
     """
 
     def __init__(self, widget, palette=(), screen=None,
             handle_mouse=True, input_filter=None, unhandled_input=None,
-            event_loop=None, pop_ups=False):
+            event_loop=None, pop_ups=False, canvas_cache=None):
         self._widget = widget
         self.handle_mouse = handle_mouse
         self.pop_ups = pop_ups # triggers property setting side-effect
@@ -129,6 +140,12 @@ class MainLoop(object):
 
         self._watch_pipes = {}
 
+        if canvas_cache is None:
+            canvas_cache = CanvasCache()
+        self.canvas_cache = canvas_cache
+        self._last_canvas = None
+        self._last_generation = None
+
     def _set_widget(self, widget):
         self._widget = widget
         if self.pop_ups:
@@ -343,6 +360,8 @@ class MainLoop(object):
         # watch our input descriptors
         self._reset_input_descriptors()
         self.idle_handle = self.event_loop.enter_idle(self.entering_idle)
+        # invalidate widgets in batches from draw_screen()
+        CanvasCache.defer_invalidation()
 
         return StoppingContext(self)
 
@@ -358,6 +377,9 @@ class MainLoop(object):
         self.screen.unhook_event_loop(self.event_loop)
 
         self.screen.stop()
+        CanvasCache.defer_invalidation(False)
+        self.canvas_cache.clear()
+        self._last_canvas = None
 
     def _reset_input_descriptors(self):
         self.screen.unhook_event_loop(self.event_loop)
@@ -489,6 +511,13 @@ class MainLoop(object):
         if not self.screen_size:
             self.screen_size = self.screen.get_cols_rows()
 
+        previous_cache = CanvasCache.set_current(self.canvas_cache)
+        try:
+            return self._process_input(keys)
+        finally:
+            CanvasCache.set_current(previous_cache)
+
+    def _process_input(self, keys):
         something_handled = False
 
         for k in keys:
@@ -571,11 +600,33 @@ class MainLoop(object):
         If you modify the widgets displayed outside of handling input or
         responding to an alarm you will need to call this method yourself
         to repaint the screen.
+
+        When no widget has been invalidated since the last call (see
+        :attr:`CanvasCache.generation`) and the screen size and topmost
+        widget are the same, the canvas cached by the last call is
+        passed to the screen again without rendering.
         """
         if not self.screen_size:
             self.screen_size = self.screen.get_cols_rows()
 
-        canvas = self._topmost_widget.render(self.screen_size, focus=True)
+        CanvasCache.flush_invalidations()
+        generation = CanvasCache.generation
+        canvas = self._last_canvas
+        if (canvas is None or generation != self._last_generation or
+                canvas.widget_info[0] is not self._topmost_widget or
+                canvas.widget_info[1] != self.screen_size):
+            previous_cache = CanvasCache.set_current(self.canvas_cache)
+            try:
+                canvas = self._topmost_widget.render(self.screen_size,
+                    focus=True)
+            finally:
+                CanvasCache.set_current(previous_cache)
+            # only a cached canvas is known to stay valid until the
+            # generation changes
+            self._last_canvas = None
+            if self.canvas_cache.is_cached(canvas):
+                self._last_canvas = canvas
+            self._last_generation = generation
         self.screen.draw_screen(self.screen_size, canvas)
 
 
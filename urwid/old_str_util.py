@@ -24,68 +24,25 @@ from __future__ import print_function
 import re
 
 from urwid.compat import bytes, B, ord2
+# width tables generated by bin/gen_width_tables.py
+from urwid.width_table import (widths, width_pages, width_blocks,
+    PAGE_SHIFT as _PAGE_SHIFT)
 
 SAFE_ASCII_RE = re.compile(u"^[ -~]*$")
 SAFE_ASCII_BYTES_RE = re.compile(B("^[ -~]*$"))
 
 _byte_encoding = None
 
-# GENERATED DATA
-# generated from
-# http://www.unicode.org/Public/4.0-Update/EastAsianWidth-4.0.0.txt
-
-widths = [
-    (126, 1),
-    (159, 0),
-    (687, 1),
-    (710, 0),
-    (711, 1),
-    (727, 0),
-    (733, 1),
-    (879, 0),
-    (1154, 1),
-    (1161, 0),
-    (4347, 1),
-    (4447, 2),
-    (7467, 1),
-    (7521, 0),
-    (8369, 1),
-    (8426, 0),
-    (9000, 1),
-    (9002, 2),
-    (11021, 1),
-    (12350, 2),
-    (12351, 1),
-    (12438, 2),
-    (12442, 0),
-    (19893, 2),
-    (19967, 1),
-    (55203, 2),
-    (63743, 1),
-    (64106, 2),
-    (65039, 1),
-    (65059, 0),
-    (65131, 2),
-    (65279, 1),
-    (65376, 2),
-    (65500, 1),
-    (65510, 2),
-    (120831, 1),
-    (262141, 2),
-    (1114109, 1),
-]
+_PAGE_MASK = (1 << _PAGE_SHIFT) - 1
 
 # ACCESSOR FUNCTIONS
 
 def get_width( o ):
     """Return the screen column width for unicode ordinal o."""
-    global widths
-    if o == 0xe or o == 0xf:
-        return 0
-    for num, wid in widths:
-        if o <= num:
-            return wid
-    return 1
+    if o > 0x10ffff:
+        return 1
+    return width_blocks[width_pages[o >> _PAGE_SHIFT] << _PAGE_SHIFT |
+        o & _PAGE_MASK]
 
 def decode_one( text, pos ):
     """
@@ -323,46 +280,3 @@ def within_double_byte(text, line_start, pos):
     if (pos - i) & 1:
         return 1
     return 2
-
-# TABLE GENERATION CODE
-
-def process_east_asian_width():
-    import sys
-    out = []
-    last = None
-    for line in sys.stdin.readlines():
-        if line[:1] == "#": continue
-        line = line.strip()
-        hex,rest = line.split(";",1)
-        wid,rest = rest.split(" # ",1)
-        word1 = rest.split(" ",1)[0]
-
-        if "." in hex:
-            hex = hex.split("..")[1]
-        num = int(hex, 16)
-
-        if word1 in ("COMBINING","MODIFIER","<control>"):
-            l = 0
-        elif wid in ("W", "F"):
-            l = 2
-        else:
-            l = 1
-
-        if last is None:
-            out.append((0, l))
-            last = l
-
-        if last == l:
-            out[-1] = (num, l)
-        else:
-            out.append( (num, l) )
-            last = l
-
-    print("widths = [")
-    for o in out[1:]:  # treat control characters same as ascii
-        print("\t%r," % (o,))
-    print("]")
-
-if __name__ == "__main__":
-    process_east_asian_width()
-
@@ -691,10 +691,19 @@ class Screen(BaseScreen, RealTerminal):
         if not partial_display():
             o.append(escape.CURSOR_HOME)
 
+        damaged = None
         if self.screen_buf:
             osb = self.screen_buf
+            if self._screen_buf_canvas is not None:
+                # rows outside the damaged areas match screen_buf
+                damaged = r.damaged_rows(self._screen_buf_canvas)
         else:
             osb = []
+        # screen_buf keeps a fingerprint of each row when the canvas
+        # provides one, otherwise a copy of the row
+        fingerprints = None
+        if r.cacheable:
+            fingerprints = r.row_fingerprints()
         sb = []
         cy = self._cy
         y = -1
@@ -747,13 +756,20 @@ class Screen(BaseScreen, RealTerminal):
         cy = 0
         for row in r.content():
             y += 1
-            if osb and y < len(osb) and osb[y] == row:
+            fp = None
+            if fingerprints is not None:
+                fp = fingerprints[y]
+            if fp is None:
+                fp = row
+            if osb and y < len(osb) and (
+                    (damaged is not None and not damaged[y]) or
+                    osb[y] == fp):
                 # this row of the screen buffer matches what is
                 # currently displayed, so we can skip this line
                 sb.append( osb[y] )
                 continue
 
-            sb.append(row)
+            sb.append(fp)
 
             # leave blank lines off display when we are using
             # the default screen buffer (allows partial screen)
@@ -0,0 +1,386 @@
+#!/usr/bin/python
+#
+# Urwid canvas snapshot format
+#    Copyright (C) 2004-2011  Ian Ward
+#
+#    This library is free software; you can redistribute it and/or
+#    modify it under the terms of the GNU Lesser General Public
+#    License as published by the Free Software Foundation; either
+#    version 2.1 of the License, or (at your option) any later version.
+#
+#    This library is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#    Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public
+#    License along with this library; if not, write to the Free Software
+#    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+#
+# Urwid web site: http://excess.org/urwid/
+
+"""
+Binary snapshots of rendered canvases
+
+A snapshot stream starts with a header followed by records.  Each
+record is a kind byte and a payload length, then the payload:
+
+attribute record -- defines the id used for an attribute in the
+    frames that follow
+full frame record -- size, cursor, a fingerprint for each row and the
+    content of every row
+delta frame record -- the same as a full frame, but only the rows that
+    differ from the previous frame are included
+
+Row content is a list of runs of text with the same attribute id and
+character set, the same information that :meth:`Canvas.content`
+returns.  Row fingerprints are CRC-32 values of the encoded rows, so
+frames can be compared without decoding them.
+"""
+
+import struct
+import zlib
+import mmap
+
+from urwid.compat import bytes, B, PYTHON3
+from urwid.canvas import TextCanvas
+from urwid.display_common import AttrSpec
+
+
+class SnapshotError(Exception):
+    pass
+
+
+MAGIC = B("URWIDSNP")
+VERSION = 2
+
+_ATTR, _FULL_FRAME, _DELTA_FRAME = 1, 2, 3
+# attribute value types
+_ATTR_STR, _ATTR_TEXT, _ATTR_SPEC = 0, 1, 2
+
+_header = struct.Struct("<8sH")
+_record = struct.Struct("<BI")
+_frame = struct.Struct("<HHii")
+_row_length = struct.Struct("<I")
+_changed_row = struct.Struct("<HI")
+_runs = struct.Struct("<H")
+_run = struct.Struct("<HBI")
+_attr = struct.Struct("<HBH")
+
+
+def _encode_attr(attr):
+    """
+    Return (type, data) for attribute attr.
+    """
+    if isinstance(attr, str):
+        if PYTHON3:
+            return _ATTR_STR, attr.encode('utf-8')
+        return _ATTR_STR, attr
+    if not PYTHON3 and isinstance(attr, unicode):
+        return _ATTR_TEXT, attr.encode('utf-8')
+    if isinstance(attr, AttrSpec):
+        return _ATTR_SPEC, ("%s;%s;%d" % (attr.foreground,
+            attr.background, attr.colors)).encode('ascii')
+    raise SnapshotError("Can't store attribute %r in a snapshot" % (attr,))
+
+def _decode_attr(kind, data):
+    """
+    Return the attribute stored by _encode_attr().
+    """
+    if kind == _ATTR_STR:
+        if PYTHON3:
+            return data.decode('utf-8')
+        return data
+    if kind == _ATTR_TEXT:
+        return data.decode('utf-8')
+    if kind == _ATTR_SPEC:
+        fg, bg, colors = data.decode('ascii').split(";")
+        return AttrSpec(fg, bg, int(colors))
+    raise SnapshotError("Unknown attribute type %d" % kind)
+
+
+class SnapshotWriter(object):
+    """
+    Write rendered canvases to a file as a stream of snapshot frames.
+
+    >>> from io import BytesIO
+    >>> f = BytesIO()
+    >>> w = SnapshotWriter(f)
+    >>> w.write(TextCanvas([B("hello")]))
+    >>> w.write(TextCanvas([B("hello")]))
+    >>> [frame.text for frame in SnapshotReader(f.getvalue())]
+    [[...'hello'], [...'hello']]
+    """
+    def __init__(self, file, keyframe_interval=None):
+        """
+        file -- file-like object opened for writing bytes
+        keyframe_interval -- write a full frame after this many delta
+            frames, or None to only write full frames when the canvas
+            size changes
+        """
+        self._file = file
+        self.keyframe_interval = keyframe_interval
+        self._attr_ids = {None: 0}
+        self._deltas = 0
+        self._last = None
+        file.write(_header.pack(MAGIC, VERSION))
+
+    def _attr_id(self, attr):
+        """
+        Return the id for attr, writing an attribute record if this
+        is the first time it is used.
+        """
+        try:
+            return self._attr_ids[attr]
+        except KeyError:
+            pass
+        aid = len(self._attr_ids)
+        kind, data = _encode_attr(attr)
+        self._write_record(_ATTR, _attr.pack(aid, kind, len(data)) + data)
+        self._attr_ids[attr] = aid
+        return aid
+
+    def _write_record(self, kind, payload):
+        self._file.write(_record.pack(kind, len(payload)))
+        self._file.write(payload)
+
+    def encode_row(self, row):
+        """
+        Return the encoded form of row, a list of (attr, cs, text)
+        tuples as returned by :meth:`Canvas.content`.
+        """
+        out = [_runs.pack(len(row))]
+        for a, cs, run in row:
+            if cs is None:
+                cs = 0
+            else:
+                cs = ord(cs)
+            out.append(_run.pack(self._attr_id(a), cs, len(run)))
+            out.append(run)
+        return bytes().join(out)
+
+    def write(self, canvas, full=False):
+        """
+        Write canvas as the next frame.  Only the rows that differ from
+        the previous frame are written unless this is the first frame,
+        the size changed, the keyframe interval is reached or full is
+        True.
+        """
+        cols, rows = canvas.cols(), canvas.rows()
+        if cols > 0xffff or rows > 0xffff:
+            raise SnapshotError("Canvas too large for a snapshot: %r" %
+                ((cols, rows),))
+        fingerprints = canvas.row_fingerprints()
+        last = self._last
+        if last is not None and last[:2] != (cols, rows):
+            last = None
+        if (last is None or full or (self.keyframe_interval is not None
+                and self._deltas >= self.keyframe_interval)):
+            kind = _FULL_FRAME
+            self._deltas = 0
+        else:
+            kind = _DELTA_FRAME
+            self._deltas += 1
+
+        encoded = []
+        crcs = []
+        changed = []
+        for i, row in enumerate(canvas.content()):
+            fp = fingerprints and fingerprints[i]
+            if last is not None and fp is not None and fp == last[2][i]:
+                # same content as the previous frame, skip encoding
+                data, crc = last[3][i], last[4][i]
+            else:
+                data = self.encode_row(row)
+                crc = zlib.crc32(data) & 0xffffffff
+            encoded.append(data)
+            crcs.append(crc)
+            if kind == _FULL_FRAME or data != last[3][i]:
+                changed.append(i)
+
+        cursor = canvas.cursor
+        if cursor is None:
+            cursor = (-1, -1)
+        out = [_frame.pack(cols, rows, cursor[0], cursor[1]),
+            struct.pack("<%dI" % rows, *crcs)]
+        if kind == _FULL_FRAME:
+            for data in encoded:
+                out.append(_row_length.pack(len(data)))
+                out.append(data)
+        else:
+            out.append(_runs.pack(len(changed)))
+            for i in changed:
+                out.append(_changed_row.pack(i, len(encoded[i])))
+                out.append(encoded[i])
+        self._write_record(kind, bytes().join(out))
+        if fingerprints is None:
+            fingerprints = [None] * rows
+        self._last = (cols, rows, fingerprints, encoded, crcs)
+
+
+class SnapshotFrame(object):
+    """
+    A frame read from a snapshot stream.  Rows are only decoded when
+    they are used.
+
+    cols, rows -- size of the frame
+    cursor -- (x, y) of the cursor or None
+    fingerprints -- a fingerprint for each row, rows with the same
+        fingerprint have the same content
+    """
+    def __init__(self, reader, cols, rows, cursor, fingerprints, row_spans):
+        self._reader = reader
+        self.cols = cols
+        self.rows = rows
+        self.cursor = cursor
+        self.fingerprints = fingerprints
+        self._row_spans = row_spans
+
+    def row_data(self, row):
+        """
+        Return the encoded content of row.
+        """
+        start, end = self._row_spans[row]
+        return self._reader.data[start:end]
+
+    def content(self):
+        """
+        Return the content of each row as a list of (attr, cs, text)
+        tuples, like :meth:`Canvas.content`.
+        """
+        return [self._reader.decode_row(start, end)
+            for start, end in self._row_spans]
+
+    def _text(self):
+        return [bytes().join([text for (attr, cs, text) in row])
+            for row in self.content()]
+    text = property(_text)
+
+    def canvas(self):
+        """
+        Return a :class:`TextCanvas` with the content of this frame.
+        """
+        text = []
+        attr = []
+        cs = []
+        for row in self.content():
+            text.append(bytes().join([run for a, c, run in row]))
+            attr.append([(a, len(run)) for a, c, run in row])
+            cs.append([(c, len(run)) for a, c, run in row])
+        return TextCanvas(text, attr, cs, self.cursor, self.cols,
+            check_width=False)
+
+    def changed_rows(self, other):
+        """
+        Return the indexes of the rows that differ from frame other,
+        comparing fingerprints only.
+        """
+        if (self.cols, self.rows) != (other.cols, other.rows):
+            return list(range(self.rows))
+        return [i for i, (a, b) in enumerate(zip(self.fingerprints,
+            other.fingerprints)) if a != b]
+
+
+class SnapshotReader(object):
+    """
+    Read the frames from a snapshot stream.
+
+    data -- the stream contents, any object that supports slicing and
+        struct.unpack_from, e.g. bytes or an mmap object
+    """
+    def __init__(self, data):
+        self.data = data
+        magic, version = _header.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise SnapshotError("Not a snapshot stream")
+        if version != VERSION:
+            raise SnapshotError("Unsupported snapshot version %d" % version)
+        self.attrs = {0: None}
+
+    def open(cls, filename):
+        """
+        Return a reader for a snapshot file, mapped into memory instead
+        of reading it all at once.
+        """
+        f = open(filename, 'rb')
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        finally:
+            f.close()
+        return cls(data)
+    open = classmethod(open)
+
+    def decode_row(self, start, end):
+        """
+        Return the row encoded in self.data[start:end] as a list of
+        (attr, cs, text) tuples.
+        """
+        data = self.data
+        attrs = self.attrs
+        (runs,) = _runs.unpack_from(data, start)
+        pos = start + _runs.size
+        row = []
+        for i in range(runs):
+            aid, cs, length = _run.unpack_from(data, pos)
+            pos += _run.size
+            if cs:
+                cs = chr(cs)
+            else:
+                cs = None
+            row.append((attrs[aid], cs, data[pos:pos + length]))
+            pos += length
+        if pos != end:
+            raise SnapshotError("Corrupt row at offset %d" % start)
+        return row
+
+    def __iter__(self):
+        """
+        Yield a :class:`SnapshotFrame` for each frame in the stream.
+        """
+        data = self.data
+        pos = _header.size
+        end = len(data)
+        spans = None
+        while pos < end:
+            kind, length = _record.unpack_from(data, pos)
+            pos += _record.size
+            next_pos = pos + length
+            if next_pos > end:
+                raise SnapshotError("Truncated record at offset %d" % pos)
+            if kind == _ATTR:
+                aid, akind, alen = _attr.unpack_from(data, pos)
+                start = pos + _attr.size
+                self.attrs[aid] = _decode_attr(akind,
+                    data[start:start + alen])
+            elif kind in (_FULL_FRAME, _DELTA_FRAME):
+                cols, rows, x, y = _frame.unpack_from(data, pos)
+                pos += _frame.size
+                fingerprints = struct.unpack_from("<%dI" % rows, data, pos)
+                pos += 4 * rows
+                if kind == _FULL_FRAME:
+                    spans = []
+                    for i in range(rows):
+                        (rlen,) = _row_length.unpack_from(data, pos)
+                        pos += _row_length.size
+                        spans.append((pos, pos + rlen))
+                        pos += rlen
+                else:
+                    if spans is None or len(spans) != rows:
+                        raise SnapshotError("Delta frame without a "
+                            "matching full frame at offset %d" % pos)
+                    spans = list(spans)
+                    (changed,) = _runs.unpack_from(data, pos)
+                    pos += _runs.size
+                    for i in range(changed):
+                        row, rlen = _changed_row.unpack_from(data, pos)
+                        pos += _changed_row.size
+                        spans[row] = (pos, pos + rlen)
+                        pos += rlen
+                cursor = None
+                if (x, y) != (-1, -1):
+                    cursor = (x, y)
+                yield SnapshotFrame(self, cols, rows, cursor, fingerprints,
+                    spans)
+            else:
+                raise SnapshotError("Unknown record type %d" % kind)
+            pos = next_pos
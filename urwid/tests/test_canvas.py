@@ -1,6 +1,7 @@
 import unittest
+import weakref
 
-from urwid import canvas
+from urwid import canvas, util, escape
 from urwid.compat import B
 import urwid
 
@@ -8,7 +9,7 @@ import urwid
 class CanvasCacheTest(unittest.TestCase):
     def setUp(self):
         # purge the cache
-        urwid.CanvasCache._widgets.clear()
+        urwid.CanvasCache.clear()
 
     def cct(self, widget, size, focus, expected):
         got = urwid.CanvasCache.fetch(widget, urwid.Widget, size, focus)
@@ -39,6 +40,194 @@ class CanvasCacheTest(unittest.TestCase):
         self.cct(a, (15,1), False, None)
         self.cct(b, (20,2), True, bloo)
 
+    def test_strong_limits(self):
+        a = urwid.Text("")
+        urwid.CanvasCache.set_limits(max_entries=2)
+        try:
+            for cols in (10, 11, 12):
+                c = urwid.TextCanvas([B("x")] * 2, maxcol=cols)
+                c.finalize(a, (cols,), False)
+                urwid.CanvasCache.store(urwid.Widget, c)
+            del c
+            # the least recently used canvas was released
+            self.cct(a, (10,), False, None)
+            assert urwid.CanvasCache.fetch(a, urwid.Widget, (11,), False)
+            # (11,) is now more recently used than (12,)
+            c = urwid.TextCanvas([B("x")] * 2, maxcol=13)
+            c.finalize(a, (13,), False)
+            urwid.CanvasCache.store(urwid.Widget, c)
+            del c
+            self.cct(a, (12,), False, None)
+            assert urwid.CanvasCache.fetch(a, urwid.Widget, (11,), False)
+
+            urwid.CanvasCache.set_limits(max_cells=30)
+            self.cct(a, (13,), False, None)
+            urwid.CanvasCache.invalidate(a)
+            self.cct(a, (11,), False, None)
+        finally:
+            urwid.CanvasCache.set_limits()
+
+    def test_instances(self):
+        a = urwid.Text("")
+        one = urwid.CanvasCache()
+        two = urwid.CanvasCache(max_entries=10)
+        c = urwid.TextCanvas()
+        c.finalize(a, (10,1), False)
+        one.store(urwid.Widget, c)
+        assert one.fetch(a, urwid.Widget, (10,1), False) is c
+        assert two.fetch(a, urwid.Widget, (10,1), False) is None
+        self.assertEqual((one.hits, one.fetches), (1, 1))
+        self.assertEqual((two.hits, two.fetches), (0, 1))
+
+        previous = urwid.CanvasCache.set_current(two)
+        try:
+            urwid.CanvasCache.store(urwid.Widget, c)
+            assert two.fetch(a, urwid.Widget, (10,1), False) is c
+        finally:
+            urwid.CanvasCache.set_current(previous)
+
+        # invalidating through the class reaches every cache
+        urwid.CanvasCache.invalidate(a)
+        assert one.fetch(a, urwid.Widget, (10,1), False) is None
+        assert two.fetch(a, urwid.Widget, (10,1), False) is None
+
+        # a dropped cache is released immediately
+        two.store(urwid.Widget, c)
+        two_ref = weakref.ref(two)
+        del two
+        assert two_ref() is None
+
+    def test_depends(self):
+        cache = urwid.CanvasCache()
+        child = urwid.Text("")
+        parent = urwid.Text("")
+        cc = urwid.TextCanvas()
+        cc.finalize(child, (10,1), False)
+        cache.store(urwid.Widget, cc)
+        for i in range(100):
+            pc = urwid.CompositeCanvas()
+            pc.set_depends([child, child])
+            pc.finalize(parent, (10, i), False)
+            cache.store(urwid.Widget, pc)
+        self.assertEqual(cache._deps[child], set([parent]))
+        # collecting the parent's canvases removes the reverse links
+        del pc
+        assert parent not in cache._widgets
+        assert child not in cache._deps
+        assert parent not in cache._rdeps
+
+    def test_deep_invalidate(self):
+        cache = urwid.CanvasCache()
+        widgets = [urwid.Text("") for i in range(5000)]
+        canvases = []
+        for i, w in enumerate(widgets):
+            c = urwid.CompositeCanvas()
+            c.set_depends(widgets[i-1:i])
+            c.finalize(w, (10,1), False)
+            cache.store(urwid.Widget, c)
+            canvases.append(c)
+        assert cache.fetch(widgets[-1], urwid.Widget, (10,1), False)
+        cache.invalidate(widgets[0])
+        assert not cache._widgets
+        assert not cache._deps
+        assert not cache._rdeps
+
+    def test_deferred(self):
+        cache = urwid.CanvasCache()
+        t = urwid.Text("a")
+        p = urwid.Pile([t])
+        previous = urwid.CanvasCache.set_current(cache)
+        urwid.CanvasCache.defer_invalidation()
+        try:
+            canv = p.render((5,))
+            for i in range(10):
+                t.set_text("b%d" % i)
+            # still cached until the queue is flushed
+            assert cache._widgets.get(p)
+            self.assertEqual(urwid.CanvasCache._pending, set([t]))
+            # fetching flushes first, so a stale canvas is never used
+            canv2 = p.render((5,))
+            assert canv2 is not canv
+            self.assertEqual(canv2.text, [B("b9   ")])
+            assert not urwid.CanvasCache._pending
+            t.set_text("c")
+            urwid.CanvasCache.flush_invalidations()
+            assert not cache._widgets.get(p)
+        finally:
+            urwid.CanvasCache.defer_invalidation(False)
+            urwid.CanvasCache.set_current(previous)
+        t.set_text("d")
+        assert not urwid.CanvasCache._pending
+
+    def test_main_loop_skips_unchanged(self):
+        class FakeScreen(object):
+            def __init__(self):
+                self.drawn = []
+            def get_cols_rows(self):
+                return (10, 3)
+            def draw_screen(self, size, canvas):
+                self.drawn.append(canvas)
+        t = urwid.Text("hello")
+        screen = FakeScreen()
+        loop = urwid.MainLoop(urwid.Filler(t), screen=screen)
+        loop.draw_screen()
+        fetches = loop.canvas_cache.fetches
+        loop.draw_screen()
+        self.assertEqual(loop.canvas_cache.fetches, fetches)
+        assert screen.drawn[0] is screen.drawn[1]
+        t.set_text("changed")
+        loop.draw_screen()
+        assert screen.drawn[2] is not screen.drawn[1]
+        self.assertEqual(screen.drawn[2].text[1], B("changed   "))
+
+    def test_stats(self):
+        cache = urwid.CanvasCache(max_entries=1)
+        t = urwid.Text("a")
+        p = urwid.Pile([t])
+        previous = urwid.CanvasCache.set_current(cache)
+        try:
+            canv = p.render((5,))
+            p.render((5,))
+            p.render((6,))
+            t.set_text("b")
+        finally:
+            urwid.CanvasCache.set_current(previous)
+        stats = cache.get_stats()
+        by_key = stats['by_key']
+        self.assertEqual(by_key[(urwid.Pile, (5,))]['hits'], 1)
+        self.assertEqual(by_key[(urwid.Pile, (5,))]['misses'], 1)
+        self.assertEqual(by_key[(urwid.Pile, (5,))]['invalidated'], 1)
+        self.assertEqual(by_key[(urwid.Text, (6,))]['stores'], 1)
+        self.assertEqual(by_key[(urwid.Text, (5,))]['evicted'], 1)
+        self.assertEqual(stats['invalidations'], 1)
+        self.assertEqual(stats['invalidated_widgets'], 2)
+        self.assertEqual(stats['entries'], 0)
+        self.assertEqual(stats['strong_entries'], 0)
+
+        c = urwid.CompositeCanvas()
+        c.set_depends([t])
+        c.finalize(p, (7,), False)
+        cache.store(urwid.Widget, c)
+        cache.reset_stats()
+        cache.store(urwid.Widget, c)
+        by_key = cache.get_stats()['by_key']
+        self.assertEqual(by_key, {(urwid.Pile, (7,)): dict(
+            hits=0, misses=0, stores=0, refused=1, invalidated=0,
+            collected=0, evicted=0, entries=0)})
+
+
+class LRUCacheTest(unittest.TestCase):
+    def test_cost(self):
+        c = util.LRUCache(max_cost=10)
+        c.store('a', 1, 4)
+        c.store('b', 2, 4)
+        c.store('c', 3, 4)
+        self.assertEqual(c.keys(), ['b', 'c'])
+        self.assertEqual(c.cost, 8)
+        c.store('d', 4, 11)
+        self.assertEqual(c.keys(), [])
+        self.assertEqual(c.cost, 0)
+
 
 class CanvasTest(unittest.TestCase):
     def ct(self, text, attr, exp_content):
@@ -75,6 +264,103 @@ class CanvasTest(unittest.TestCase):
             [[(None, None, B("There"))]])
 
 
+class PackedTextCanvasTest(unittest.TestCase):
+    def setUp(self):
+        self.args = ([B("hello"), B("world!"), B("")],
+            [[("a", 2), ("b", 3)], [], [("c", 1)]],
+            [[], [("U", 2), (None, 4)], []])
+
+    def cmp(self, *args):
+        packed = urwid.PackedTextCanvas(*self.args, maxcol=6)
+        plain = urwid.TextCanvas(*self.args, maxcol=6)
+        self.assertEqual(list(packed.content(*args)),
+            list(plain.content(*args)))
+
+    def test_content(self):
+        self.cmp()
+        self.cmp(0, 0, 6, 3)
+        self.cmp(1, 1, 4, 1)
+        self.cmp(0, 0, None, None, {"a": "x", None: "y"})
+        self.cmp(2, 0, 3, 2, {"b": "x"})
+
+    def test_attributes(self):
+        packed = urwid.PackedTextCanvas(*self.args, maxcol=6)
+        plain = urwid.TextCanvas(*self.args, maxcol=6)
+        self.assertEqual(packed._text, plain._text)
+        self.assertEqual(packed._attr, plain._attr)
+        self.assertEqual(packed._cs, plain._cs)
+        self.assertEqual(packed.rows(), 3)
+        self.assertEqual(packed.cols(), 6)
+
+    def test_shared_rows(self):
+        c = urwid.PackedTextCanvas(*self.args, maxcol=6)
+        self.assertTrue(list(c.content())[0] is list(c.content())[0])
+        m = {"a": "x"}
+        self.assertTrue(list(c.content(attr_map=m))[0] is
+            list(c.content(attr_map=m))[0])
+
+    def test_text_render(self):
+        class PackedText(urwid.Text):
+            canvas_class = urwid.PackedTextCanvas
+        c = PackedText(("a", u"hello world")).render((6,))
+        self.assertTrue(isinstance(c, urwid.PackedTextCanvas))
+        self.assertEqual(c.text, [B("hello "), B("world ")])
+        pb = urwid.ProgressBar("n", "c", 50)
+        self.assertEqual(pb.render((10,)).text, [B("   50 %   ")])
+
+
+class ApplyTextLayoutTest(unittest.TestCase):
+    def ctest(self, text, attr, ls, maxcol, exp_text, exp_attr, exp_cs):
+        c = canvas.apply_text_layout(text, attr, ls, maxcol)
+        self.assertEqual(c._text, exp_text)
+        self.assertEqual(c._attr, exp_attr)
+        self.assertEqual(c._cs, exp_cs)
+
+    def test_attr_runs(self):
+        urwid.set_encoding("utf-8")
+        for text in (u"hello world", B("hello world")):
+            self.ctest(text, [('a', 3), ('b', 0), ('c', 5)],
+                [[(5, 0, 5)], [(1, None), (5, 6, 11)]], 7,
+                [B("hello  "), B(" world ")],
+                [[('a', 3), ('b', 0), ('c', 2), (None, 2)],
+                    [(None, 1), ('c', 2), (None, 4)]],
+                [[(None, 7)], [(None, 7)]])
+
+    def test_encoded_width(self):
+        urwid.set_encoding("utf-8")
+        self.ctest(u"caf\xe9 bar", [('a', 4), ('b', 4)],
+            [[(5, 0, 5), (2, 5, 7)], [(1, 7, B("-")), (0, 8)]], 7,
+            [B("caf\xc3\xa9 ba"), B("-      ")],
+            [[('a', 5), ('b', 3)], [('b', 1), (None, 6)]],
+            [[(None, 8)], [(None, 7)]])
+
+    def test_dec_special(self):
+        urwid.set_encoding("ascii")
+        try:
+            self.ctest(u"x\u2500\u2500y", [('a', 2), ('b', 2)],
+                [[(4, 0, 4)]], 4,
+                [B("xqqy")], [[('a', 2), ('b', 2)]],
+                [[(None, 1), (escape.DEC_TAG, 2), (None, 1)]])
+        finally:
+            urwid.set_encoding("utf-8")
+
+
+class SharedSolidCanvasTest(unittest.TestCase):
+    def test_shared(self):
+        a = urwid.SolidCanvas.shared(u"x", 4, 2)
+        self.assertTrue(urwid.SolidCanvas.shared(u"x", 4, 2) is a)
+        self.assertFalse(urwid.SolidCanvas.shared(u"x", 4, 3) is a)
+        self.assertEqual(a.text, [B("xxxx"), B("xxxx")])
+        self.assertEqual(a.widget_info, None)
+
+    def test_fill_damage(self):
+        old = urwid.SolidFill(u"#").render((5, 3))
+        new = urwid.SolidFill(u"#").render((5, 3))
+        self.assertEqual(new.damage(old), [])
+        other = urwid.SolidFill(u"-").render((5, 3))
+        self.assertEqual(other.damage(old), [(0, 0, 5, 3)])
+
+
 class ShardBodyTest(unittest.TestCase):
     def sbt(self, shards, shard_tail, expected):
         result = canvas.shard_body(shards, shard_tail, False)
@@ -226,6 +512,167 @@ class ShardsTrimTest(unittest.TestCase):
             [(8, [(1,0,3,8,None,"baz")])])
 
 
+class CompactTest(unittest.TestCase):
+    def test_merge(self):
+        self.assertEqual(canvas.shards_merge([
+            (2, [(0,0,5,2,None,"foo")]),
+            (3, [(0,2,5,3,None,"foo")]),
+            (1, [(0,5,5,1,None,"bar")]),
+            (1, [(0,6,5,1,None,"foo")]),
+            ], 5), [
+            (5, [(0,0,5,5,None,"foo")]),
+            (1, [(0,5,5,1,None,"bar")]),
+            (1, [(0,6,5,1,None,"foo")])])
+        # not the whole width or not consecutive rows
+        shards = [(2, [(0,0,4,2,None,"foo")]), (2, [(0,2,4,2,None,"foo")])]
+        self.assertEqual(canvas.shards_merge(shards, 5), shards)
+        shards = [(2, [(0,0,5,2,None,"foo")]), (2, [(0,3,5,2,None,"foo")])]
+        self.assertEqual(canvas.shards_merge(shards, 5), shards)
+
+    def test_compact(self):
+        lb = urwid.ListBox([urwid.AttrMap(urwid.Text(str(i)), "a")
+            for i in range(20)])
+        c = lb.render((8, 10))
+        expected = list(c.content())
+        cc = urwid.CompositeCanvas(c)
+        self.assertFalse(cc.compact(max_cells=79))
+        self.assertEqual(len(cc.shards), 10)
+        self.assertTrue(cc.compact())
+        self.assertEqual(len(cc.shards), 1)
+        self.assertEqual(list(cc.content()), expected)
+        self.assertFalse(cc.compact())
+        # a few large pieces are cheaper to iterate than to copy
+        cj = urwid.CanvasJoin([(urwid.SolidCanvas(u"x", 40, 10), 0, False,
+            40), (urwid.SolidCanvas(u"y", 40, 10), 1, False, 40)])
+        self.assertFalse(cj.compact())
+
+    def test_cache(self):
+        cache = urwid.CanvasCache(compact_cells=1000)
+        previous = urwid.CanvasCache.set_current(cache)
+        try:
+            lb = urwid.ListBox(urwid.SimpleFocusListWalker(
+                [urwid.Text(str(i)) for i in range(20)]))
+            c = lb.render((8, 10))
+            self.assertEqual(len(c.shards), 1)
+            self.assertEqual(c.text[3], B("3       "))
+            self.assertTrue(lb.render((8, 10)) is c)
+        finally:
+            urwid.CanvasCache.set_current(previous)
+
+
+class DamageTest(unittest.TestCase):
+    def setUp(self):
+        self.items = [urwid.TextCanvas([B("item %d" % i)], maxcol=8)
+            for i in range(6)]
+
+    def combine(self, items, side):
+        col = urwid.CanvasCombine([(c, None, False) for c in items])
+        return urwid.CanvasJoin([(col, 0, False, 8), (side, 1, False, 4)])
+
+    def test_composite(self):
+        side = urwid.SolidCanvas(u"|", 4, 6)
+        old = self.combine(self.items, side)
+        self.assertEqual(old.damage(old), [])
+        items = list(self.items)
+        items[2] = items[3] = urwid.TextCanvas([B("new")], maxcol=8)
+        items[5] = urwid.TextCanvas([B("new")], maxcol=8)
+        new = self.combine(items, side)
+        # consecutive rows are joined into one rectangle
+        self.assertEqual(new.damage(old), [(0, 2, 8, 2), (0, 5, 8, 1)])
+        self.assertEqual(new.damaged_rows(old),
+            [False, False, True, True, False, True])
+        new = self.combine(self.items, urwid.SolidCanvas(u"-", 4, 6))
+        self.assertEqual(new.damage(old), [(8, 0, 4, 6)])
+
+    def test_whole(self):
+        c = urwid.TextCanvas([B("hello")])
+        self.assertEqual(c.damage(c), [])
+        self.assertEqual(c.damage(urwid.TextCanvas([B("hello")])),
+            [(0, 0, 5, 1)])
+        old = urwid.CompositeCanvas(c)
+        self.assertEqual(urwid.CompositeCanvas(c).damage(old), [])
+        self.assertEqual(urwid.CompositeCanvas(
+            urwid.TextCanvas([B("hello"), B("")])).damage(old),
+            [(0, 0, 5, 2)])
+        # canvases that may change in place are always damaged
+        c.cacheable = False
+        self.assertEqual(urwid.CompositeCanvas(c).damage(old),
+            [(0, 0, 5, 1)])
+
+
+class FingerprintTest(unittest.TestCase):
+    def render(self, text, fill=u" "):
+        cols = urwid.CanvasCombine([
+            (urwid.TextCanvas([B(t)], maxcol=6), None, False)
+            for t in text])
+        return urwid.CanvasJoin([(cols, 0, False, 6),
+            (urwid.SolidCanvas(fill, 2, len(text)), 1, False, 3)])
+
+    def test_text(self):
+        c = urwid.TextCanvas([B("hello"), B("world")], [[("a", 2)], []])
+        fps = c.row_fingerprints()
+        self.assertEqual(len(fps), 2)
+        self.assertNotEqual(fps[0], fps[1])
+        self.assertEqual(len(c.row_fingerprints(1, 1, 3, 1)), 1)
+        self.assertNotEqual(c.row_fingerprints(1, 1, 3, 1),
+            c.row_fingerprints(0, 1, 3, 1))
+        other = urwid.TextCanvas([B("hello"), B("world")], [[("a", 2)], []])
+        self.assertEqual(other.row_fingerprints(), fps)
+        other = urwid.TextCanvas([B("hello"), B("world")])
+        self.assertNotEqual(other.row_fingerprints()[0], fps[0])
+
+    def test_composite(self):
+        old = self.render(["one", "two", "three"]).row_fingerprints()
+        new = self.render(["one", "2", "three"]).row_fingerprints()
+        self.assertEqual(len(new), 3)
+        self.assertEqual([o == n for o, n in zip(old, new)],
+            [True, False, True])
+        new = self.render(["one", "two", "three"], u"x").row_fingerprints()
+        self.assertEqual([o == n for o, n in zip(old, new)],
+            [False, False, False])
+        # no fingerprints for canvases that may change in place
+        c = urwid.TextCanvas([B("hello")])
+        c.cacheable = False
+        self.assertEqual(urwid.CompositeCanvas(c).row_fingerprints(), [None])
+
+
+class ChildAtTest(unittest.TestCase):
+    def test_widget_path(self):
+        t = [urwid.Text(u"a\nb"), urwid.Text(u"c"), urwid.Text(u"d")]
+        p = urwid.Pile(t[:2])
+        w = urwid.Padding(urwid.Columns([p, t[2]]), left=1)
+        c = w.render((9,))
+        path = [(canv.widget_info[0], pos, col, row)
+            for canv, pos, col, row in c.widget_path(6, 0)]
+        self.assertEqual(path, [(w, None, 6, 0), (w.original_widget,
+            None, 5, 0), (t[2], 1, 1, 0)])
+        self.assertEqual(len(c.widget_path(6, 2)), 2) # below t[2]
+        path = [(canv.widget_info[0], pos, col, row)
+            for canv, pos, col, row in c.widget_path(2, 1)]
+        self.assertEqual(path[-2:], [(p, 0, 1, 1), (t[0], 0, 1, 1)])
+        self.assertEqual(c.child_at(0, 0), None) # padding
+
+    def test_trimmed(self):
+        items = [urwid.TextCanvas([B("item %d" % i)]) for i in range(4)]
+        for t in items:
+            t.finalize(urwid.Text(u""), (6,), False)
+        c = urwid.CanvasCombine([(t, i, False)
+            for i, t in enumerate(items)])
+        c.trim(1, 2)
+        self.assertEqual(c.child_at(0, 0), (0, 0, items[1], 1))
+        self.assertEqual(c.child_at(3, 1), (0, 1, items[2], 2))
+        self.assertEqual(c.child_at(0, 2), None)
+
+    def test_overlay(self):
+        top = urwid.CompositeCanvas(urwid.TextCanvas([B("top")]))
+        bottom = urwid.SolidCanvas(u"x", 5, 3)
+        top.finalize(urwid.Text(u"top"), (3,), False)
+        bottom.finalize(urwid.SolidFill(u"x"), (5, 3), False)
+        c = urwid.CanvasOverlay(top, bottom, 1, 1)
+        self.assertEqual(c.child_at(2, 1), (1, 1, top, None))
+        self.assertEqual(c.child_at(0, 1), (0, 0, bottom, None))
+
+
 class ShardsJoinTest(unittest.TestCase):
     def sjt(self, shard_lists, expected):
         result = canvas.shards_join(shard_lists)
@@ -1,6 +1,7 @@
 import unittest
 
 from urwid.tests.util import SelectableText
+from urwid.compat import B
 import urwid
 
 
@@ -135,6 +136,62 @@ class PileTest(unittest.TestCase):
         p.mouse_event((5,), 'button press', 1, 1, 1, True)
 
 
+    def test_render_rows(self):
+        T = urwid.Text
+        p = urwid.Pile([T(u"a\nb\nc"), T(u"d"), T(u"e\nf\ng\nh")])
+        full = p.render((3,)).text
+        for first_row, num_rows in [(0, 8), (1, 3), (3, 2), (7, 1)]:
+            got = p.render_rows((3,), first_row, num_rows).text
+            self.assertEqual(got, full[first_row:first_row+num_rows])
+
+    def test_render_rows_box(self):
+        T = urwid.Text
+        p = urwid.Pile([('pack', T(u"a\nb")), urwid.SolidFill(u"x"),
+            (1, urwid.SolidFill(u"z"))])
+        full = p.render((3, 6)).text
+        self.assertEqual(p.render_rows((3, 6), 1, 4).text, full[1:5])
+
+
+    def test_mouse_event_cached(self):
+        class ClickText(urwid.Text):
+            def mouse_event(self, size, event, button, col, row, focus):
+                self.clicked = (size, col, row)
+                return True
+        t = ClickText(u"x")
+        p = urwid.Pile([urwid.Text(u"a\nb"), t])
+        calls = []
+        get_item_rows = p.get_item_rows
+        p.get_item_rows = lambda *args: calls.append(args) or \
+            get_item_rows(*args)
+        self.assertTrue(p.mouse_event((5,), 'mouse drag', 1, 2, 2, True))
+        self.assertEqual(t.clicked, ((5,), 2, 0))
+        self.assertEqual(len(calls), 1)
+        # the layout isn't calculated again once the Pile is rendered
+        canv = p.render((5,), True)
+        del calls[:]
+        self.assertTrue(p.mouse_event((5,), 'mouse drag', 1, 3, 2, True))
+        self.assertEqual(t.clicked, ((5,), 3, 0))
+        self.assertEqual(calls, [])
+
+    def test_mouse_event_not_counted(self):
+        p = urwid.Pile([urwid.Text(u"a"), urwid.Text(u"b")])
+        canv = p.render((5,), True)
+        cache = urwid.CanvasCache.get_current()
+        fetches, hits = cache.fetches, cache.hits
+        p.mouse_event((5,), 'mouse press', 1, 0, 1, True)
+        self.assertEqual((cache.fetches, cache.hits), (fetches, hits))
+
+    def test_mouse_event_padded_box_pile(self):
+        # the canvas of a box Pile is wrapped again to pad or trim it
+        c = urwid.Columns([urwid.Edit(u"a:"), urwid.Edit(u"b:")])
+        p = urwid.Pile([('pack', c), ('pack', urwid.Text(u"1\n2\n3")),
+            urwid.SolidFill(u"x")])
+        canv = p.render((20, 2), True)
+        self.assertTrue(p.mouse_event((20, 2), 'mouse press', 1, 13, 0,
+            True))
+        self.assertEqual(c.focus_position, 1)
+
+
 class ColumnsTest(unittest.TestCase):
     def cwtest(self, desc, l, divide, size, exp, focus_column=0):
         c = urwid.Columns(l, divide, focus_column)
@@ -275,6 +332,53 @@ class OverlayTest(unittest.TestCase):
             urwid.SolidFill(u'B'),
             'right', 1, 'bottom', 1).get_cursor_coords((2,2)), (1,1))
 
+    def test_bottom_covered(self):
+        class CountingFill(urwid.SolidFill):
+            renders = 0
+            def render(self, size, focus=False):
+                self.renders += 1
+                return urwid.SolidFill.render(self, size, focus)
+        bottom = CountingFill(u'O')
+        o = urwid.Overlay(urwid.SolidFill(u'X'), bottom,
+            'left', ('relative', 100), 'top', ('relative', 100))
+        c = o.render((3, 2))
+        self.assertEqual(c.text, [B("XXX"), B("XXX")])
+        self.assertEqual(bottom.renders, 0)
+        # changes to the hidden widget don't affect the overlay
+        bottom.fill_char = u'o'
+        bottom._invalidate()
+        self.assertTrue(o.render((3, 2)) is c)
+        o.set_overlay_parameters('left', 2, 'top', 1)
+        self.assertEqual(o.render((3, 2)).text, [B("XXo"), B("ooo")])
+        self.assertEqual(bottom.renders, 1)
+
+    def test_reuse_hidden_canvases(self):
+        class CountingText(urwid.Text):
+            renders = 0
+            def render(self, size, focus=False):
+                self.renders += 1
+                return urwid.Text.render(self, size, focus)
+        urwid.CanvasCache.clear()
+        a, b, c = urwid.Text(u"a"), CountingText(u"b"), urwid.Text(u"c")
+        o = urwid.Overlay(urwid.SolidFill(u'X'),
+            urwid.Filler(urwid.Pile([a, b, c]), 'top'),
+            'left', 4, ('fixed top', 1), 1)
+        o.reuse_hidden_canvases = True
+        self.assertEqual(o.render((4, 3)).text,
+            [B("a   "), B("XXXX"), B("c   ")])
+        self.assertEqual(b.renders, 1)
+        a.set_text(u"A")
+        b.set_text(u"B")
+        canv = o.render((4, 3))
+        self.assertEqual(canv.text, [B("A   "), B("XXXX"), B("c   ")])
+        self.assertEqual(b.renders, 1)
+        # the canvas of b is out of date, so nothing using it is stored
+        self.assertFalse(urwid.CanvasCache.is_cached(canv))
+        o.set_overlay_parameters('left', 4, ('fixed top', 2), 1)
+        self.assertEqual(o.render((4, 3)).text,
+            [B("A   "), B("B   "), B("XXXX")])
+        self.assertEqual(b.renders, 2)
+
 
 class GridFlowTest(unittest.TestCase):
     def test_cell_width(self):
@@ -1,5 +1,6 @@
 import unittest
 
+from urwid.compat import B
 import urwid
 
 
@@ -147,3 +148,9 @@ class FillerTest(unittest.TestCase):
 
     def test_repr(self):
         repr(urwid.Filler(urwid.Text(u'hai')))
+
+    def test_tall_flow_widget(self):
+        t = urwid.Text(u"\n".join([str(i) for i in range(100)]))
+        f = urwid.Filler(t, 'top')
+        self.assertEqual(f.render((3, 4)).text,
+            [B("0  "), B("1  "), B("2  "), B("3  ")])
@@ -15,6 +15,9 @@ def load_tests(loader, tests, ignore):
         'urwid.split_repr', # override function with same name
         urwid.util,
         urwid.signals,
+        urwid.snapshot,
+        urwid.text_layout,
+        'urwid.text_buffer',
         ]
     for m in module_doctests:
         tests.addTests(doctest.DocTestSuite(m,
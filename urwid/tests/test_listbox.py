@@ -300,6 +300,63 @@ class ListBoxRenderTest(unittest.TestCase):
             ["hell","ohel","lohe","lloh","llo "], (3,4))
 
 
+    def test5_render_visible_rows(self):
+        class CountingText(urwid.Text):
+            def render_rows(self, size, first_row, num_rows, focus=False):
+                self.rendered = (first_row, num_rows)
+                return urwid.Text.render_rows(self, size, first_row,
+                    num_rows, focus)
+        w = CountingText(u"\n".join([str(i) for i in range(1000)]))
+        lbox = urwid.ListBox(urwid.SimpleFocusListWalker([w]))
+        lbox.shift_focus((4,5), -500)
+        canvas = lbox.render((4,5))
+        text = [bytes().join([t for at, cs, t in ln])
+            for ln in canvas.content()]
+        self.assertEqual(text, [B("%-4d" % i) for i in range(500, 505)])
+        self.assertEqual(w.rendered, (500, 5))
+
+
+class ListBoxMouseTest(unittest.TestCase):
+    def test_rendered_partial_widget(self):
+        class ClickText(urwid.Text):
+            def mouse_event(self, size, event, button, col, row, focus):
+                self.clicked = (size, col, row)
+                return True
+        w = ClickText(u"\n".join([str(i) for i in range(20)]))
+        lbox = urwid.ListBox(urwid.SimpleFocusListWalker(
+            [w, urwid.Text(u"end")]))
+        lbox.shift_focus((4,5), -10)
+        canvas = lbox.render((4,5))
+        self.assertTrue(lbox.mouse_event((4,5), 'mouse drag', 1, 1, 2,
+            False))
+        self.assertEqual(w.clicked, ((4,), 1, 12))
+
+    def test_hidden_rows_changed(self):
+        class Leaf(urwid.Text):
+            def selectable(self):
+                return True
+            def keypress(self, size, key):
+                return key
+            def mouse_event(self, size, event, button, col, row, focus):
+                self.clicked = (col, row)
+                return True
+        hidden = urwid.Text(u"h")
+        a = Leaf(u"a")
+        lbox = urwid.ListBox(urwid.SimpleFocusListWalker(
+            [urwid.Pile([hidden, a, Leaf(u"b")]), Leaf(u"c")]))
+        lbox.set_focus(1)
+        lbox.set_focus_valign('bottom')
+        canvas = lbox.render((10, 3), True)
+        # the Pile is only partly rendered, change its hidden rows
+        hidden.set_text(u"h\nh\nh")
+        canvas = lbox.render((10, 3), True)
+        self.assertEqual(canvas.text, [B("a         "), B("b         "),
+            B("c         ")])
+        self.assertTrue(lbox.mouse_event((10, 3), 'mouse press', 1, 0, 0,
+            True))
+        self.assertEqual(a.clicked, (0, 0))
+
+
 class ListBoxKeypressTest(unittest.TestCase):
     def ktest(self, desc, key, body, focus, offset_inset,
         exp_focus, exp_offset_inset, exp_cur, lbox = None):
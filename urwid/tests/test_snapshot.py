@@ -0,0 +1,78 @@
+import os
+import tempfile
+import unittest
+from io import BytesIO
+
+from urwid.compat import B
+import urwid
+
+
+class SnapshotTest(unittest.TestCase):
+    def frames(self, canvases, **kwargs):
+        f = BytesIO()
+        w = urwid.SnapshotWriter(f, **kwargs)
+        for c in canvases:
+            w.write(c)
+        return f.getvalue(), list(urwid.SnapshotReader(f.getvalue()))
+
+    def test_round_trip(self):
+        spec = urwid.AttrSpec('light red', 'dark blue')
+        c = urwid.TextCanvas([B("hello"), B("world")],
+            attr=[[('a', 2), (spec, 3)], [(u'b', 5)]],
+            cs=[[('0', 1)], []], cursor=(1, 1))
+        data, frames = self.frames([c])
+        self.assertEqual(len(frames), 1)
+        frame = frames[0]
+        self.assertEqual((frame.cols, frame.rows), (5, 2))
+        self.assertEqual(frame.cursor, (1, 1))
+        self.assertEqual(frame.content(), list(c.content()))
+        canv = frame.canvas()
+        self.assertEqual(list(canv.content()), list(c.content()))
+        self.assertEqual(canv.cursor, (1, 1))
+
+    def test_delta(self):
+        items = [urwid.Text(u"line %d" % i) for i in range(10)]
+        pile = urwid.Pile(items)
+        old = pile.render((10,))
+        items[3].set_text(u"changed")
+        new = pile.render((10,))
+        data, frames = self.frames([old, new])
+        self.assertEqual(frames[1].changed_rows(frames[0]), [3])
+        self.assertEqual(frames[1].text, new.text)
+        self.assertEqual(frames[0].text, old.text)
+        # the second frame only stores the changed row
+        full, ignore = self.frames([new])
+        self.assertTrue(len(data) - len(full) < len(full) / 2)
+
+    def test_size_change(self):
+        a = urwid.SolidCanvas(u"x", 3, 2)
+        b = urwid.SolidCanvas(u"y", 4, 1)
+        data, frames = self.frames([a, b, a], keyframe_interval=0)
+        self.assertEqual([f.text for f in frames],
+            [a.text, b.text, a.text])
+        self.assertEqual(frames[1].changed_rows(frames[0]), [0])
+
+    def test_mmap(self):
+        fd, name = tempfile.mkstemp()
+        try:
+            f = os.fdopen(fd, 'wb')
+            w = urwid.SnapshotWriter(f)
+            c = urwid.TextCanvas([B("abc")])
+            w.write(c)
+            f.close()
+            frames = list(urwid.SnapshotReader.open(name))
+            self.assertEqual(frames[0].text, [B("abc")])
+        finally:
+            os.remove(name)
+
+    def test_errors(self):
+        self.assertRaises(urwid.SnapshotError, urwid.SnapshotReader,
+            B("not a snapshot"))
+        w = urwid.SnapshotWriter(BytesIO())
+        c = urwid.TextCanvas([B("x")], attr=[[(object(), 1)]])
+        self.assertRaises(urwid.SnapshotError, w.write, c)
+
+    def test_wide_cursor(self):
+        c = urwid.TextCanvas([B("x") * 40000], cursor=(39999, 0))
+        data, frames = self.frames([c])
+        self.assertEqual(frames[0].cursor, (39999, 0))
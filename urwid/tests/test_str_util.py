@@ -35,3 +35,48 @@ class DecodeOneTest(unittest.TestCase):
         self.gwt("\xf0\x80\x80\x80", ord("?"), 1) # error
         self.gwt("\xf0\x90\x80\x80", 0x10000, 4)
         self.gwt("\xf3\xbf\xbf\xbf", 0xfffff, 4)
+
+
+class GetWidthTest(unittest.TestCase):
+    def test_widths(self):
+        for o, width in [
+                (ord("a"), 1), (0x0e, 0), (0x0f, 0), (0x85, 0),
+                (0xe9, 1), (0x300, 0), (0x200b, 0), (0x1160, 0),
+                (0x66ff, 2), (0xff01, 2), (0x1f600, 2), (0x20000, 2),
+                (0xe0100, 0), (0x10ffff, 1), (0x110000, 1)]:
+            self.assertEqual(str_util.get_width(o), width,
+                "got:%r expected:%r for %#x" % (str_util.get_width(o),
+                width, o))
+
+    def test_table_ranges(self):
+        from urwid import width_table
+        low = 0
+        for last, width in width_table.widths:
+            for o in (low, (low + last) // 2, last):
+                self.assertEqual(str_util.get_width(o), width)
+            low = last + 1
+
+
+class UnicodeTextTest(unittest.TestCase):
+    # one, two and four byte characters, to use each string kind that
+    # Python 3.3+ has
+    texts = [u"caf\xe9 \x85", u"a\u0300b\u66ff\uff01", u"\U0001f600x\u66ff"]
+
+    def test_calc_width(self):
+        for text in self.texts:
+            for s in range(len(text)):
+                for e in range(s, len(text) + 1):
+                    self.assertEqual(str_util.calc_width(text, s, e),
+                        sum([str_util.get_width(ord(c)) for c in text[s:e]]))
+
+    def test_calc_text_pos(self):
+        self.assertEqual(str_util.calc_text_pos(u"caf\xe9 \x85", 0, 6, 4),
+            (4, 4))
+        self.assertEqual(str_util.calc_text_pos(u"a\u0300b\u66ff\uff01",
+            0, 5, 3), (3, 2))
+        self.assertEqual(str_util.calc_text_pos(u"a\u0300b\u66ff\uff01",
+            1, 5, 9), (5, 5))
+
+    def test_is_wide_char(self):
+        self.assertEqual([str_util.is_wide_char(u"a\u66ff", i)
+            for i in range(2)], [False, True])
@@ -0,0 +1,76 @@
+import unittest
+import random
+
+from urwid.compat import B
+from urwid import text_buffer
+from urwid.text_buffer import GapBuffer, TextView
+
+
+class GapBufferTest(unittest.TestCase):
+    def setUp(self):
+        # small strings so that edits cross their boundaries
+        self.chunk_size = text_buffer.CHUNK_SIZE
+        text_buffer.CHUNK_SIZE = 4
+
+    def tearDown(self):
+        text_buffer.CHUNK_SIZE = self.chunk_size
+
+    def check(self, b, s, newline=u"\n"):
+        self.assertEqual(len(b), len(s))
+        self.assertEqual(b.text(), s)
+        lines = s.split(newline)
+        self.assertEqual(b.line_count(), len(lines))
+        start = 0
+        for i, line in enumerate(lines):
+            self.assertEqual(b.line_start(i), start)
+            self.assertEqual(b.line_of(start + len(line)), i)
+            start += len(line) + 1
+
+    def test_random_edits(self):
+        r = random.Random(3)
+        s = u"ab\ncd\n"
+        b = GapBuffer(s)
+        for i in range(1000):
+            start = r.randint(0, len(s))
+            stop = r.randint(start, len(s))
+            if r.random() < 0.5:
+                text = u"".join([r.choice(u"xy\n")
+                    for j in range(r.randint(0, 4))])
+                b.insert(start, text)
+                s = s[:start] + text + s[start:]
+            else:
+                self.assertEqual(b.get(start, stop), s[start:stop])
+                self.assertEqual(b[start:stop], s[start:stop])
+                b.delete(start, stop)
+                s = s[:start] + s[stop:]
+            if i % 50 == 0:
+                self.check(b, s)
+        self.check(b, s)
+
+    def test_bytes(self):
+        b = GapBuffer(B("one\ntwo"))
+        b.replace(3, 4, B("\n\n"))
+        self.check(b, B("one\n\ntwo"), B("\n"))
+        self.assertEqual(b.get(4, 6), B("\nt"))
+
+    def test_chunks(self):
+        b = GapBuffer(u"x" * 100)
+        b.insert(50, u"abc")
+        b.delete(10, 12)
+        for chunk in b._before + b._after:
+            self.assertTrue(0 < len(chunk) <= 4)
+        self.assertEqual(b[46:51], u"xxabc")
+        self.assertEqual(b[-1], u"x")
+        self.assertRaises(IndexError, lambda: b[101])
+
+
+class TextViewTest(unittest.TestCase):
+    def test_slices(self):
+        v = TextView(u"ab", GapBuffer(u"cdef"))
+        s = u"abcdef"
+        self.assertEqual(len(v), 6)
+        for start in range(-7, 8):
+            for stop in range(-7, 8):
+                self.assertEqual(v[start:stop], s[start:stop])
+        self.assertEqual(v[3], u"d")
+        self.assertEqual(v[::2], u"ace")
@@ -340,3 +340,123 @@ class Pos2CoordsTest(unittest.TestCase):
             for pos,a in zip(self.pos_list,answer) :
                 r = text_layout.calc_coords( self.text, t, pos)
                 assert r==a, "%r got: %r expected: %r"%(t,r,a)
+
+
+class LayoutCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = text_layout.LayoutCache(max_entries=3)
+
+    def test_shared(self):
+        c = self.cache
+        l = text_layout.default_layout
+        a = c.layout(l, u"N/A", 10, 'left', 'space')
+        self.assertTrue(c.layout(l, u"N/A", 10, 'left', 'space') is a)
+        self.assertFalse(c.layout(l, u"N/A", 10, 'right', 'space') is a)
+        self.assertEqual((c.hits, c.misses), (1, 2))
+        self.assertEqual(c.hit_rate(), 1.0 / 3)
+        c.clear()
+        self.assertEqual((len(c), c.hit_rate()), (0, None))
+
+    def test_limits(self):
+        c = self.cache
+        l = text_layout.default_layout
+        for width in range(5, 10):
+            c.layout(l, u"OK", width, 'left', 'space')
+        self.assertEqual(len(c), 3)
+        c.max_text_length = 1
+        c.layout(l, u"OK", 20, 'left', 'space')
+        self.assertEqual(len(c), 3)
+        self.assertEqual(c.misses, 5)
+
+    def test_layout_many(self):
+        c = self.cache
+        l = text_layout.default_layout
+        a = c.layout(l, u"one", 10, 'left', 'space')
+        result = c.layout_many(l, [u"one", u"two"], 10, 'left', 'space')
+        self.assertTrue(result[0] is a)
+        self.assertEqual(result[1], l.layout(u"two", 10, 'left', 'space'))
+        self.assertEqual((c.hits, c.misses), (1, 2))
+        # more new layouts than the cache holds are not stored
+        c.layout_many(l, [u"a", u"b", u"c", u"d"], 10, 'left', 'space')
+        self.assertEqual(len(c), 2)
+
+    def test_uncacheable_layout(self):
+        class MyLayout(text_layout.StandardTextLayout):
+            cache_layouts = False
+        self.cache.layout(MyLayout(), u"OK", 5, 'left', 'space')
+        self.assertEqual(len(self.cache), 0)
+
+    def test_pack(self):
+        c = self.cache
+        l = text_layout.default_layout
+        self.assertEqual(c.pack(l, u"one\nthree", None, 'left', 'space'),
+            (5, 2))
+        self.assertEqual(c.pack(l, u"one three", 6, 'left', 'space'),
+            (5, 2))
+        self.assertEqual(c.pack(l, u"one\nthree", None, 'left', 'space'),
+            (5, 2))
+        self.assertEqual(c.hits, 1)
+
+    def test_text_widgets(self):
+        c = text_layout.layout_cache
+        hits = c.hits
+        texts = [urwid.Text(u"shared text") for i in range(3)]
+        for t in texts:
+            t.render((7,))
+        self.assertEqual(c.hits - hits, 2)
+
+
+class IncrementalLayoutTest(unittest.TestCase):
+    def check(self, il, text):
+        l = text_layout.default_layout
+        expected = l.layout(text, il.width, il.align, il.wrap)
+        self.assertEqual(il.translation(), expected)
+        self.assertEqual(il.rows(), len(expected))
+        for first_row in range(len(expected)):
+            self.assertEqual(il.translation_rows(first_row, 2),
+                expected[first_row:first_row + 2])
+        for pos in range(len(text) + 1):
+            self.assertEqual(il.coords(pos),
+                text_layout.calc_coords(text, expected, pos))
+
+    def test_edits(self):
+        import random
+        r = random.Random(4)
+        for align, wrap in [('left', 'space'), ('right', 'any'),
+                ('center', 'clip')]:
+            il = text_layout.IncrementalLayout(text_layout.default_layout,
+                7, align, wrap)
+            text = u"some words\n\nand more words here\nend"
+            il.update(text)
+            self.check(il, text)
+            for i in range(40):
+                a = r.randint(0, len(text))
+                b = min(len(text), a + r.randint(0, 4))
+                insert = r.choice([u"", u"x", u" ", u"\n", u"ab cd\nef",
+                    u"long inserted line"])
+                text = text[:a] + insert + text[b:]
+                il.update(text)
+                self.check(il, text)
+
+    def test_only_changed_lines(self):
+        il = text_layout.IncrementalLayout(text_layout.default_layout,
+            10, 'left', 'space')
+        lines = [u"line %d" % i for i in range(100)]
+        self.assertEqual(il.update(u"\n".join(lines)), 100)
+        lines[50] = u"changed line"
+        self.assertEqual(il.update(u"\n".join(lines)), 1)
+        self.assertEqual(il.update(u"\n".join(lines)), 0)
+
+
+
+class LayoutManyTest(unittest.TestCase):
+    def test_same_as_layout(self):
+        l = text_layout.default_layout
+        texts = [u"", u"short", u"exactly10!", u"a longer line of words",
+            u"two\nlines", u" ", u"wordwithoutanyspacesatall"]
+        for width in (1, 5, 10, 30):
+            for align in ('left', 'center', 'right'):
+                for wrap in ('space', 'any', 'clip'):
+                    self.assertEqual(
+                        l.layout_many(texts, width, align, wrap),
+                        [l.layout(t, width, align, wrap) for t in texts])
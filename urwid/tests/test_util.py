@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 import unittest
+import random
 
 import urwid
 from urwid import util
-from urwid.compat import B
+from urwid.compat import B, ord2
 
 
 class CalcWidthTest(unittest.TestCase):
@@ -151,6 +152,76 @@ class CalcTextPosTest(unittest.TestCase):
         self.ctptest(text, tests)
 
 
+class NarrowTextTest(unittest.TestCase):
+    def test_same_as_str_util(self):
+        util.set_encoding("utf-8")
+        texts = [u"hello world " * 4, u"caf\xe9 " * 10, u"\x0eabc",
+            u"a\u0300b", u"\u66ff" * 40, B("plain ascii bytes " * 3),
+            B("\xe6\x9b\xbf wide"), B("del\x7f")]
+        for text in texts:
+            n = len(text)
+            for s in range(0, n, 7):
+                for e in range(s + 1, n + 1, 5):
+                    self.assertEqual(util.calc_width(text, s, e),
+                        util.str_util.calc_width(text, s, e))
+                    self.assertEqual(util.move_next_char(text, s, e),
+                        util.str_util.move_next_char(text, s, e))
+                    self.assertEqual(util.move_prev_char(text, s, e),
+                        util.str_util.move_prev_char(text, s, e))
+                    for col in (0, 1, 3, 200):
+                        self.assertEqual(
+                            util.calc_text_pos(text, s, e, col),
+                            util.str_util.calc_text_pos(text, s, e, col))
+                self.assertEqual(util.is_wide_char(text, s),
+                    util.str_util.is_wide_char(text, s))
+
+    def test_cached(self):
+        text = u"x" * 100
+        self.assertTrue(util.is_narrow_text(text))
+        self.assertTrue(util._narrow_cache[text])
+        self.assertFalse(util.is_narrow_text(text + u"\u66ff"))
+
+
+class ColumnIndexTest(unittest.TestCase):
+    def check(self, text):
+        r = random.Random(5)
+        index = util.ColumnIndex(text, step=16)
+        for i in range(300):
+            s = r.randint(0, len(text))
+            e = r.randint(s, len(text))
+            # keep utf-8 offsets on character boundaries
+            while s < len(text) and not isinstance(text, unicode) and (
+                    ord2(text[s]) & 0xc0 == 0x80):
+                s -= 1
+            while e < len(text) and not isinstance(text, unicode) and (
+                    ord2(text[e]) & 0xc0 == 0x80):
+                e += 1
+            self.assertEqual(index.calc_width(s, e),
+                util.str_util.calc_width(text, s, e))
+            col = r.randint(-1, 2 * (e - s) + 2)
+            self.assertEqual(index.calc_text_pos(s, e, col),
+                util.str_util.calc_text_pos(text, s, e, col))
+
+    def test_unicode(self):
+        r = random.Random(4)
+        self.check(u"".join([r.choice(u"ab\u66ff\u0300\u200b")
+            for i in range(500)]))
+
+    def test_utf8(self):
+        util.set_encoding("utf-8")
+        r = random.Random(4)
+        self.check(B("").join([r.choice([B("a"), B("\xe6\x9b\xbf"),
+            B("\xcc\x80")]) for i in range(500)]))
+
+    def test_used_for_long_lines(self):
+        text = u"\u66ff" * 2000
+        self.assertEqual(util.calc_width(text, 1, 1500), 2998)
+        self.assertEqual(util.calc_text_pos(text, 1, 2000, 1001),
+            (501, 1000))
+        self.assertTrue(util.column_index(text) is not None)
+        self.assertEqual(util.column_index(u"x" * 2000), None)
+
+
 class TagMarkupTest(unittest.TestCase):
     mytests = [
         ("simple one", "simple one", []),
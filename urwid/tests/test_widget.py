@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import unittest
+import random
 
 from urwid.compat import B
 import urwid
@@ -39,6 +40,95 @@ class TextTest(unittest.TestCase):
         assert got == expected, "got: %r expected: %r" % (got, expected)
 
 
+class RenderRowsTest(unittest.TestCase):
+    def rtest(self, w, size, first_row, num_rows, focus=False):
+        expected = w.render(size, focus).text[first_row:first_row+num_rows]
+        canv = w.render_rows(size, first_row, num_rows, focus)
+        got = canv.text
+        assert got == expected, "got: %r expected: %r" % (got, expected)
+        assert canv.rows() == num_rows
+
+    def test_text(self):
+        t = urwid.Text(u"\n".join([str(i) for i in range(20)]))
+        self.rtest(t, (4,), 0, 3)
+        self.rtest(t, (4,), 5, 10)
+        self.rtest(t, (4,), 18, 2)
+
+    def test_text_layout_slice(self):
+        t = urwid.Text(u"hello " * 50)
+        self.rtest(t, (10,), 7, 4)
+        self.rtest(t, (7,), 0, 1)
+
+    def test_edit_cursor(self):
+        e = urwid.Edit(u"", u"one\ntwo\nthree\nfour", multiline=True)
+        e.set_edit_pos(9) # on "three"
+        canv = e.render_rows((6,), 1, 2, focus=True)
+        self.assertEqual(canv.cursor, (1, 1))
+        canv = e.render_rows((6,), 3, 1, focus=True)
+        self.assertEqual(canv.cursor, None)
+
+    def test_attr_map_padding(self):
+        t = urwid.Text(u"\n".join([str(i) for i in range(10)]))
+        w = urwid.Padding(urwid.AttrMap(t, 'a'), left=2, right=1)
+        self.rtest(w, (8,), 4, 3)
+
+    def test_cached_full_canvas(self):
+        t = urwid.Text(u"a\nb\nc\nd")
+        full = t.render((3,))
+        canv = t.render_rows((3,), 1, 2)
+        self.assertEqual(canv.text, full.text[1:3])
+
+
+class TextLayoutWidthsTest(unittest.TestCase):
+    def setUp(self):
+        self.t = urwid.Text(u"alternating width probes")
+        self.calls = []
+        calc = self.t._calc_line_translation
+        def counting_calc(text, maxcol):
+            self.calls.append(maxcol)
+            return calc(text, maxcol)
+        self.t._calc_line_translation = counting_calc
+
+    def test_alternating_widths(self):
+        for i in range(3):
+            for width in (5, 10, 30):
+                self.t.rows((width,))
+                self.t.pack((width,))
+        self.assertEqual(self.calls, [5, 10, 30])
+        self.assertEqual(self.t.pack((10,)), (10, 3))
+
+    def test_oldest_discarded(self):
+        for width in range(5, 5 + self.t.layout_widths + 1):
+            self.t.rows((width,))
+        del self.calls[:]
+        self.t.rows((6,))
+        self.t.rows((5,))
+        self.assertEqual(self.calls, [5])
+
+    def test_invalidate(self):
+        self.t.rows((5,))
+        self.t.pack()
+        self.t.set_text(u"new")
+        self.assertEqual(self.t.pack(), (3, 1))
+        self.t.rows((5,))
+        self.t.set_layout('right', 'clip')
+        self.t.rows((5,))
+        self.assertEqual(self.calls, [5, 5, 5])
+
+
+class TextLayoutManyTest(unittest.TestCase):
+    def test_stores_translations(self):
+        widgets = [urwid.Text(u"one"), urwid.Text(u"two words", 'right'),
+            urwid.Edit(u"", u"edit"), urwid.Divider()]
+        urwid.Text.layout_many(widgets, 5)
+        for w in widgets[:2]:
+            self.assertEqual(w._cache_translations[5],
+                w._calc_line_translation(w.get_text()[0], 5))
+        # Edit lays out its text differently and is left alone
+        self.assertFalse(5 in widgets[2]._cache_translations)
+        self.assertEqual([w.rows((5,)) for w in widgets], [1, 2, 1, 1])
+
+
 class EditTest(unittest.TestCase):
     def setUp(self):
         self.t1 = urwid.Edit(B(""),"blah blah")
@@ -97,6 +187,128 @@ class EditTest(unittest.TestCase):
         self.assertEqual(self.t4.edit_text, u'û')
 
 
+class EditIncrementalLayoutTest(unittest.TestCase):
+    def full(self, e, maxcol, focus):
+        """
+        Return the text, cursor and rows rendered without
+        IncrementalLayout
+        """
+        f = urwid.Edit(e.caption, e.edit_text, multiline=False,
+            align=e.align, wrap=e.wrap)
+        f.multiline = True # keypress isn't used, only the layout
+        f._incremental_layout = lambda maxcol: None
+        f.set_edit_pos(e.edit_pos)
+        c = f.render((maxcol,), focus)
+        return c.text, c.cursor, f.rows((maxcol,))
+
+    def test_matches_full_layout(self):
+        for wrap in ('space', 'clip'):
+            # a fresh widget for each focus value, the cached Text
+            # canvas doesn't change with focus
+            for focus in (False, True):
+                e = urwid.Edit(u"> ", u"first line\nsecond line that is "
+                    u"long\n\nlast", multiline=True, wrap=wrap)
+                for pos in (0, 5, 11, 20, 35, len(e.edit_text)):
+                    e.set_edit_pos(pos)
+                    c = e.render((8,), focus)
+                    text, cursor, rows = self.full(e, 8, focus)
+                    self.assertEqual((c.text, c.cursor, e.rows((8,))),
+                        (text, cursor, rows))
+                    for first_row in range(rows - 1):
+                        c = e.render_rows((8,), first_row, 2, focus)
+                        self.assertEqual(c.text,
+                            text[first_row:first_row + 2])
+                e.insert_text(u"x\ny")
+                self.assertEqual(e.render((8,), focus).text,
+                    self.full(e, 8, focus)[0])
+
+    def test_typing_lays_out_one_line(self):
+        e = urwid.Edit(u"", u"\n".join([u"line %d" % i
+            for i in range(1000)]), multiline=True)
+        e.render_rows((20,), 0, 5, True)
+        il = e._line_layout
+        e.set_edit_pos(e.edit_text.index(u"line 500"))
+        e.insert_text(u"abc")
+        self.assertEqual(il.update(e.get_text()[0]), 1)
+        self.assertEqual(il.update(e.get_text()[0]), 0)
+        self.assertEqual(e.get_cursor_coords((20,)), (3, 500))
+        self.assertEqual(e.rows((20,)), 1000)
+
+
+class EditGapBufferTest(unittest.TestCase):
+    def test_same_as_string(self):
+        r = random.Random(7)
+        keys = ['a', 'b', ' ', 'enter', 'backspace', 'delete', 'left',
+            'right', 'up', 'down', 'home', 'end']
+        for multiline in (False, True):
+            e = urwid.Edit(u"> ", u"one\ntwo", multiline=multiline)
+            g = urwid.Edit(u"> ", u"one\ntwo", multiline=multiline,
+                gap_buffer=True)
+            for i in range(500):
+                key = r.choice(keys)
+                self.assertEqual(e.keypress((10,), key),
+                    g.keypress((10,), key))
+                self.assertEqual((e.edit_text, e.edit_pos),
+                    (g.edit_text, g.edit_pos))
+            self.assertEqual(e.render((10,), True).text,
+                g.render((10,), True).text)
+
+    def test_utf8_bytes(self):
+        urwid.set_encoding("utf-8")
+        e = urwid.Edit(B(""), B("\xe6\x9b\xbf\nx"), multiline=True,
+            gap_buffer=True)
+        e.set_edit_pos(4)
+        e.keypress((10,), 'left')
+        e.keypress((10,), 'left')
+        self.assertEqual(e.edit_pos, 0)
+        e.keypress((10,), 'right')
+        self.assertEqual(e.edit_pos, 3)
+        e.keypress((10,), 'backspace')
+        self.assertEqual(e.edit_text, B("\nx"))
+        e.insert_text(B("\xe6\x9b\xbf"))
+        e.set_edit_pos(0)
+        e.keypress((10,), 'delete')
+        self.assertEqual(e.edit_text, B("\nx"))
+
+    def test_typing_keeps_buffer(self):
+        e = urwid.Edit(u"", u"x" * 10000, gap_buffer=True)
+        e.set_edit_pos(5000)
+        e.keypress((20,), 'a')
+        e.keypress((20,), 'backspace')
+        e.keypress((20,), 'b')
+        # the text wasn't joined to make the changes
+        self.assertEqual(e._buffer._text, None)
+        self.assertEqual(e.edit_text[4999:5002], u"xbx")
+
+    def test_render_rows_keeps_buffer(self):
+        text = u"\n".join([u"line %d" % i for i in range(1000)])
+        e = urwid.Edit((u"c", u"> "), text, multiline=True)
+        g = urwid.Edit((u"c", u"> "), text, multiline=True,
+            gap_buffer=True)
+        for w in (e, g):
+            w.set_edit_pos(3000)
+            w.render_rows((8,), 0, 5, True)
+            w.keypress((8,), 'a')
+            w.keypress((8,), 'enter')
+        self.assertEqual(g._line_layout.update(g._line_layout.text), 0)
+        for first in (0, 450, 998):
+            self.assertEqual(
+                list(e.render_rows((8,), first, 3, True).content()),
+                list(g.render_rows((8,), first, 3, True).content()))
+        self.assertEqual(e.rows((8,)), g.rows((8,)))
+        # only the rendered rows were taken from the buffer
+        self.assertEqual(g._buffer._text, None)
+
+    def test_change_signal(self):
+        e = urwid.Edit(u"", u"abc", gap_buffer=True)
+        changes = []
+        urwid.connect_signal(e, 'change',
+            lambda w, text: changes.append((text, w.edit_text)))
+        e.keypress((20,), 'backspace')
+        e.keypress((20,), 'd')
+        self.assertEqual(changes, [(u"ab", u"abc"), (u"abd", u"ab")])
+
+
 class EditRenderTest(unittest.TestCase):
     def rtest(self, w, expected_text, expected_cursor):
         expected_text = [B(t) for t in expected_text]
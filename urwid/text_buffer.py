@@ -0,0 +1,315 @@
+#!/usr/bin/python
+#
+# Urwid text buffer for Edit widgets
+#    Copyright (C) 2004-2011  Ian Ward
+#
+#    This library is free software; you can redistribute it and/or
+#    modify it under the terms of the GNU Lesser General Public
+#    License as published by the Free Software Foundation; either
+#    version 2.1 of the License, or (at your option) any later version.
+#
+#    This library is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#    Lesser General Public License for more details.
+#
+#    You should have received a copy of the GNU Lesser General Public
+#    License along with this library; if not, write to the Free Software
+#    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+#
+# Urwid web site: http://excess.org/urwid/
+
+from bisect import bisect_left, bisect_right
+
+from urwid.compat import bytes
+
+
+# most characters kept in one string before and after the gap
+CHUNK_SIZE = 1024
+
+
+class GapBuffer(object):
+    """
+    Text stored as the characters before and after a gap, so that
+    inserting and deleting at the same place over and over only costs
+    as much as the text inserted or deleted and the distance the gap
+    moves.  The positions of the newlines are kept too, so lines can be
+    found without looking at the text.
+
+    The text on each side of the gap is kept as a list of strings of
+    up to about CHUNK_SIZE characters.  The strings after the gap are
+    kept in reverse order and the newlines after the gap by their
+    distance from the end of the text, so neither has to be updated
+    when the text before them changes.
+
+    >>> b = GapBuffer(u"hello\\nworld")
+    >>> b.insert(5, u" there")
+    >>> b.delete(0, 1)
+    >>> print b.text()
+    ello there
+    world
+    >>> print b[4:9]
+     ther
+    >>> b.line_count(), b.line_start(1), b.line_of(13)
+    (2, 11, 1)
+    """
+    def __init__(self, text=u""):
+        self.set_text(text)
+
+    def set_text(self, text):
+        """
+        Replace the whole contents of the buffer with text.
+        """
+        self._empty = text[:0]
+        self._newline = _newline_for(text)
+        self._before = [] # strings before the gap
+        self._before_starts = [] # offset of each string before the gap
+        self._before_len = 0
+        self._after = [] # strings after the gap, the closest last
+        self._after_dists = [] # distance from each string to the end
+        self._after_len = 0
+        self._before_lines = []
+        self._after_lines = []
+        self._text = None
+        self.insert(0, text)
+
+    def __len__(self):
+        return self._before_len + self._after_len
+
+    def __getitem__(self, index):
+        """
+        Return a character or a slice of the text without joining the
+        whole buffer.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return self.text()[index]
+            return self.get(start, stop)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("GapBuffer index out of range")
+        return self.get(index, index + 1)
+
+    def text(self):
+        """
+        Return the contents of the buffer as a string.  The string is
+        kept until the buffer is modified.
+        """
+        if self._text is None:
+            self._text = (self._empty.join(self._before) +
+                self._empty.join(reversed(self._after)))
+        return self._text
+
+    def get(self, start, end):
+        """
+        Return the text from start to end without joining the whole
+        buffer.
+        """
+        if self._text is not None:
+            return self._text[start:end]
+        total = len(self)
+        start = max(start, 0)
+        end = min(end, total)
+        if end <= start:
+            return self._empty
+        gap = self._before_len
+        parts = []
+        if start < gap:
+            before, starts = self._before, self._before_starts
+            stop = min(end, gap)
+            i = bisect_right(starts, start) - 1
+            while i < len(before) and starts[i] < stop:
+                s = starts[i]
+                parts.append(before[i][max(start - s, 0):stop - s])
+                i += 1
+        if end > gap:
+            after, dists = self._after, self._after_dists
+            first = max(start, gap)
+            # the string after the gap that contains first
+            j = bisect_left(dists, total - first)
+            while j >= 0:
+                s = total - dists[j]
+                if s >= end:
+                    break
+                parts.append(after[j][max(first - s, 0):end - s])
+                j -= 1
+        return self._empty.join(parts)
+
+    def _push_before(self, chunk):
+        before = self._before
+        if before and len(before[-1]) + len(chunk) <= CHUNK_SIZE:
+            before[-1] = before[-1] + chunk
+        else:
+            before.append(chunk)
+            self._before_starts.append(self._before_len)
+        self._before_len += len(chunk)
+
+    def _pop_before(self):
+        chunk = self._before.pop()
+        self._before_starts.pop()
+        self._before_len -= len(chunk)
+        return chunk
+
+    def _push_after(self, chunk):
+        after = self._after
+        self._after_len += len(chunk)
+        if after and len(after[-1]) + len(chunk) <= CHUNK_SIZE:
+            after[-1] = chunk + after[-1]
+            self._after_dists[-1] = self._after_len
+        else:
+            after.append(chunk)
+            self._after_dists.append(self._after_len)
+
+    def _pop_after(self):
+        chunk = self._after.pop()
+        self._after_dists.pop()
+        self._after_len -= len(chunk)
+        return chunk
+
+    def _move_gap(self, pos):
+        """
+        Move the gap so that it starts at pos.
+        """
+        gap = self._before_len
+        if pos == gap:
+            return
+        total = len(self)
+        if pos < gap:
+            while self._before_len > pos:
+                chunk = self._pop_before()
+                keep = pos - self._before_len
+                if keep > 0:
+                    self._push_before(chunk[:keep])
+                    chunk = chunk[keep:]
+                self._push_after(chunk)
+            i = bisect_left(self._before_lines, pos)
+            moved = self._before_lines[i:]
+            del self._before_lines[i:]
+            moved.reverse()
+            self._after_lines.extend([total - q for q in moved])
+        else:
+            while self._before_len < pos:
+                chunk = self._pop_after()
+                take = pos - self._before_len
+                if take < len(chunk):
+                    self._push_after(chunk[take:])
+                    chunk = chunk[:take]
+                self._push_before(chunk)
+            i = bisect_right(self._after_lines, total - pos)
+            moved = self._after_lines[i:]
+            del self._after_lines[i:]
+            moved.reverse()
+            self._before_lines.extend([total - d for d in moved])
+
+    def insert(self, pos, text):
+        """
+        Insert text at offset pos.
+        """
+        if not text:
+            return
+        self._move_gap(pos)
+        self._text = None
+        for i in range(0, len(text), CHUNK_SIZE):
+            self._push_before(text[i:i + CHUNK_SIZE])
+        nl = self._newline
+        i = text.find(nl)
+        while i >= 0:
+            self._before_lines.append(pos + i)
+            i = text.find(nl, i + 1)
+
+    def delete(self, start, end):
+        """
+        Delete the text from start to end.
+        """
+        if end <= start:
+            return
+        self._move_gap(end)
+        self._text = None
+        while self._before_len > start:
+            chunk = self._pop_before()
+            keep = start - self._before_len
+            if keep > 0:
+                self._push_before(chunk[:keep])
+        del self._before_lines[bisect_left(self._before_lines, start):]
+
+    def replace(self, start, end, text):
+        """
+        Replace the text from start to end with text.
+        """
+        self.delete(start, end)
+        self.insert(start, text)
+
+    def line_count(self):
+        """
+        Return the number of lines, one more than the number of
+        newlines.
+        """
+        return len(self._before_lines) + len(self._after_lines) + 1
+
+    def line_start(self, line):
+        """
+        Return the offset of the first character of line.
+        """
+        if line == 0:
+            return 0
+        k = line - 1
+        if k < len(self._before_lines):
+            return self._before_lines[k] + 1
+        return len(self) - self._after_lines[
+            len(self._before_lines) - k - 1] + 1
+
+    def line_of(self, pos):
+        """
+        Return the line that offset pos is on.
+        """
+        after = self._after_lines
+        return (bisect_left(self._before_lines, pos) + len(after) -
+            bisect_right(after, len(self) - pos))
+
+
+class TextView(object):
+    """
+    Read-only view of a prefix followed by the contents of a
+    :class:`GapBuffer`, supporting len() and slicing, so that parts of
+    the text can be laid out and rendered without joining the whole
+    buffer.
+
+    >>> v = TextView(u"> ", GapBuffer(u"one\\ntwo"))
+    >>> len(v)
+    9
+    >>> print v[1:5]
+     one
+    """
+    def __init__(self, prefix, buffer):
+        self.prefix = prefix
+        self.buffer = buffer
+
+    def __len__(self):
+        return len(self.prefix) + len(self.buffer)
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError("TextView index out of range")
+            return self[index:index + 1]
+        start, stop, step = index.indices(len(self))
+        if step != 1:
+            return (self.prefix + self.buffer.text())[index]
+        n = len(self.prefix)
+        if stop <= n:
+            return self.prefix[start:stop]
+        return self.prefix[start:stop] + self.buffer.get(max(start - n, 0),
+            stop - n)
+
+
+def _newline_for(text):
+    """
+    Return a newline of the same string type as text.
+    """
+    if isinstance(text, bytes):
+        return "\n".encode('ascii')
+    return u"\n"
@@ -20,10 +20,20 @@
 # Urwid web site: http://excess.org/urwid/
 
 from urwid.util import calc_width, calc_text_pos, calc_trim_text, is_wide_char, \
-    move_prev_char, move_next_char
+    move_prev_char, move_next_char, get_encoding_mode, LRUCache, \
+    clear_column_indexes
 from urwid.compat import bytes, PYTHON3, B
+from bisect import bisect_right
 
 class TextLayout:
+    # set to True in layout classes that always return the same layout
+    # for the same parameters, so layouts may be shared with LayoutCache
+    cache_layouts = False
+    # set to True in layout classes where the layout of each line of
+    # text only depends on that line, so lines may be laid out
+    # separately with IncrementalLayout
+    lines_independent = False
+
     def supports_align_mode(self, align):
         """Return True if align is a supported align mode."""
         return True
@@ -54,11 +64,24 @@ class TextLayout:
         """
         raise NotImplementedError("This function must be overridden by a real"
             " text layout class. (see StandardTextLayout)")
+    def layout_many(self, texts, width, align, wrap):
+        """
+        Return a list of layout structures, one for each string in
+        texts, all laid out for the same width, align and wrap modes.
+
+        This implementation calls :meth:`layout` for each string.
+        Layout classes may override it to lay out many strings at
+        once, e.g. with a vectorized or C implementation.
+        """
+        return [self.layout(text, width, align, wrap) for text in texts]
 
 class CanNotDisplayText(Exception):
     pass
 
 class StandardTextLayout(TextLayout):
+    cache_layouts = True
+    lines_independent = True
+
     def __init__(self):#, tab_stops=(), tab_stop_every=8):
         pass
         #"""
@@ -84,6 +107,47 @@ class StandardTextLayout(TextLayout):
         except CanNotDisplayText:
             return [[]]
 
+    def layout_many(self, texts, width, align, wrap):
+        """
+        Return a list of layout structures, one for each string in
+        texts.
+
+        Strings that are a single line that fits in width (or any
+        single line when clipping) are the common case in long lists,
+        and are laid out here directly.  Others are passed to
+        :meth:`layout`.
+
+        >>> default_layout.layout_many([u"one", u"two three"], 5,
+        ...     'right', 'space')
+        [[[(2, None), (3, 0, 3), (0, 3)]], [[(2, None), (3, 0, 3), (0, 3)], [(5, 4, 9), (0, 9)]]]
+        """
+        out = []
+        append = out.append
+        layout = self.layout
+        clip = wrap == 'clip'
+        u_nl, b_nl = u"\n", B("\n")
+        for text in texts:
+            n = len(text)
+            if (b_nl if isinstance(text, bytes) else u_nl) in text:
+                append(layout(text, width, align, wrap))
+                continue
+            sc = calc_width(text, 0, n)
+            if (sc > width and not clip) or (sc == 0 and n):
+                append(layout(text, width, align, wrap))
+                continue
+            if n:
+                line = [(sc, 0, n), (0, n)]
+            else:
+                line = [(0, 0)]
+            if sc != width and align != 'left':
+                # same as align_layout()
+                if align == 'right':
+                    line.insert(0, (width - sc, None))
+                else:
+                    line.insert(0, ((width - sc + 1) // 2, None))
+            append([line])
+        return out
+
     def pack(self, maxcol, layout):
         """
         Return a minimal maxcol value that would result in the same
@@ -251,6 +315,181 @@ default_layout = StandardTextLayout()
 ######################################
 
 
+class LayoutCache(object):
+    """
+    Size-bounded cache of layout structures shared by all Text widgets,
+    so that the same text shown at the same width in many widgets, or
+    again after a resize, is only laid out once.
+
+    Only layouts from layout objects with a true ``cache_layouts``
+    attribute are cached, and only for texts up to max_text_length
+    characters.  Cached layout structures are shared and must not be
+    modified.
+
+    >>> c = LayoutCache()
+    >>> c.layout(default_layout, u"OK", 5, 'left', 'space')
+    [[(2, 0, 2), (0, 2)]]
+    >>> c.layout(default_layout, u"OK", 5, 'left', 'space')
+    [[(2, 0, 2), (0, 2)]]
+    >>> (c.hits, c.misses)
+    (1, 1)
+    """
+    def __init__(self, max_entries=4096, max_text_length=1024):
+        """
+        max_entries -- maximum number of layouts and pack results kept
+        max_text_length -- longer texts are laid out without caching
+        """
+        self._cache = LRUCache(max_items=max_entries)
+        self.max_text_length = max_text_length
+        self.hits = 0
+        self.misses = 0
+
+    def set_limits(self, max_entries=None, max_text_length=None):
+        """
+        Change the limits of this cache, discarding entries if
+        necessary.  None leaves a limit unchanged.
+        """
+        if max_entries is not None:
+            self._cache.set_limits(max_items=max_entries)
+        if max_text_length is not None:
+            self.max_text_length = max_text_length
+
+    def clear(self):
+        """
+        Discard all cached entries and reset the statistics.  The
+        column indexes kept for long lines of text are discarded too.
+        """
+        self._cache = LRUCache(max_items=self._cache.max_items)
+        clear_column_indexes()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._cache)
+
+    def hit_rate(self):
+        """
+        Return the fraction of lookups answered from the cache, or
+        None if there were no lookups.
+        """
+        lookups = self.hits + self.misses
+        if not lookups:
+            return None
+        return float(self.hits) / lookups
+
+    def _key(self, kind, layout, text, width, align, wrap):
+        """
+        Return the cache key for these parameters or None if they
+        can't be cached.
+        """
+        if (not getattr(layout, 'cache_layouts', False) or
+                len(text) > self.max_text_length):
+            return None
+        # type(text) before text: byte and unicode strings may compare
+        # equal but are laid out differently
+        return (kind, layout, type(text), text, width, align, wrap,
+            get_encoding_mode())
+
+    def layout(self, layout, text, width, align, wrap):
+        """
+        Return layout.layout(text, width, align, wrap), using a cached
+        layout structure when possible.
+        """
+        key = self._key('layout', layout, text, width, align, wrap)
+        if key is None:
+            return layout.layout(text, width, align, wrap)
+        trans = self._cache.get(key)
+        if trans is not None:
+            self.hits += 1
+            return trans
+        self.misses += 1
+        trans = layout.layout(text, width, align, wrap)
+        self._cache.store(key, trans)
+        return trans
+
+    def layout_many(self, layout, texts, width, align, wrap):
+        """
+        Return a list of layout structures for texts, using cached
+        layout structures when possible and passing the rest to
+        layout.layout_many() together.  New layouts are not stored when
+        there are more texts than the cache can hold.
+        """
+        if hasattr(layout, 'layout_many'):
+            layout_many = layout.layout_many
+        else:
+            layout_many = lambda texts, width, align, wrap: [
+                layout.layout(text, width, align, wrap) for text in texts]
+        if not getattr(layout, 'cache_layouts', False):
+            return layout_many(texts, width, align, wrap)
+
+        # same keys as _key(), with the encoding mode looked up once
+        mode = get_encoding_mode()
+        max_text_length = self.max_text_length
+        get = self._cache.get
+        out = []
+        missing = []
+        keys = []
+        for text in texts:
+            key = None
+            trans = None
+            if len(text) <= max_text_length:
+                key = ('layout', layout, type(text), text, width, align,
+                    wrap, mode)
+                trans = get(key)
+            if trans is None:
+                missing.append(text)
+                keys.append((len(out), key))
+            out.append(trans)
+        self.misses += len(missing)
+        self.hits += len(texts) - len(missing)
+        if not missing:
+            return out
+
+        max_items = self._cache.max_items
+        store = max_items is None or len(missing) <= max_items
+        for (i, key), trans in zip(keys, layout_many(missing, width, align,
+                wrap)):
+            out[i] = trans
+            if store and key is not None:
+                self._cache.store(key, trans)
+        return out
+
+    def pack(self, layout, text, width, align, wrap):
+        """
+        Return the (columns, rows) required to display text without
+        wrapping or clipping within width screen columns, or with
+        unlimited columns if width is None.  This is the value returned
+        by :meth:`Text.pack`.
+        """
+        key = self._key('pack', layout, text, width, align, wrap)
+        if key is not None:
+            result = self._cache.get(key)
+            if result is not None:
+                self.hits += 1
+                return result
+            self.misses += 1
+
+        if width is not None:
+            trans = self.layout(layout, text, width, align, wrap)
+            result = (layout.pack(width, trans), len(trans))
+        else:
+            i = 0
+            cols = 0
+            while i < len(text):
+                j = text.find('\n', i)
+                if j == -1:
+                    j = len(text)
+                cols = max(cols, calc_width(text, i, j))
+                i = j+1
+            result = (cols, text.count('\n') + 1)
+        if key is not None:
+            self._cache.store(key, result)
+        return result
+
+# layout cache used by Text widgets
+layout_cache = LayoutCache()
+
+
 class LayoutSegment:
     def __init__(self, seg):
         """Create object from line layout segment structure"""
@@ -350,6 +589,28 @@ def shift_line( segs, amount ):
     return segs
 
 
+def shift_offsets( segs, amount ):
+    """
+    Return a line from a layout structure with its text offsets moved
+    by amount.
+    segs -- line of a layout structure
+    amount -- number of characters to add to each offset
+    """
+    if not amount:
+        return segs
+    out = []
+    for seg in segs:
+        if len(seg) == 2:
+            if seg[1] is not None:
+                seg = (seg[0], seg[1] + amount)
+        elif type(seg[2]) == int:
+            seg = (seg[0], seg[1] + amount, seg[2] + amount)
+        else:
+            seg = (seg[0], seg[1] + amount, seg[2])
+        out.append(seg)
+    return out
+
+
 def trim_line( segs, text, start, end ):
     """
     Return a trimmed line of a text layout structure.
@@ -504,3 +765,223 @@ def calc_coords( text, layout, pos, clamp=1 ):
     if closest:
         return closest[1]
     return 0,0
+
+
+def _common_prefix_length(a, b):
+    """
+    Return the length of the common prefix of strings a and b.
+    """
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+def _common_suffix_length(a, b, limit):
+    """
+    Return the length of the common suffix of strings a and b, up to
+    limit characters.
+    """
+    lo, hi = 0, min(len(a), len(b), limit)
+    la, lb = len(a), len(b)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[la - mid:la - lo] == b[lb - mid:lb - lo]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+class IncrementalLayout(object):
+    """
+    Layout of a text that is kept up to date as the text changes by
+    laying out again only the lines of text that changed.
+
+    This is only possible with layout objects that have a true
+    ``lines_independent`` attribute.
+
+    The text may be a string or any object that supports len() and
+    slicing, like :class:`urwid.text_buffer.TextView`.  Only the parts
+    of the text being laid out or located are sliced from it.
+
+    >>> l = IncrementalLayout(default_layout, 5, 'left', 'space')
+    >>> l.update(u"one\\ntwo three")
+    2
+    >>> l.update(u"one\\ntwo four")
+    1
+    >>> l.rows()
+    3
+    >>> l.coords(12)
+    (4, 2)
+    """
+    def __init__(self, layout, width, align, wrap):
+        self.layout = layout
+        self.width = width
+        self.align = align
+        self.wrap = wrap
+        self.text = None
+        self.failed = False
+        self._length = 0
+        self._starts = [] # offset of the first character of each line
+        self._lines = [] # layout of each line relative to its offset
+        self._first_rows = [] # first row of each line
+        self._rows = 0
+        self._translation = None
+
+    def _layout_lines(self, text, start, end):
+        """
+        Return the offsets and layouts of the lines in text[start:end].
+        """
+        text = text[start:end]
+        nl = '\n'
+        if PYTHON3 and isinstance(text, bytes):
+            nl = B(nl)
+        starts = []
+        lines = []
+        for line in text.split(nl):
+            trans = self.layout.layout(line, self.width, self.align,
+                self.wrap)
+            if trans == [[]] and line:
+                # CanNotDisplayText: the layout of the whole text is
+                # empty, not only this line
+                self.failed = True
+            starts.append(start)
+            lines.append(trans)
+            start += len(line) + 1
+        return starts, lines
+
+    def update(self, text, prefix=None, suffix=None):
+        """
+        Bring the layout up to date with text and return the number of
+        lines of text that had to be laid out.
+
+        When the caller knows that only the text between the first
+        prefix and the last suffix characters has changed it may pass
+        them, otherwise the old and new text are compared to find the
+        change.  The old text must then be a string.
+        """
+        old = self.text
+        if prefix is None:
+            if old is text or (type(old) == type(text) and old == text):
+                return 0
+        elif (old is not None and not self.failed and
+                type(old) == type(text) and
+                prefix + suffix >= self._length == len(text)):
+            # nothing changed
+            self.text = text
+            return 0
+        old_length = self._length
+        self.text = text
+        self._length = len(text)
+        self._translation = None
+        if old is None or type(old) != type(text) or self.failed:
+            self.failed = False
+            starts, lines = self._layout_lines(text, 0, len(text))
+            self._starts = starts
+            self._lines = lines
+            self._first_rows = []
+            row = 0
+            for trans in lines:
+                self._first_rows.append(row)
+                row += len(trans)
+            self._rows = row
+            return len(lines)
+
+        # lay out the lines from the first change to the last change
+        limit = min(old_length, len(text))
+        if prefix is None:
+            prefix = _common_prefix_length(old, text)
+            suffix = _common_suffix_length(old, text, limit - prefix)
+        else:
+            prefix = min(prefix, limit)
+            suffix = min(suffix, limit - prefix)
+        first = bisect_right(self._starts, prefix) - 1
+        last = bisect_right(self._starts, old_length - suffix) - 1
+        delta = len(text) - old_length
+        start = self._starts[first]
+        if last + 1 < len(self._starts):
+            end = self._starts[last + 1] - 1 + delta
+        else:
+            end = len(text)
+        starts, lines = self._layout_lines(text, start, end)
+        row = self._first_rows[first]
+        first_rows = []
+        for trans in lines:
+            first_rows.append(row)
+            row += len(trans)
+
+        if last + 1 < len(self._starts):
+            row_delta = row - self._first_rows[last + 1]
+        else:
+            row_delta = row - self._rows
+        after = last + 1
+        self._starts[first:] = starts + [s + delta
+            for s in self._starts[after:]]
+        self._lines[first:after] = lines
+        self._first_rows[first:] = first_rows + [r + row_delta
+            for r in self._first_rows[after:]]
+        self._rows += row_delta
+        return len(lines)
+
+    def rows(self):
+        """
+        Return the number of rows in the layout.
+        """
+        return self._rows
+
+    def translation(self):
+        """
+        Return the layout structure of the whole text.
+        """
+        if self._translation is None:
+            trans = []
+            for start, lines in zip(self._starts, self._lines):
+                for line in lines:
+                    trans.append(shift_offsets(line, start))
+            self._translation = trans
+        return self._translation
+
+    def translation_rows(self, first_row, num_rows):
+        """
+        Return the layout structure of rows first_row to
+        first_row + num_rows - 1 only.
+        """
+        if self._translation is not None:
+            return self._translation[first_row:first_row + num_rows]
+        trans = []
+        end_row = first_row + num_rows
+        i = max(0, bisect_right(self._first_rows, first_row) - 1)
+        while i < len(self._lines) and self._first_rows[i] < end_row:
+            start = self._starts[i]
+            row = self._first_rows[i]
+            for line in self._lines[i][max(0, first_row - row):
+                    end_row - row]:
+                trans.append(shift_offsets(line, start))
+            i += 1
+        return trans
+
+    def coords(self, pos, shift=0):
+        """
+        Return the (x, y) coordinates closest to position pos in the
+        text, the same value as calc_coords() with the whole layout.
+        When shift is given the row containing pos is first shifted by
+        that many columns with shift_line().
+        """
+        i = max(0, bisect_right(self._starts, pos) - 1)
+        start = self._starts[i]
+        if i + 1 < len(self._starts):
+            end = self._starts[i + 1] - 1
+        else:
+            end = self._length
+        line = self.text[start:end]
+        lines = self._lines[i]
+        x, y = calc_coords(line, lines, pos - start)
+        if shift:
+            x, ignore = calc_coords(line, [shift_line(lines[y], shift)],
+                pos - start)
+        return x, self._first_rows[i] + y
+
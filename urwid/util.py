@@ -21,21 +21,229 @@
 # Urwid web site: http://excess.org/urwid/
 
 from urwid import escape
-from urwid.compat import bytes
+from urwid.compat import bytes, B, ord2
+from urwid.old_str_util import widths
 
 import codecs
+import re
+import sys
+from bisect import bisect_right
 
 str_util = escape.str_util
 
 # bring str_util functions into our namespace
-calc_text_pos = str_util.calc_text_pos
-calc_width = str_util.calc_width
-is_wide_char = str_util.is_wide_char
-move_next_char = str_util.move_next_char
-move_prev_char = str_util.move_prev_char
 within_double_byte = str_util.within_double_byte
 
 
+def _narrow_char_ranges():
+    """
+    Return a regular expression character class body matching the
+    characters that are one screen column wide.
+    """
+    ranges = []
+    low = 0
+    for num, wid in widths:
+        if wid == 1:
+            ranges.append((low, min(num, sys.maxunicode)))
+        low = num + 1
+        if low > sys.maxunicode:
+            break
+    return u"".join([u"%s-%s" % (re.escape(unichr(low)),
+        re.escape(unichr(high))) for low, high in ranges])
+
+_NARROW_RE = re.compile(u"^[%s]*$" % _narrow_char_ranges())
+_NARROW_BYTES_RE = re.compile(B("^[\x00-\x0d\x10-\x7e]*$"))
+
+_narrow_cache = {}
+# strings shorter than this are checked every time
+_NARROW_CACHE_MIN_LENGTH = 32
+_NARROW_CACHE_MAX_ITEMS = 256
+
+def is_narrow_text(text):
+    """
+    Return True if every character in text is one screen column wide,
+    so offsets into text and screen columns are the same.  Only pure
+    ASCII byte strings count as narrow, because the width of other
+    bytes depends on the byte encoding.
+
+    The result for long strings is remembered, so checking the same
+    text again is cheap.
+
+    >>> is_narrow_text(u"caf\xe9"), is_narrow_text(u"\u66ff")
+    (True, False)
+    """
+    if len(text) < _NARROW_CACHE_MIN_LENGTH:
+        if isinstance(text, bytes):
+            return _NARROW_BYTES_RE.match(text) is not None
+        return _NARROW_RE.match(text) is not None
+    try:
+        return _narrow_cache[text]
+    except KeyError:
+        pass
+    if isinstance(text, bytes):
+        narrow = _NARROW_BYTES_RE.match(text) is not None
+    else:
+        narrow = _NARROW_RE.match(text) is not None
+    if len(_narrow_cache) >= _NARROW_CACHE_MAX_ITEMS:
+        _narrow_cache.clear()
+    _narrow_cache[text] = narrow
+    return narrow
+
+class ColumnIndex(object):
+    """
+    Screen columns of a long string sampled every few characters, so
+    the width of any part of the string or the offset of any column
+    can be found without scanning it from the start.
+
+    >>> i = ColumnIndex(u"\u66ff" * 300 + u"abc", step=64)
+    >>> i.calc_width(10, 303), i.calc_text_pos(10, 303, 401)
+    (583, (210, 400))
+    """
+    def __init__(self, text, step=64):
+        """
+        text -- unicode or a byte string in the target byte encoding
+        step -- number of characters (or bytes) between samples
+        """
+        self.text = text
+        utf8 = isinstance(text, bytes) and (
+            str_util.get_byte_encoding() == "utf8")
+        offsets = [0]
+        cols = [0]
+        pos, col, end = 0, 0, len(text)
+        while pos < end:
+            next = min(pos + step, end)
+            if utf8:
+                # samples have to be at the start of a character
+                while next < end and ord2(text[next]) & 0xc0 == 0x80:
+                    next += 1
+            col += str_util.calc_width(text, pos, next)
+            offsets.append(next)
+            cols.append(col)
+            pos = next
+        self._offsets = offsets
+        self._cols = cols
+
+    def column_at(self, pos):
+        """
+        Return the screen column of offset pos.
+        """
+        k = bisect_right(self._offsets, pos) - 1
+        return self._cols[k] + str_util.calc_width(self.text,
+            self._offsets[k], pos)
+
+    def calc_width(self, start_offs, end_offs):
+        """
+        Same as calc_width() for this text.
+        """
+        return self.column_at(end_offs) - self.column_at(start_offs)
+
+    def calc_text_pos(self, start_offs, end_offs, pref_col):
+        """
+        Same as calc_text_pos() for this text.
+        """
+        offsets, cols = self._offsets, self._cols
+        ks = bisect_right(offsets, start_offs) - 1
+        start_col = cols[ks] + str_util.calc_width(self.text,
+            offsets[ks], start_offs)
+        target = start_col + pref_col
+        # skip to the last sample that doesn't pass the column we want
+        k = min(bisect_right(cols, target), bisect_right(offsets,
+            end_offs)) - 1
+        if k <= ks:
+            pos, col = start_offs, start_col
+        else:
+            pos, col = offsets[k], cols[k]
+        pos, sc = str_util.calc_text_pos(self.text, pos, end_offs,
+            target - col)
+        return pos, col + sc - start_col
+
+
+_column_indexes = {}
+# spans shorter than this are measured directly
+COLUMN_INDEX_MIN_LENGTH = 512
+_COLUMN_INDEX_MAX_ITEMS = 32
+
+def column_index(text):
+    """
+    Return a cached ColumnIndex for text, or None if measuring text
+    directly is just as fast.
+    """
+    if len(text) < COLUMN_INDEX_MIN_LENGTH or is_narrow_text(text):
+        return None
+    if isinstance(text, bytes) and str_util.get_byte_encoding() != "utf8":
+        # widths of "narrow" and "wide" text come from byte offsets
+        return None
+    try:
+        return _column_indexes[text]
+    except KeyError:
+        pass
+    if len(_column_indexes) >= _COLUMN_INDEX_MAX_ITEMS:
+        _column_indexes.clear()
+    index = ColumnIndex(text)
+    _column_indexes[text] = index
+    return index
+
+def clear_column_indexes():
+    """
+    Discard the cached ColumnIndex objects.
+    """
+    _column_indexes.clear()
+
+def calc_text_pos(text, start_offs, end_offs, pref_col):
+    """
+    Return (position, actual_col) for the closest position to screen
+    column pref_col in text, where start_offs is the offset into text
+    assumed to be column 0 and end_offs is the end of the range to search.
+    """
+    if pref_col >= 0 and is_narrow_text(text):
+        pos = start_offs + pref_col
+        if pos >= end_offs:
+            return end_offs, end_offs - start_offs
+        return pos, pref_col
+    if pref_col >= COLUMN_INDEX_MIN_LENGTH:
+        index = column_index(text)
+        if index is not None:
+            return index.calc_text_pos(start_offs, end_offs, pref_col)
+    return str_util.calc_text_pos(text, start_offs, end_offs, pref_col)
+
+def calc_width(text, start_offs, end_offs):
+    """
+    Return the screen column width of text between start_offs and
+    end_offs.
+    """
+    if is_narrow_text(text):
+        return end_offs - start_offs
+    if end_offs - start_offs >= COLUMN_INDEX_MIN_LENGTH:
+        index = column_index(text)
+        if index is not None:
+            return index.calc_width(start_offs, end_offs)
+    return str_util.calc_width(text, start_offs, end_offs)
+
+def is_wide_char(text, offs):
+    """
+    Return True if the character at offs within text is wide.
+    """
+    if is_narrow_text(text):
+        return False
+    return str_util.is_wide_char(text, offs)
+
+def move_next_char(text, start_offs, end_offs):
+    """
+    Return the position of the character after start_offs.
+    """
+    if is_narrow_text(text):
+        return start_offs + 1
+    return str_util.move_next_char(text, start_offs, end_offs)
+
+def move_prev_char(text, start_offs, end_offs):
+    """
+    Return the position of the character before end_offs.
+    """
+    if is_narrow_text(text):
+        return end_offs - 1
+    return str_util.move_prev_char(text, start_offs, end_offs)
+
+
 def detect_encoding():
     # Try to determine if using a supported double-byte encoding
     import locale
@@ -59,6 +267,9 @@ else:
 
 _target_encoding = None
 _use_dec_special = True
+# True when the target encoding leaves ASCII text unchanged
+_ascii_target = False
+_ASCII_CHARS = u"".join([unichr(i) for i in range(128)])
 
 
 def set_encoding( encoding ):
@@ -68,7 +279,7 @@ def set_encoding( encoding ):
     """
     encoding = encoding.lower()
 
-    global _target_encoding, _use_dec_special
+    global _target_encoding, _use_dec_special, _ascii_target
 
     if encoding in ( 'utf-8', 'utf8', 'utf' ):
         str_util.set_byte_encoding("utf8")
@@ -85,6 +296,8 @@ def set_encoding( encoding ):
     else:
         str_util.set_byte_encoding("narrow")
         _use_dec_special = True
+    # indexes of byte strings depend on the byte encoding
+    clear_column_indexes()
 
     # if encoding is valid for conversion from unicode, remember it
     _target_encoding = 'ascii'
@@ -93,6 +306,8 @@ def set_encoding( encoding ):
             u"".encode(encoding)
             _target_encoding = encoding
     except LookupError: pass
+    _ascii_target = (codecs.encode(_ASCII_CHARS, _target_encoding,
+        'replace') == _ASCII_CHARS.encode('ascii'))
 
 
 def get_encoding_mode():
@@ -104,6 +319,34 @@ def get_encoding_mode():
     return str_util.get_byte_encoding()
 
 
+_SO_BYTE = escape.SO.encode('ascii')
+_SI_BYTE = escape.SI.encode('ascii')
+
+def plain_target_text(s):
+    """
+    Return s as a byte string if apply_target_encoding() would return
+    it unchanged with a single default character set run, otherwise
+    None.  That is the case for byte strings and ASCII unicode strings
+    (when the target encoding is ASCII compatible) without shift in or
+    shift out characters.  Slices of the result are then the encoded
+    slices of s, so s only has to be checked once.
+
+    >>> plain_target_text(B("abc")) == B("abc")
+    True
+    >>> plain_target_text(B("a\x0eq\x0fb")) is None
+    True
+    """
+    if type(s) == unicode:
+        if not _ascii_target:
+            return None
+        try:
+            s = s.encode('ascii')
+        except UnicodeError:
+            return None
+    if _SO_BYTE in s or _SI_BYTE in s:
+        return None
+    return s
+
 def apply_target_encoding( s ):
     """
     Return (encoded byte string, character set rle).
@@ -472,3 +715,149 @@ class StoppingContext(object):
 
     def __exit__(self, *exc_info):
         self._wrapped.stop()
+
+
+class LRUCache(object):
+    """
+    Mapping that discards its least recently used items to stay within
+    an item count and/or total cost budget.
+
+    max_items -- maximum number of items to keep, or None for no limit
+    max_cost -- maximum total cost of items to keep, or None for no limit
+    on_discard -- function called with (key, value) for each item
+        discarded to stay within the limits, or None
+
+    Each item is given a cost when it is stored (default 1).  Looking
+    up an item with get() or touch() marks it as most recently used.
+
+    >>> c = LRUCache(max_items=2)
+    >>> c.store('a', 1)
+    >>> c.store('b', 2)
+    >>> c.get('a')
+    1
+    >>> c.store('c', 3)
+    >>> sorted(c.keys())
+    ['a', 'c']
+    """
+    def __init__(self, max_items=None, max_cost=None, on_discard=None):
+        # each link is [prev, next, key, value, cost]
+        self._root = root = []
+        root[:] = [root, root, None, None, 0]
+        self._links = {}
+        self.cost = 0
+        self.on_discard = on_discard
+        self.set_limits(max_items, max_cost)
+
+    def set_limits(self, max_items=None, max_cost=None):
+        """
+        Change the limits of this cache, discarding items if necessary.
+        """
+        self.max_items = max_items
+        self.max_cost = max_cost
+        self._shrink()
+
+    def __len__(self):
+        return len(self._links)
+
+    def __contains__(self, key):
+        return key in self._links
+
+    def keys(self):
+        """Return keys from least to most recently used."""
+        out = []
+        link = self._root[1]
+        while link is not self._root:
+            out.append(link[2])
+            link = link[1]
+        return out
+
+    def _move_to_end(self, link):
+        root = self._root
+        prev, next = link[0], link[1]
+        prev[1] = next
+        next[0] = prev
+        last = root[0]
+        last[1] = root[0] = link
+        link[0] = last
+        link[1] = root
+
+    def touch(self, key):
+        """
+        Mark key as most recently used.  Return True if key was found.
+        """
+        link = self._links.get(key)
+        if link is None:
+            return False
+        self._move_to_end(link)
+        return True
+
+    def get(self, key, default=None):
+        """
+        Return the value stored for key, marking it as most recently used.
+        """
+        link = self._links.get(key)
+        if link is None:
+            return default
+        self._move_to_end(link)
+        return link[3]
+
+    def store(self, key, value, cost=1):
+        """
+        Store value for key as the most recently used item, then discard
+        old items until the limits are satisfied.  An item whose cost
+        exceeds max_cost on its own is not kept.
+        """
+        link = self._links.get(key)
+        if link is not None:
+            self.cost -= link[4]
+            link[3] = value
+            link[4] = cost
+            self._move_to_end(link)
+        else:
+            root = self._root
+            last = root[0]
+            link = [last, root, key, value, cost]
+            last[1] = root[0] = link
+            self._links[key] = link
+        self.cost += cost
+        self._shrink()
+
+    def pop(self, key, default=None):
+        """
+        Remove key and return its value, or default if not found.
+        """
+        link = self._links.pop(key, None)
+        if link is None:
+            return default
+        prev, next = link[0], link[1]
+        prev[1] = next
+        next[0] = prev
+        self.cost -= link[4]
+        return link[3]
+
+    def discard_oldest(self):
+        """
+        Remove the least recently used item and return (key, value).
+        """
+        link = self._root[1]
+        if link is self._root:
+            raise KeyError("LRUCache is empty")
+        key, value = link[2], link[3]
+        self.pop(key)
+        return key, value
+
+    def _shrink(self):
+        while self._links and (
+                (self.max_items is not None
+                    and len(self._links) > self.max_items) or
+                (self.max_cost is not None and self.cost > self.max_cost)):
+            key, value = self.discard_oldest()
+            if self.on_discard is not None:
+                self.on_discard(key, value)
+
+    def clear(self):
+        """Remove all items."""
+        root = self._root
+        root[:] = [root, root, None, None, 0]
+        self._links = {}
+        self.cost = 0
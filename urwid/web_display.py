@@ -643,6 +643,9 @@ class Screen:
         self._set_screen_size( x, y )
         self.last_screen = {}
         self.last_screen_width = 0
+        self._last_canvas = None
+        self._last_sigs = []
+        self._last_cursor_row = None
 
         self.update_method = os.environ["HTTP_X_URWID_METHOD"]
         assert self.update_method in ("multipart","polling")
@@ -773,17 +776,36 @@ class Screen:
         else:
             cx = cy = None
 
+        damaged = None
+        if (self._last_canvas is not None and self.last_screen and
+                len(self._last_sigs) == rows):
+            # rows outside the damaged areas are the same as the line
+            # with the same number on the client, except that the
+            # cursor is drawn as part of its line
+            damaged = r.damaged_rows(self._last_canvas)
+            for y in (cy, self._last_cursor_row):
+                if y is not None and y < rows:
+                    damaged[y] = True
+
         new_screen = {}
+        sigs = []
 
         y = -1
         for row in r.content():
             y += 1
+            if damaged is not None and not damaged[y]:
+                sig = self._last_sigs[y]
+                sigs.append(sig)
+                new_screen[sig] = new_screen.get(sig,[]) + [y]
+                send( "<%d\n"%y )
+                continue
             row = list(row)
 
             l = []
 
             sig = tuple(row)
             if y == cy: sig = sig + (cx,)
+            sigs.append(sig)
             new_screen[sig] = new_screen.get(sig,[]) + [y]
             old_line_numbers = self.last_screen.get(sig, None)
             if old_line_numbers is not None:
@@ -816,6 +838,9 @@ class Screen:
             send("".join(l)+"\n")
         self.last_screen = new_screen
         self.last_screen_width = cols
+        self._last_canvas = r
+        self._last_sigs = sigs
+        self._last_cursor_row = cy
 
         if self.update_method == "polling":
             sys.stdout.write("".join(sendq))
@@ -22,12 +22,15 @@
 from operator import attrgetter
 
 from urwid.util import (MetaSuper, decompose_tagmarkup, calc_width,
-    is_wide_char, move_prev_char, move_next_char)
-from urwid.text_layout import calc_pos, calc_coords, shift_line
+    is_wide_char, move_prev_char, move_next_char, rle_subseg)
+from urwid.text_layout import calc_pos, calc_coords, shift_line, \
+    shift_offsets, IncrementalLayout, _common_prefix_length, \
+    _common_suffix_length
 from urwid import signals
 from urwid import text_layout
+from urwid.text_buffer import GapBuffer, TextView
 from urwid.canvas import (CanvasCache, CompositeCanvas, SolidCanvas,
-    apply_text_layout)
+    TextCanvas, apply_text_layout)
 from urwid.command_map import (command_map, CURSOR_LEFT, CURSOR_RIGHT,
     CURSOR_UP, CURSOR_DOWN, CURSOR_MAX_LEFT, CURSOR_MAX_RIGHT)
 from urwid.split_repr import split_repr, remove_defaults, python3_repr
@@ -69,11 +72,15 @@ class WidgetMeta(MetaSuper, signals.MetaSignals):
     """
     Bases: :class:`MetaSuper`, :class:`MetaSignals`
 
-    Automatic caching of render and rows methods.
+    Automatic caching of render, render_rows and rows methods.
 
     Class variable *no_cache* is a list of names of methods to not cache
-    automatically.  Valid method names for *no_cache* are ``'render'`` and
-    ``'rows'``.
+    automatically.  Valid method names for *no_cache* are ``'render'``,
+    ``'render_rows'`` and ``'rows'``.
+
+    A class that defines render() but not render_rows() gets the
+    default :meth:`Widget.render_rows`, so a render_rows() inherited
+    from a superclass never bypasses the new render().
 
     Class variable *ignore_focus* if defined and set to ``True`` indicates
     that the canvas this widget renders is not affected by the focus
@@ -91,6 +98,12 @@ class WidgetMeta(MetaSuper, signals.MetaSignals):
                 render_fn = nocache_widget_render(cls)
             cls.render = render_fn
 
+        if "render_rows" in d:
+            if "render_rows" not in no_cache:
+                cls.render_rows = cache_widget_render_rows(cls)
+        elif "render" in d:
+            cls.render_rows = Widget.__dict__["render_rows"]
+
         if "rows" in d and "rows" not in no_cache:
             cls.rows = cache_widget_rows(cls)
         if "no_cache" in d:
@@ -128,13 +141,14 @@ def update_wrapper(new_fn, fn):
 def cache_widget_render(cls):
     """
     Return a function that wraps the cls.render() method
-    and fetches and stores canvases with CanvasCache.
+    and fetches and stores canvases with the current CanvasCache.
     """
     ignore_focus = bool(getattr(cls, "ignore_focus", False))
     fn = cls.render
     def cached_render(self, size, focus=False):
         focus = focus and not ignore_focus
-        canv = CanvasCache.fetch(self, cls, size, focus)
+        cache = CanvasCache.get_current()
+        canv = cache.fetch(self, cls, size, focus)
         if canv:
             return canv
 
@@ -143,7 +157,7 @@ def cache_widget_render(cls):
         if canv.widget_info:
             canv = CompositeCanvas(canv)
         canv.finalize(self, size, focus)
-        CanvasCache.store(cls, canv)
+        cache.store(cls, canv)
         return canv
     cached_render.original_fn = fn
     update_wrapper(cached_render, fn)
@@ -185,16 +199,61 @@ def nocache_widget_render_instance(self):
     update_wrapper(finalize_render, fn)
     return finalize_render
 
+def cache_widget_render_rows(cls):
+    """
+    Return a function that wraps the cls.render_rows() method
+    and fetches and stores canvases with the current CanvasCache.
+
+    The canvases are stored with (size, first_row, num_rows) in place
+    of the size.  If the whole canvas for size is cached already the
+    rows are taken from it.
+    """
+    ignore_focus = bool(getattr(cls, "ignore_focus", False))
+    fn = cls.render_rows
+    def cached_render_rows(self, size, first_row, num_rows, focus=False):
+        focus = focus and not ignore_focus
+        cache = CanvasCache.get_current()
+        canv = cache.fetch(self, cls, size, focus)
+        if canv:
+            return trim_rows(canv, first_row, num_rows)
+
+        rows_size = (size, first_row, num_rows)
+        canv = cache.fetch(self, cls, rows_size, focus)
+        if canv:
+            return canv
+
+        canv = fn(self, size, first_row, num_rows, focus=focus)
+        validate_size(self, size[:1] + (num_rows,), canv)
+        if canv.widget_info:
+            canv = CompositeCanvas(canv)
+        canv.finalize(self, rows_size, focus)
+        cache.store(cls, canv)
+        return canv
+    cached_render_rows.original_fn = fn
+    update_wrapper(cached_render_rows, fn)
+    return cached_render_rows
+
+def trim_rows(canv, first_row, num_rows):
+    """
+    Return a canvas with rows first_row to first_row + num_rows - 1
+    of canv.
+    """
+    if not first_row and num_rows == canv.rows():
+        return canv
+    canv = CompositeCanvas(canv)
+    canv.trim(first_row, num_rows)
+    return canv
+
 def cache_widget_rows(cls):
     """
     Return a function that wraps the cls.rows() method
-    and returns rows from the CanvasCache if available.
+    and returns rows from the current CanvasCache if available.
     """
     ignore_focus = bool(getattr(cls, "ignore_focus", False))
     fn = cls.rows
     def cached_rows(self, size, focus=False):
         focus = focus and not ignore_focus
-        canv = CanvasCache.fetch(self, cls, size, focus)
+        canv = CanvasCache.get_current().fetch(self, cls, size, focus)
         if canv:
             return canv.rows()
 
@@ -448,13 +507,44 @@ class Widget(object):
     _selectable = False
     _sizing = frozenset([FLOW, BOX, FIXED])
     _command_map = command_map
+    no_cache = ["render_rows"] # the default needs no caching
+
+    def render_rows(self, size, first_row, num_rows, focus=False):
+        """
+        Render rows *first_row* to *first_row* + *num_rows* - 1 of
+        the canvas :meth:`render` would return.
+
+        :param size: See :meth:`Widget.render` for details
+        :type size: widget size
+        :param first_row: first row to render, 0 is the top row
+        :type first_row: int
+        :param num_rows: number of rows to render, at least 1
+        :type num_rows: int
+        :param focus: See :meth:`Widget.render` for details
+        :type focus: bool
+
+        :returns: A :class:`Canvas` subclass instance *num_rows* high
+
+        Containers like :class:`ListBox` call this method when only
+        part of a widget is visible.  This default renders the whole
+        widget and trims the canvas, widgets that can render part of
+        their content more quickly (:class:`Text`, :class:`Edit`,
+        :class:`Pile` and the decoration widgets) override it.  The
+        result is cached like that of :meth:`render`, but a
+        cached canvas of the whole widget is used when available.
+        """
+        return trim_rows(self.render(size, focus), first_row, num_rows)
 
     def _invalidate(self):
         """
         Mark cached canvases rendered by this widget as dirty so that
         they will not be used again.
+
+        While a main loop is running the cached canvases are removed
+        in one batch before the screen is next drawn, see
+        :meth:`CanvasCache.invalidate_later`.
         """
-        CanvasCache.invalidate(self)
+        CanvasCache.invalidate_later(self)
 
     def _emit(self, name, *args):
         """
@@ -748,7 +838,7 @@ class Divider(Widget):
         [...'xxxxx', ...'     ', ...'     ']
         """
         (maxcol,) = size
-        canv = SolidCanvas(self.div_char, maxcol, 1)
+        canv = SolidCanvas.shared(self.div_char, maxcol, 1)
         canv = CompositeCanvas(canv)
         if self.top or self.bottom:
             canv.pad_trim_top_bottom(self.top, self.bottom)
@@ -786,7 +876,8 @@ class SolidFill(BoxWidget):
         [...'#####', ...'#####', ...'#####']
         """
         maxcol, maxrow = size
-        return SolidCanvas(self.fill_char, maxcol, maxrow)
+        return CompositeCanvas(SolidCanvas.shared(self.fill_char, maxcol,
+            maxrow))
 
 class TextError(Exception):
     pass
@@ -794,11 +885,28 @@ class TextError(Exception):
 class Text(Widget):
     """
     a horizontally resizeable text widget
+
+    .. attribute:: canvas_class
+       :annotation: = urwid.TextCanvas
+
+       Class of the canvases returned by :meth:`render`.  May be set
+       to :class:`PackedTextCanvas` on a subclass, an instance or
+       this class to store rendered text more compactly.
+
+    .. attribute:: layout_widths
+       :annotation: = 4
+
+       Number of different widths for which the layout and the
+       :meth:`pack` result are kept, so that containers asking for
+       the size of this widget at a few widths don't cause it to be
+       laid out again each time.
     """
     _sizing = frozenset([FLOW])
 
     ignore_focus = True
     _repr_content_length_max = 140
+    canvas_class = TextCanvas
+    layout_widths = 4
 
     def __init__(self, markup, align=LEFT, wrap=SPACE, layout=None):
         """
@@ -834,6 +942,9 @@ class Text(Widget):
         """
         self.__super.__init__()
         self._cache_maxcol = None
+        self._cache_translations = {}
+        self._cache_widths = []
+        self._cache_packs = {}
         self.set_text(markup)
         self.set_layout(align, wrap, layout)
 
@@ -858,6 +969,9 @@ class Text(Widget):
 
     def _invalidate(self):
         self._cache_maxcol = None
+        self._cache_translations = {}
+        self._cache_widths = []
+        self._cache_packs = {}
         self.__super._invalidate()
 
     def set_text(self,markup):
@@ -1005,7 +1119,24 @@ class Text(Widget):
         text, attr = self.get_text()
         #assert isinstance(text, unicode)
         trans = self.get_line_translation( maxcol, (text,attr) )
-        return apply_text_layout(text, attr, trans, maxcol)
+        return apply_text_layout(text, attr, trans, maxcol,
+            self.canvas_class)
+
+    def render_rows(self, size, first_row, num_rows, focus=False):
+        """
+        Render only rows *first_row* to *first_row* + *num_rows* - 1.
+
+        See :meth:`Widget.render_rows` for parameter details.
+
+        >>> Text(u"one two three").render_rows((5,), 1, 2).text
+        [...'two  ', ...'three']
+        """
+        (maxcol,) = size
+        text, attr = self.get_text()
+        trans = self.get_line_translation( maxcol, (text,attr) )
+        return apply_text_layout(text, attr,
+            trans[first_row:first_row + num_rows], maxcol,
+            self.canvas_class)
 
     def rows(self, size, focus=False):
         """
@@ -1033,9 +1164,11 @@ class Text(Widget):
                    returned from :meth:`.get_text`
         :type ta: text and display attributes
         """
-        if not self._cache_maxcol or self._cache_maxcol != maxcol:
+        trans = self._cache_translations.get(maxcol)
+        if trans is None:
             self._update_cache_translation(maxcol, ta)
-        return self._cache_translation
+            trans = self._cache_translation
+        return trans
 
     def _update_cache_translation(self,maxcol, ta):
         if ta:
@@ -1043,14 +1176,67 @@ class Text(Widget):
         else:
             text, attr = self.get_text()
         self._cache_maxcol = maxcol
-        self._cache_translation = self._calc_line_translation(
-            text, maxcol )
+        self._store_translation(maxcol,
+            self._calc_line_translation(text, maxcol))
+
+    def _store_translation(self, maxcol, trans):
+        self._cache_maxcol = maxcol
+        self._cache_translation = trans
+        self._cache_translations[maxcol] = trans
+        self._cache_widths.append(maxcol)
+        if len(self._cache_widths) > self.layout_widths:
+            # forget the oldest width
+            old = self._cache_widths.pop(0)
+            del self._cache_translations[old]
+            self._cache_packs.pop(old, None)
 
     def _calc_line_translation(self, text, maxcol ):
-        return self.layout.layout(
+        return text_layout.layout_cache.layout(self.layout,
             text, self._cache_maxcol,
             self._align_mode, self._wrap_mode )
 
+    def layout_many(cls, widgets, maxcol):
+        """
+        Lay out the text of many widgets for *maxcol* screen columns
+        together, so that their :meth:`rows` and :meth:`render` for
+        *maxcol* use the stored layouts.  Widgets with the same layout
+        object, align and wrap modes are passed to the layout object's
+        ``layout_many()`` method in one call.
+
+        Widgets that aren't Text widgets, that already have a layout
+        for *maxcol* or that calculate their layout differently (like
+        :class:`Edit`) are skipped.
+
+        :param widgets: widgets to lay out
+        :param maxcol: columns available for display
+        :type maxcol: int
+
+        >>> ws = [Text(u"one"), Text(u"two three"), Divider()]
+        >>> Text.layout_many(ws, 5)
+        >>> [w.rows((5,)) for w in ws]
+        [1, 2, 1]
+        """
+        groups = {}
+        standard = {} # class: True if it lays out text like Text
+        for w in widgets:
+            if not isinstance(w, Text) or maxcol in w._cache_translations:
+                continue
+            wcls = type(w)
+            if wcls not in standard:
+                standard[wcls] = (wcls._calc_line_translation ==
+                    Text._calc_line_translation)
+            if not standard[wcls]:
+                continue
+            text, attr = w.get_text()
+            groups.setdefault((w.layout, w._align_mode, w._wrap_mode),
+                []).append((w, text))
+        for (layout, align, wrap), items in groups.items():
+            layouts = text_layout.layout_cache.layout_many(layout,
+                [text for w, text in items], maxcol, align, wrap)
+            for (w, text), trans in zip(items, layouts):
+                w._store_translation(maxcol, trans)
+    layout_many = classmethod(layout_many)
+
     def pack(self, size=None, focus=False):
         """
         Return the number of screen columns and rows required for
@@ -1068,27 +1254,26 @@ class Text(Widget):
         >>> Text(u"important things").pack((8,))
         (8, 2)
         """
-        text, attr = self.get_text()
-
+        maxcol = None
         if size is not None:
             (maxcol,) = size
+        result = self._cache_packs.get(maxcol)
+        if result is not None:
+            return result
+
+        text, attr = self.get_text()
+        if size is not None:
             if not hasattr(self.layout, "pack"):
                 return size
             trans = self.get_line_translation( maxcol, (text,attr))
-            cols = self.layout.pack( maxcol, trans )
-            return (cols, len(trans))
-
-        i = 0
-        cols = 0
-        while i < len(text):
-            j = text.find('\n', i)
-            if j == -1:
-                j = len(text)
-            c = calc_width(text, i, j)
-            if c>cols:
-                cols = c
-            i = j+1
-        return (cols, text.count('\n') + 1)
+            result = (self.layout.pack( maxcol, trans ), len(trans))
+            if trans is not self._cache_translations.get(maxcol):
+                return result # modified by a subclass, don't keep it
+        else:
+            result = text_layout.layout_cache.pack(self.layout, text, None,
+                self._align_mode, self._wrap_mode)
+        self._cache_packs[maxcol] = result
+        return result
 
 
 class EditError(TextError):
@@ -1106,6 +1291,11 @@ class Edit(Text):
     """
     # (this variable is picked up by the MetaSignals metaclass)
     signals = ["change"]
+    _line_layout = None
+    _buffer = None
+    # (prefix, suffix) lengths of the buffer text unchanged since the
+    # line layout was updated, None if unknown
+    _buffer_span = None
 
     def valid_char(self, ch):
         """
@@ -1122,7 +1312,7 @@ class Edit(Text):
 
     def __init__(self, caption=u"", edit_text=u"", multiline=False,
             align=LEFT, wrap=SPACE, allow_tab=False,
-            edit_pos=None, layout=None, mask=None):
+            edit_pos=None, layout=None, mask=None, gap_buffer=False):
         """
         :param caption: markup for caption preceeding edit_text, see
                         :class:`Text` for description of text markup.
@@ -1144,6 +1334,10 @@ class Edit(Text):
         :type layout: text layout instance
         :param mask: hide text entered with this character, None:disable mask
         :type mask: bytes or unicode
+        :param gap_buffer: store edit_text in a gap buffer so that
+                           inserting and deleting text doesn't copy the
+                           whole text, for editing large amounts of text
+        :type gap_buffer: bool
 
         >>> Edit()
         <Edit selectable flow widget '' edit_pos=0>
@@ -1159,6 +1353,8 @@ class Edit(Text):
         self.multiline = multiline
         self.allow_tab = allow_tab
         self._edit_pos = 0
+        if gap_buffer:
+            self._buffer = GapBuffer()
         self.set_caption(caption)
         self.set_edit_text(edit_text)
         if edit_pos is None:
@@ -1178,6 +1374,32 @@ class Edit(Text):
             edit_pos=self._edit_pos)
         return remove_defaults(attrs, Edit.__init__)
 
+    def _get_edit_text_storage(self):
+        if self._buffer is not None:
+            return self._buffer.text()
+        return self._edit_string
+    def _set_edit_text_storage(self, text):
+        if self._buffer is not None:
+            old = self._buffer.text()
+            if type(old) != type(text):
+                self._buffer.set_text(text)
+                self._buffer_span = None
+                return
+            # replace only the part that changed
+            prefix = _common_prefix_length(old, text)
+            suffix = _common_suffix_length(old, text,
+                min(len(old), len(text)) - prefix)
+            self._replace_buffer_text(prefix, len(old) - suffix,
+                text[prefix:len(text) - suffix])
+        else:
+            self._edit_string = text
+    _edit_text = property(_get_edit_text_storage, _set_edit_text_storage)
+
+    def _edit_text_length(self):
+        if self._buffer is not None:
+            return len(self._buffer)
+        return len(self._edit_string)
+
     def get_text(self):
         """
         Returns ``(text, display attributes)``. See :meth:`Text.get_text`
@@ -1314,8 +1536,9 @@ class Edit(Text):
         """
         if pos < 0:
             pos = 0
-        if pos > len(self._edit_text):
-            pos = len(self._edit_text)
+        length = self._edit_text_length()
+        if pos > length:
+            pos = length
         self.highlight = None
         self.pref_col_maxcol = None, None
         self._edit_pos = pos
@@ -1396,11 +1619,74 @@ class Edit(Text):
         42a.5
         """
         text = self._normalize_to_caption(text)
+        if (self._buffer is not None and not self.highlight and
+                type(self).insert_text_result == Edit.insert_text_result):
+            # same result without building the new text
+            p = self.edit_pos
+            self._replace_edit_text(p, p, text)
+            self.set_edit_pos(p + len(text))
+            return
         result_text, result_pos = self.insert_text_result(text)
         self.set_edit_text(result_text)
         self.set_edit_pos(result_pos)
         self.highlight = None
 
+    def _replace_edit_text(self, start, stop, text):
+        """
+        Replace edit_text[start:stop] with text.  The same as calling
+        set_edit_text() with the new text, but when edit_text is stored
+        in a gap buffer the new text is only built if there
+        is a ``"change"`` signal handler to pass it to.
+        """
+        if self._buffer is None:
+            old = self._edit_text
+            self.set_edit_text(old[:start] + text + old[stop:])
+            return
+        self.highlight = None
+        if getattr(self, signals.Signals._signal_attr, {}).get("change"):
+            old = self._edit_text
+            self._emit("change", old[:start] + text + old[stop:])
+        self._replace_buffer_text(start, stop, text)
+        length = len(self._buffer)
+        if self.edit_pos > length:
+            self.edit_pos = length
+        self._invalidate()
+
+    def _replace_buffer_text(self, start, stop, text):
+        """
+        Replace the buffer text from start to stop with text, keeping
+        track of the part of the text that changed.
+        """
+        if self._buffer_span is not None:
+            prefix, suffix = self._buffer_span
+            self._buffer_span = (min(prefix, start),
+                min(suffix, len(self._buffer) - stop))
+        self._buffer.replace(start, stop, text)
+
+    def _prev_char_pos(self, pos):
+        """
+        Return the position of the character before pos in edit_text.
+        """
+        if self._buffer is None:
+            return move_prev_char(self._edit_text, 0, pos)
+        # only the current line is needed to find the character
+        b = self._buffer
+        start = b.line_start(b.line_of(pos))
+        if start == pos:
+            return pos - 1
+        return start + move_prev_char(b.get(start, pos), 0, pos - start)
+
+    def _next_char_pos(self, pos):
+        """
+        Return the position of the character after pos in edit_text.
+        """
+        if self._buffer is None:
+            return move_next_char(self._edit_text, pos,
+                len(self._edit_text))
+        # no character is longer than 4 bytes
+        window = self._buffer.get(pos, pos + 4)
+        return pos + move_next_char(window, 0, len(window))
+
     def _normalize_to_caption(self, text):
         """
         Return text converted to the same type as self.caption
@@ -1483,12 +1769,12 @@ class Edit(Text):
 
         elif self._command_map[key] == CURSOR_LEFT:
             if p==0: return key
-            p = move_prev_char(self.edit_text,0,p)
+            p = self._prev_char_pos(p)
             self.set_edit_pos(p)
 
         elif self._command_map[key] == CURSOR_RIGHT:
-            if p >= len(self.edit_text): return key
-            p = move_next_char(self.edit_text,p,len(self.edit_text))
+            if p >= self._edit_text_length(): return key
+            p = self._next_char_pos(p)
             self.set_edit_pos(p)
 
         elif self._command_map[key] in (CURSOR_UP, CURSOR_DOWN):
@@ -1510,19 +1796,17 @@ class Edit(Text):
             self.pref_col_maxcol = None, None
             if not self._delete_highlighted():
                 if p == 0: return key
-                p = move_prev_char(self.edit_text,0,p)
-                self.set_edit_text( self.edit_text[:p] +
-                    self.edit_text[self.edit_pos:] )
+                p = self._prev_char_pos(p)
+                self._replace_edit_text(p, self.edit_pos, self._caption[:0])
                 self.set_edit_pos( p )
 
         elif key=="delete":
             self.pref_col_maxcol = None, None
             if not self._delete_highlighted():
-                if p >= len(self.edit_text):
+                if p >= self._edit_text_length():
                     return key
-                p = move_next_char(self.edit_text,p,len(self.edit_text))
-                self.set_edit_text( self.edit_text[:self.edit_pos] +
-                    self.edit_text[p:] )
+                p = self._next_char_pos(p)
+                self._replace_edit_text(self.edit_pos, p, self._caption[:0])
 
         elif self._command_map[key] in (CURSOR_MAX_LEFT, CURSOR_MAX_RIGHT):
             self.highlight = None
@@ -1596,8 +1880,7 @@ class Edit(Text):
         """
         if not self.highlight: return
         start, stop = self.highlight
-        btext, etext = self.edit_text[:start], self.edit_text[stop:]
-        self.set_edit_text( btext + etext )
+        self._replace_edit_text(start, stop, self._caption[:0])
         self.edit_pos = start
         self.highlight = None
         return True
@@ -1628,12 +1911,156 @@ class Edit(Text):
         #    d.coords['highlight'] = [ hstart, hstop ]
         return canv
 
+    def render_rows(self, size, first_row, num_rows, focus=False):
+        """
+        Render only rows *first_row* to *first_row* + *num_rows* - 1,
+        including the cursor if it is one of those rows and the
+        widget is in focus.
+
+        >>> c = Edit("? ","yes\\nno", multiline=True).render_rows((10,),
+        ...     1, 1, focus=True)
+        >>> c.text # ... = b in Python 3
+        [...'no        ']
+        >>> c.cursor
+        (2, 0)
+        """
+        (maxcol,) = size
+        self._shift_view_to_cursor = bool(focus)
+
+        il = self._incremental_layout(maxcol)
+        if il is None:
+            canv = Text.render_rows(self, (maxcol,), first_row, num_rows)
+        else:
+            # lay out only the rows to be rendered
+            trans = il.translation_rows(first_row, num_rows)
+            if focus:
+                y, shift = self._cursor_shift(il)
+                if shift and first_row <= y < first_row + num_rows:
+                    y -= first_row
+                    trans = (trans[:y] + [shift_line(trans[y], shift)] +
+                        trans[y+1:])
+            if isinstance(il.text, TextView):
+                text, attr, trans = self._rows_text(il.text, trans)
+            else:
+                text, attr = self.get_text()
+            canv = apply_text_layout(text, attr, trans, maxcol,
+                self.canvas_class)
+        if focus:
+            x, y = self.get_cursor_coords((maxcol,))
+            if first_row <= y < first_row + num_rows:
+                canv = CompositeCanvas(canv)
+                canv.cursor = x, y - first_row
+        return canv
+
+
+    def _rows_text(self, text, trans):
+        """
+        Return (text, attr, trans) with only the part of text and
+        attributes that the rows in layout structure trans use, and
+        trans changed to match.
+        """
+        lo = hi = None
+        for line in trans:
+            for seg in line:
+                start = end = seg[1]
+                if start is None:
+                    continue
+                if len(seg) == 3 and type(seg[2]) == int:
+                    end = seg[2]
+                if lo is None or start < lo:
+                    lo = start
+                if hi is None or end > hi:
+                    hi = end
+        if lo is None:
+            lo = hi = 0
+        # the attribute at hi is used by padding segments
+        return (text[lo:hi], rle_subseg(self._attrib, lo, hi + 1),
+            [shift_offsets(line, -lo) for line in trans])
+
+    def rows(self, size, focus=False):
+        """
+        Return the number of rows the rendered text requires.
+
+        See :meth:`Widget.rows` for parameter details.
+
+        >>> Edit(u"", u"one\\ntwo three", multiline=True).rows((5,))
+        3
+        """
+        (maxcol,) = size
+        il = self._incremental_layout(maxcol)
+        if il is None:
+            return Text.rows(self, size, focus)
+        return il.rows()
+
+    def _incremental_layout(self, maxcol):
+        """
+        Return an up to date :class:`IncrementalLayout` of the text
+        for maxcol, or None when it can't be used.
+
+        A multiline Edit keeps the layout of each line of text, so that
+        after a change only the lines that were modified are laid out
+        again.
+        """
+        if not self.multiline or not getattr(self.layout,
+                'lines_independent', False):
+            return None
+        il = self._line_layout
+        if il is None or (il.layout, il.width, il.align, il.wrap) != (
+                self.layout, maxcol, self._align_mode, self._wrap_mode):
+            il = IncrementalLayout(self.layout, maxcol, self._align_mode,
+                self._wrap_mode)
+            self._line_layout = il
+        if self._buffer is not None and self._mask is None:
+            # lay out from the buffer without joining the whole text
+            caption = self._caption
+            old = il.text
+            span = self._buffer_span
+            if (span is None or not isinstance(old, TextView) or
+                    type(old.prefix) != type(caption) or
+                    old.prefix != caption):
+                span = (-len(caption), 0)
+            il.update(TextView(caption, self._buffer),
+                span[0] + len(caption), span[1])
+            length = len(self._buffer)
+            self._buffer_span = (length, length)
+        else:
+            il.update(self.get_text()[0])
+        if il.failed:
+            return None
+        return il
+
+    def _cursor_shift(self, il):
+        """
+        Return (row, amount) where amount is the number of columns that
+        row has to be shifted by to make the cursor visible.
+        """
+        x, y = il.coords(self.edit_pos + len(self.caption))
+        if x < 0:
+            return y, -x
+        elif x >= il.width:
+            return y, -(x-il.width+1)
+        return y, 0
+
+    def _calc_line_translation(self, text, maxcol):
+        il = self._incremental_layout(self._cache_maxcol)
+        if il is None:
+            return Text._calc_line_translation(self, text, maxcol)
+        return il.translation()
 
     def get_line_translation(self, maxcol, ta=None ):
         trans = Text.get_line_translation(self, maxcol, ta)
         if not self._shift_view_to_cursor:
             return trans
 
+        il = self._incremental_layout(maxcol)
+        if il is not None:
+            y, shift = self._cursor_shift(il)
+            if shift:
+                return ( trans[:y]
+                    + [shift_line(trans[y],shift)]
+                    + trans[y+1:] )
+            return trans
+
         text, ignore = self.get_text()
         x,y = calc_coords( text, trans,
             self.edit_pos + len(self.caption) )
@@ -1667,6 +2094,15 @@ class Edit(Text):
         """
 
         p = pos + len(self.caption)
+        il = self._incremental_layout(maxcol)
+        if il is not None:
+            x, y = il.coords(p)
+            if self._shift_view_to_cursor:
+                cursor_y, shift = self._cursor_shift(il)
+                if shift and y == cursor_y:
+                    x, y = il.coords(p, shift)
+            return x, y
+
         trans = self.get_line_translation(maxcol)
         x,y = calc_coords(self.get_text()[0], trans,p)
         return x,y
@@ -1751,6 +2187,11 @@ def delegate_to_widget_mixin(attribute_name):
             canv = get_delegate(self).render(size, focus=focus)
             return CompositeCanvas(canv)
 
+        def render_rows(self, size, first_row, num_rows, focus=False):
+            canv = get_delegate(self).render_rows(size, first_row,
+                num_rows, focus=focus)
+            return CompositeCanvas(canv)
+
         selectable = property(lambda self:get_delegate(self).selectable)
         get_cursor_coords = property(
             lambda self:get_delegate(self).get_cursor_coords)
@@ -0,0 +1,1773 @@
+# generated by bin/gen_width_tables.py from Unicode 15.1.0 data, do not edit
+
+from urwid.compat import B, bytes3
+
+PAGE_SHIFT = 8
+
+# (last code point, width) for each run of code points with the same width
+widths = [
+    (13, 1),
+    (15, 0),
+    (126, 1),
+    (159, 0),
+    (767, 1),
+    (879, 0),
+    (1154, 1),
+    (1161, 0),
+    (1424, 1),
+    (1469, 0),
+    (1470, 1),
+    (1471, 0),
+    (1472, 1),
+    (1474, 0),
+    (1475, 1),
+    (1477, 0),
+    (1478, 1),
+    (1479, 0),
+    (1535, 1),
+    (1541, 0),
+    (1551, 1),
+    (1562, 0),
+    (1563, 1),
+    (1564, 0),
+    (1610, 1),
+    (1631, 0),
+    (1647, 1),
+    (1648, 0),
+    (1749, 1),
+    (1757, 0),
+    (1758, 1),
+    (1764, 0),
+    (1766, 1),
+    (1768, 0),
+    (1769, 1),
+    (1773, 0),
+    (1806, 1),
+    (1807, 0),
+    (1808, 1),
+    (1809, 0),
+    (1839, 1),
+    (1866, 0),
+    (1957, 1),
+    (1968, 0),
+    (2026, 1),
+    (2035, 0),
+    (2044, 1),
+    (2045, 0),
+    (2069, 1),
+    (2073, 0),
+    (2074, 1),
+    (2083, 0),
+    (2084, 1),
+    (2087, 0),
+    (2088, 1),
+    (2093, 0),
+    (2136, 1),
+    (2139, 0),
+    (2191, 1),
+    (2193, 0),
+    (2199, 1),
+    (2207, 0),
+    (2249, 1),
+    (2306, 0),
+    (2361, 1),
+    (2362, 0),
+    (2363, 1),
+    (2364, 0),
+    (2368, 1),
+    (2376, 0),
+    (2380, 1),
+    (2381, 0),
+    (2384, 1),
+    (2391, 0),
+    (2401, 1),
+    (2403, 0),
+    (2432, 1),
+    (2433, 0),
+    (2491, 1),
+    (2492, 0),
+    (2496, 1),
+    (2500, 0),
+    (2508, 1),
+    (2509, 0),
+    (2529, 1),
+    (2531, 0),
+    (2557, 1),
+    (2558, 0),
+    (2560, 1),
+    (2562, 0),
+    (2619, 1),
+    (2620, 0),
+    (2624, 1),
+    (2626, 0),
+    (2630, 1),
+    (2632, 0),
+    (2634, 1),
+    (2637, 0),
+    (2640, 1),
+    (2641, 0),
+    (2671, 1),
+    (2673, 0),
+    (2676, 1),
+    (2677, 0),
+    (2688, 1),
+    (2690, 0),
+    (2747, 1),
+    (2748, 0),
+    (2752, 1),
+    (2757, 0),
+    (2758, 1),
+    (2760, 0),
+    (2764, 1),
+    (2765, 0),
+    (2785, 1),
+    (2787, 0),
+    (2809, 1),
+    (2815, 0),
+    (2816, 1),
+    (2817, 0),
+    (2875, 1),
+    (2876, 0),
+    (2878, 1),
+    (2879, 0),
+    (2880, 1),
+    (2884, 0),
+    (2892, 1),
+    (2893, 0),
+    (2900, 1),
+    (2902, 0),
+    (2913, 1),
+    (2915, 0),
+    (2945, 1),
+    (2946, 0),
+    (3007, 1),
+    (3008, 0),
+    (3020, 1),
+    (3021, 0),
+    (3071, 1),
+    (3072, 0),
+    (3075, 1),
+    (3076, 0),
+    (3131, 1),
+    (3132, 0),
+    (3133, 1),
+    (3136, 0),
+    (3141, 1),
+    (3144, 0),
+    (3145, 1),
+    (3149, 0),
+    (3156, 1),
+    (3158, 0),
+    (3169, 1),
+    (3171, 0),
+    (3200, 1),
+    (3201, 0),
+    (3259, 1),
+    (3260, 0),
+    (3262, 1),
+    (3263, 0),
+    (3269, 1),
+    (3270, 0),
+    (3275, 1),
+    (3277, 0),
+    (3297, 1),
+    (3299, 0),
+    (3327, 1),
+    (3329, 0),
+    (3386, 1),
+    (3388, 0),
+    (3392, 1),
+    (3396, 0),
+    (3404, 1),
+    (3405, 0),
+    (3425, 1),
+    (3427, 0),
+    (3456, 1),
+    (3457, 0),
+    (3529, 1),
+    (3530, 0),
+    (3537, 1),
+    (3540, 0),
+    (3541, 1),
+    (3542, 0),
+    (3632, 1),
+    (3633, 0),
+    (3635, 1),
+    (3642, 0),
+    (3654, 1),
+    (3662, 0),
+    (3760, 1),
+    (3761, 0),
+    (3763, 1),
+    (3772, 0),
+    (3783, 1),
+    (3790, 0),
+    (3863, 1),
+    (3865, 0),
+    (3892, 1),
+    (3893, 0),
+    (3894, 1),
+    (3895, 0),
+    (3896, 1),
+    (3897, 0),
+    (3952, 1),
+    (3966, 0),
+    (3967, 1),
+    (3972, 0),
+    (3973, 1),
+    (3975, 0),
+    (3980, 1),
+    (3991, 0),
+    (3992, 1),
+    (4028, 0),
+    (4037, 1),
+    (4038, 0),
+    (4140, 1),
+    (4144, 0),
+    (4145, 1),
+    (4151, 0),
+    (4152, 1),
+    (4154, 0),
+    (4156, 1),
+    (4158, 0),
+    (4183, 1),
+    (4185, 0),
+    (4189, 1),
+    (4192, 0),
+    (4208, 1),
+    (4212, 0),
+    (4225, 1),
+    (4226, 0),
+    (4228, 1),
+    (4230, 0),
+    (4236, 1),
+    (4237, 0),
+    (4252, 1),
+    (4253, 0),
+    (4351, 1),
+    (4447, 2),
+    (4607, 0),
+    (4956, 1),
+    (4959, 0),
+    (5905, 1),
+    (5908, 0),
+    (5937, 1),
+    (5939, 0),
+    (5969, 1),
+    (5971, 0),
+    (6001, 1),
+    (6003, 0),
+    (6067, 1),
+    (6069, 0),
+    (6070, 1),
+    (6077, 0),
+    (6085, 1),
+    (6086, 0),
+    (6088, 1),
+    (6099, 0),
+    (6108, 1),
+    (6109, 0),
+    (6154, 1),
+    (6159, 0),
+    (6276, 1),
+    (6278, 0),
+    (6312, 1),
+    (6313, 0),
+    (6431, 1),
+    (6434, 0),
+    (6438, 1),
+    (6440, 0),
+    (6449, 1),
+    (6450, 0),
+    (6456, 1),
+    (6459, 0),
+    (6678, 1),
+    (6680, 0),
+    (6682, 1),
+    (6683, 0),
+    (6741, 1),
+    (6742, 0),
+    (6743, 1),
+    (6750, 0),
+    (6751, 1),
+    (6752, 0),
+    (6753, 1),
+    (6754, 0),
+    (6756, 1),
+    (6764, 0),
+    (6770, 1),
+    (6780, 0),
+    (6782, 1),
+    (6783, 0),
+    (6831, 1),
+    (6862, 0),
+    (6911, 1),
+    (6915, 0),
+    (6963, 1),
+    (6964, 0),
+    (6965, 1),
+    (6970, 0),
+    (6971, 1),
+    (6972, 0),
+    (6977, 1),
+    (6978, 0),
+    (7018, 1),
+    (7027, 0),
+    (7039, 1),
+    (7041, 0),
+    (7073, 1),
+    (7077, 0),
+    (7079, 1),
+    (7081, 0),
+    (7082, 1),
+    (7085, 0),
+    (7141, 1),
+    (7142, 0),
+    (7143, 1),
+    (7145, 0),
+    (7148, 1),
+    (7149, 0),
+    (7150, 1),
+    (7153, 0),
+    (7211, 1),
+    (7219, 0),
+    (7221, 1),
+    (7223, 0),
+    (7375, 1),
+    (7378, 0),
+    (7379, 1),
+    (7392, 0),
+    (7393, 1),
+    (7400, 0),
+    (7404, 1),
+    (7405, 0),
+    (7411, 1),
+    (7412, 0),
+    (7415, 1),
+    (7417, 0),
+    (7615, 1),
+    (7679, 0),
+    (8202, 1),
+    (8207, 0),
+    (8233, 1),
+    (8238, 0),
+    (8287, 1),
+    (8292, 0),
+    (8293, 1),
+    (8303, 0),
+    (8399, 1),
+    (8432, 0),
+    (8985, 1),
+    (8987, 2),
+    (9000, 1),
+    (9002, 2),
+    (9192, 1),
+    (9196, 2),
+    (9199, 1),
+    (9200, 2),
+    (9202, 1),
+    (9203, 2),
+    (9724, 1),
+    (9726, 2),
+    (9747, 1),
+    (9749, 2),
+    (9799, 1),
+    (9811, 2),
+    (9854, 1),
+    (9855, 2),
+    (9874, 1),
+    (9875, 2),
+    (9888, 1),
+    (9889, 2),
+    (9897, 1),
+    (9899, 2),
+    (9916, 1),
+    (9918, 2),
+    (9923, 1),
+    (9925, 2),
+    (9933, 1),
+    (9934, 2),
+    (9939, 1),
+    (9940, 2),
+    (9961, 1),
+    (9962, 2),
+    (9969, 1),
+    (9971, 2),
+    (9972, 1),
+    (9973, 2),
+    (9977, 1),
+    (9978, 2),
+    (9980, 1),
+    (9981, 2),
+    (9988, 1),
+    (9989, 2),
+    (9993, 1),
+    (9995, 2),
+    (10023, 1),
+    (10024, 2),
+    (10059, 1),
+    (10060, 2),
+    (10061, 1),
+    (10062, 2),
+    (10066, 1),
+    (10069, 2),
+    (10070, 1),
+    (10071, 2),
+    (10132, 1),
+    (10135, 2),
+    (10159, 1),
+    (10160, 2),
+    (10174, 1),
+    (10175, 2),
+    (11034, 1),
+    (11036, 2),
+    (11087, 1),
+    (11088, 2),
+    (11092, 1),
+    (11093, 2),
+    (11502, 1),
+    (11505, 0),
+    (11646, 1),
+    (11647, 0),
+    (11743, 1),
+    (11775, 0),
+    (11903, 1),
+    (11929, 2),
+    (11930, 1),
+    (12019, 2),
+    (12031, 1),
+    (12245, 2),
+    (12271, 1),
+    (12329, 2),
+    (12333, 0),
+    (12350, 2),
+    (12352, 1),
+    (12438, 2),
+    (12440, 1),
+    (12442, 0),
+    (12543, 2),
+    (12548, 1),
+    (12591, 2),
+    (12592, 1),
+    (12686, 2),
+    (12687, 1),
+    (12771, 2),
+    (12782, 1),
+    (12830, 2),
+    (12831, 1),
+    (12871, 2),
+    (12879, 1),
+    (19903, 2),
+    (19967, 1),
+    (42124, 2),
+    (42127, 1),
+    (42182, 2),
+    (42606, 1),
+    (42610, 0),
+    (42611, 1),
+    (42621, 0),
+    (42653, 1),
+    (42655, 0),
+    (42735, 1),
+    (42737, 0),
+    (43009, 1),
+    (43010, 0),
+    (43013, 1),
+    (43014, 0),
+    (43018, 1),
+    (43019, 0),
+    (43044, 1),
+    (43046, 0),
+    (43051, 1),
+    (43052, 0),
+    (43203, 1),
+    (43205, 0),
+    (43231, 1),
+    (43249, 0),
+    (43262, 1),
+    (43263, 0),
+    (43301, 1),
+    (43309, 0),
+    (43334, 1),
+    (43345, 0),
+    (43359, 1),
+    (43388, 2),
+    (43391, 1),
+    (43394, 0),
+    (43442, 1),
+    (43443, 0),
+    (43445, 1),
+    (43449, 0),
+    (43451, 1),
+    (43453, 0),
+    (43492, 1),
+    (43493, 0),
+    (43560, 1),
+    (43566, 0),
+    (43568, 1),
+    (43570, 0),
+    (43572, 1),
+    (43574, 0),
+    (43586, 1),
+    (43587, 0),
+    (43595, 1),
+    (43596, 0),
+    (43643, 1),
+    (43644, 0),
+    (43695, 1),
+    (43696, 0),
+    (43697, 1),
+    (43700, 0),
+    (43702, 1),
+    (43704, 0),
+    (43709, 1),
+    (43711, 0),
+    (43712, 1),
+    (43713, 0),
+    (43755, 1),
+    (43757, 0),
+    (43765, 1),
+    (43766, 0),
+    (44004, 1),
+    (44005, 0),
+    (44007, 1),
+    (44008, 0),
+    (44012, 1),
+    (44013, 0),
+    (44031, 1),
+    (55203, 2),
+    (63743, 1),
+    (64255, 2),
+    (64285, 1),
+    (64286, 0),
+    (65023, 1),
+    (65039, 0),
+    (65049, 2),
+    (65055, 1),
+    (65071, 0),
+    (65106, 2),
+    (65107, 1),
+    (65126, 2),
+    (65127, 1),
+    (65131, 2),
+    (65278, 1),
+    (65279, 0),
+    (65280, 1),
+    (65376, 2),
+    (65503, 1),
+    (65510, 2),
+    (65528, 1),
+    (65531, 0),
+    (66044, 1),
+    (66045, 0),
+    (66271, 1),
+    (66272, 0),
+    (66421, 1),
+    (66426, 0),
+    (68096, 1),
+    (68099, 0),
+    (68100, 1),
+    (68102, 0),
+    (68107, 1),
+    (68111, 0),
+    (68151, 1),
+    (68154, 0),
+    (68158, 1),
+    (68159, 0),
+    (68324, 1),
+    (68326, 0),
+    (68899, 1),
+    (68903, 0),
+    (69290, 1),
+    (69292, 0),
+    (69372, 1),
+    (69375, 0),
+    (69445, 1),
+    (69456, 0),
+    (69505, 1),
+    (69509, 0),
+    (69632, 1),
+    (69633, 0),
+    (69687, 1),
+    (69702, 0),
+    (69743, 1),
+    (69744, 0),
+    (69746, 1),
+    (69748, 0),
+    (69758, 1),
+    (69761, 0),
+    (69810, 1),
+    (69814, 0),
+    (69816, 1),
+    (69818, 0),
+    (69820, 1),
+    (69821, 0),
+    (69825, 1),
+    (69826, 0),
+    (69836, 1),
+    (69837, 0),
+    (69887, 1),
+    (69890, 0),
+    (69926, 1),
+    (69931, 0),
+    (69932, 1),
+    (69940, 0),
+    (70002, 1),
+    (70003, 0),
+    (70015, 1),
+    (70017, 0),
+    (70069, 1),
+    (70078, 0),
+    (70088, 1),
+    (70092, 0),
+    (70094, 1),
+    (70095, 0),
+    (70190, 1),
+    (70193, 0),
+    (70195, 1),
+    (70196, 0),
+    (70197, 1),
+    (70199, 0),
+    (70205, 1),
+    (70206, 0),
+    (70208, 1),
+    (70209, 0),
+    (70366, 1),
+    (70367, 0),
+    (70370, 1),
+    (70378, 0),
+    (70399, 1),
+    (70401, 0),
+    (70458, 1),
+    (70460, 0),
+    (70463, 1),
+    (70464, 0),
+    (70501, 1),
+    (70508, 0),
+    (70511, 1),
+    (70516, 0),
+    (70711, 1),
+    (70719, 0),
+    (70721, 1),
+    (70724, 0),
+    (70725, 1),
+    (70726, 0),
+    (70749, 1),
+    (70750, 0),
+    (70834, 1),
+    (70840, 0),
+    (70841, 1),
+    (70842, 0),
+    (70846, 1),
+    (70848, 0),
+    (70849, 1),
+    (70851, 0),
+    (71089, 1),
+    (71093, 0),
+    (71099, 1),
+    (71101, 0),
+    (71102, 1),
+    (71104, 0),
+    (71131, 1),
+    (71133, 0),
+    (71218, 1),
+    (71226, 0),
+    (71228, 1),
+    (71229, 0),
+    (71230, 1),
+    (71232, 0),
+    (71338, 1),
+    (71339, 0),
+    (71340, 1),
+    (71341, 0),
+    (71343, 1),
+    (71349, 0),
+    (71350, 1),
+    (71351, 0),
+    (71452, 1),
+    (71455, 0),
+    (71457, 1),
+    (71461, 0),
+    (71462, 1),
+    (71467, 0),
+    (71726, 1),
+    (71735, 0),
+    (71736, 1),
+    (71738, 0),
+    (71994, 1),
+    (71996, 0),
+    (71997, 1),
+    (71998, 0),
+    (72002, 1),
+    (72003, 0),
+    (72147, 1),
+    (72151, 0),
+    (72153, 1),
+    (72155, 0),
+    (72159, 1),
+    (72160, 0),
+    (72192, 1),
+    (72202, 0),
+    (72242, 1),
+    (72248, 0),
+    (72250, 1),
+    (72254, 0),
+    (72262, 1),
+    (72263, 0),
+    (72272, 1),
+    (72278, 0),
+    (72280, 1),
+    (72283, 0),
+    (72329, 1),
+    (72342, 0),
+    (72343, 1),
+    (72345, 0),
+    (72751, 1),
+    (72758, 0),
+    (72759, 1),
+    (72765, 0),
+    (72766, 1),
+    (72767, 0),
+    (72849, 1),
+    (72871, 0),
+    (72873, 1),
+    (72880, 0),
+    (72881, 1),
+    (72883, 0),
+    (72884, 1),
+    (72886, 0),
+    (73008, 1),
+    (73014, 0),
+    (73017, 1),
+    (73018, 0),
+    (73019, 1),
+    (73021, 0),
+    (73022, 1),
+    (73029, 0),
+    (73030, 1),
+    (73031, 0),
+    (73103, 1),
+    (73105, 0),
+    (73108, 1),
+    (73109, 0),
+    (73110, 1),
+    (73111, 0),
+    (73458, 1),
+    (73460, 0),
+    (73471, 1),
+    (73473, 0),
+    (73525, 1),
+    (73530, 0),
+    (73535, 1),
+    (73536, 0),
+    (73537, 1),
+    (73538, 0),
+    (78895, 1),
+    (78912, 0),
+    (78918, 1),
+    (78933, 0),
+    (92911, 1),
+    (92916, 0),
+    (92975, 1),
+    (92982, 0),
+    (94030, 1),
+    (94031, 0),
+    (94094, 1),
+    (94098, 0),
+    (94175, 1),
+    (94179, 2),
+    (94180, 0),
+    (94191, 1),
+    (94193, 2),
+    (94207, 1),
+    (100343, 2),
+    (100351, 1),
+    (101589, 2),
+    (101631, 1),
+    (101640, 2),
+    (110575, 1),
+    (110579, 2),
+    (110580, 1),
+    (110587, 2),
+    (110588, 1),
+    (110590, 2),
+    (110591, 1),
+    (110882, 2),
+    (110897, 1),
+    (110898, 2),
+    (110927, 1),
+    (110930, 2),
+    (110932, 1),
+    (110933, 2),
+    (110947, 1),
+    (110951, 2),
+    (110959, 1),
+    (111355, 2),
+    (113820, 1),
+    (113822, 0),
+    (113823, 1),
+    (113827, 0),
+    (118527, 1),
+    (118573, 0),
+    (118575, 1),
+    (118598, 0),
+    (119142, 1),
+    (119145, 0),
+    (119154, 1),
+    (119170, 0),
+    (119172, 1),
+    (119179, 0),
+    (119209, 1),
+    (119213, 0),
+    (119361, 1),
+    (119364, 0),
+    (121343, 1),
+    (121398, 0),
+    (121402, 1),
+    (121452, 0),
+    (121460, 1),
+    (121461, 0),
+    (121475, 1),
+    (121476, 0),
+    (121498, 1),
+    (121503, 0),
+    (121504, 1),
+    (121519, 0),
+    (122879, 1),
+    (122886, 0),
+    (122887, 1),
+    (122904, 0),
+    (122906, 1),
+    (122913, 0),
+    (122914, 1),
+    (122916, 0),
+    (122917, 1),
+    (122922, 0),
+    (123022, 1),
+    (123023, 0),
+    (123183, 1),
+    (123190, 0),
+    (123565, 1),
+    (123566, 0),
+    (123627, 1),
+    (123631, 0),
+    (124139, 1),
+    (124143, 0),
+    (125135, 1),
+    (125142, 0),
+    (125251, 1),
+    (125258, 0),
+    (126979, 1),
+    (126980, 2),
+    (127182, 1),
+    (127183, 2),
+    (127373, 1),
+    (127374, 2),
+    (127376, 1),
+    (127386, 2),
+    (127487, 1),
+    (127490, 2),
+    (127503, 1),
+    (127547, 2),
+    (127551, 1),
+    (127560, 2),
+    (127567, 1),
+    (127569, 2),
+    (127583, 1),
+    (127589, 2),
+    (127743, 1),
+    (127776, 2),
+    (127788, 1),
+    (127797, 2),
+    (127798, 1),
+    (127868, 2),
+    (127869, 1),
+    (127891, 2),
+    (127903, 1),
+    (127946, 2),
+    (127950, 1),
+    (127955, 2),
+    (127967, 1),
+    (127984, 2),
+    (127987, 1),
+    (127988, 2),
+    (127991, 1),
+    (128062, 2),
+    (128063, 1),
+    (128064, 2),
+    (128065, 1),
+    (128252, 2),
+    (128254, 1),
+    (128317, 2),
+    (128330, 1),
+    (128334, 2),
+    (128335, 1),
+    (128359, 2),
+    (128377, 1),
+    (128378, 2),
+    (128404, 1),
+    (128406, 2),
+    (128419, 1),
+    (128420, 2),
+    (128506, 1),
+    (128591, 2),
+    (128639, 1),
+    (128709, 2),
+    (128715, 1),
+    (128716, 2),
+    (128719, 1),
+    (128722, 2),
+    (128724, 1),
+    (128727, 2),
+    (128731, 1),
+    (128735, 2),
+    (128746, 1),
+    (128748, 2),
+    (128755, 1),
+    (128764, 2),
+    (128991, 1),
+    (129003, 2),
+    (129007, 1),
+    (129008, 2),
+    (129291, 1),
+    (129338, 2),
+    (129339, 1),
+    (129349, 2),
+    (129350, 1),
+    (129535, 2),
+    (129647, 1),
+    (129660, 2),
+    (129663, 1),
+    (129672, 2),
+    (129679, 1),
+    (129725, 2),
+    (129726, 1),
+    (129733, 2),
+    (129741, 1),
+    (129755, 2),
+    (129759, 1),
+    (129768, 2),
+    (129775, 1),
+    (129784, 2),
+    (131071, 1),
+    (196605, 2),
+    (196607, 1),
+    (262141, 2),
+    (917504, 1),
+    (917505, 0),
+    (917535, 1),
+    (917631, 0),
+    (917759, 1),
+    (917999, 0),
+    (1114111, 1),
+    ]
+
+# block of widths for each page of code points
+_pages = [
+    0, 1, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14,
+    15, 16, 1, 17, 1, 1, 1, 18, 19, 20, 21, 22, 23, 24, 1, 1,
+    25, 1, 1, 26, 1, 27, 28, 29, 1, 1, 1, 30, 31, 32, 33, 34,
+    35, 36, 37, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 39, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 40, 1, 41, 1, 42, 43, 44, 45, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 46, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 38, 38, 47, 1, 1, 48, 49,
+    1, 50, 51, 52, 1, 1, 1, 1, 1, 1, 53, 1, 1, 54, 55, 56,
+    57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 1, 68, 69, 70, 71,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 72, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 73, 74, 1, 1, 1, 75,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 76, 38, 38, 38, 38, 77, 78, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 79,
+    38, 80, 81, 1, 1, 1, 1, 1, 1, 1, 1, 1, 82, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 83,
+    1, 84, 85, 1, 1, 1, 1, 1, 1, 1, 86, 1, 1, 1, 1, 1,
+    87, 74, 88, 1, 89, 1, 1, 1, 90, 91, 1, 1, 1, 1, 1, 1,
+    92, 93, 94, 95, 96, 97, 98, 99, 1, 100, 101, 1, 1, 1, 1, 1,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 102,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38,
+    38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 38, 102,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    103, 104, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    ]
+
+# widths for each block, one digit per code point
+_blocks = (
+    # block 0
+    "1111111111111100111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111110"
+    "0000000000000000000000000000000011111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 1
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 2
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000001111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 3
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1110000000111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 4
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111100000000000000000000000000000000000000000000010"
+    "1001001011111111111111111111111111111111111111111111111111111111"
+    # block 5
+    "0000001111111111000000000001011111111111111111111111111111111111"
+    "1111111111100000000000000000000011111111111111110111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111000000001000000110010000111111111111111111"
+    # block 6
+    "1111111111111110101111111111111111111111111111110000000000000000"
+    "0000000000011111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111100000000000111111111111111"
+    "1111111111111111111111111111111111111111111000000000111111111011"
+    # block 7
+    "1111111111111111111111000010000000001000100000111111111111111111"
+    "1111111111111111111111111000111111111111111111111111111111111111"
+    "1111111111111111001111110000000011111111111111111111111111111111"
+    "1111111111000000000000000000000000000000000000000000000000000000"
+    # block 8
+    "0001111111111111111111111111111111111111111111111111111111010111"
+    "1000000001111011100000001111111111001111111111111111111111111111"
+    "1011111111111111111111111111111111111111111111111111111111110111"
+    "1000011111111011111111111111111111001111111111111111111111111101"
+    # block 9
+    "1001111111111111111111111111111111111111111111111111111111110111"
+    "1001111001100011101111111111111111111111111111110011101111111111"
+    "1001111111111111111111111111111111111111111111111111111111110111"
+    "1000001001111011111111111111111111001111111111111111111111000000"
+    # block 10
+    "1011111111111111111111111111111111111111111111111111111111110110"
+    "1000011111111011111110011111111111001111111111111111111111111111"
+    "1101111111111111111111111111111111111111111111111111111111111111"
+    "0111111111111011111111111111111111111111111111111111111111111111"
+    # block 11
+    "0111011111111111111111111111111111111111111111111111111111110100"
+    "0111110001000011111110011111111111001111111111111111111111111111"
+    "1011111111111111111111111111111111111111111111111111111111110110"
+    "1111110111110011111111111111111111001111111111111111111111111111"
+    # block 12
+    "0011111111111111111111111111111111111111111111111111111111100111"
+    "1000011111111011111111111111111111001111111111111111111111111111"
+    "1011111111111111111111111111111111111111111111111111111111111111"
+    "1111111111011111110001011111111111111111111111111111111111111111"
+    # block 13
+    "1111111111111111111111111111111111111111111111111011000000011111"
+    "1111111000000001111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111011000000000111"
+    "1111111100000001111111111111111111111111111111111111111111111111"
+    # block 14
+    "1111111111111111111111110011111111111111111111111111101010111111"
+    "1111111111111111111111111111111111111111111111111000000000000001"
+    "0000010011111000000000001000000000000000000000000000000000000111"
+    "1111110111111111111111111111111111111111111111111111111111111111"
+    # block 15
+    "1111111111111111111111111111111111111111111110000100000010011001"
+    "1111111111111111111111110011110001111111111111111000011111111111"
+    "1101100111111011111111111111101111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 16
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222200000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    # block 17
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111100011111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 18
+    "1111111111111111110001111111111111111111111111111100111111111111"
+    "1111111111111111110011111111111111111111111111111100111111111111"
+    "1111111111111111111111111111111111111111111111111111001000000011"
+    "1111110110000000000011111111101111111111111111111111111111111111"
+    # block 19
+    "1111111111100000111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111100111111111111111111111111111111111101111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 20
+    "1111111111111111111111111111111100011110011111111101111110001111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 21
+    "1111111111111111111111100110111111111111111111111111111111111111"
+    "1111111111111111111111010000000101011000000001111110000000000110"
+    "1111111111111111111111111111111111111111111111110000000000000000"
+    "0000000000000001111111111111111111111111111111111111111111111111"
+    # block 22
+    "0000111111111111111111111111111111111111111111111111010000010111"
+    "1101111111111111111111111111111111111111111000000000111111111111"
+    "0011111111111111111111111111111111000011001000111111111111111111"
+    "1111111111111111111111111111111111111101001110100011111111111111"
+    # block 23
+    "1111111111111111111111111111111111111111111100000000110011111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111000100000000000001000000011110111111011100111111"
+    # block 24
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    # block 25
+    "1111111111100000111111111111111111111111110000011111111111111111"
+    "1111111111111111111111111111111100000100000000001111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111000000000000000000000000000000000111111111111111"
+    # block 26
+    "1111111111111111111111111122111111111111122111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111122221112112111111111111"
+    # block 27
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111221"
+    # block 28
+    "1111111111111111111122111111111111111111111111111111111111111111"
+    "1111111122222222222211111111111111111111111111111111111111111112"
+    "1111111111111111111211111111111112111111112211111111111111111221"
+    "1111221111111121111121111111111111111111112111111122121111211211"
+    # block 29
+    "1111121111221111111111111111111111111111211111111111111111111111"
+    "1111111111112121111222121111111111111111111111111111111111111111"
+    "1111111111111111111112221111111111111111111111112111111111111112"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 30
+    "1111111111111111111111111112211111111111111111111111111111111111"
+    "1111111111111111211112111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 31
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111100011111111111111"
+    # block 32
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111110"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111100000000000000000000000000000000"
+    # block 33
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "2222222222222222222222222212222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222111111111111"
+    # block 34
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222111111111111111111111111112222222222222222"
+    # block 35
+    "2222222222222222222222222222222222222222220000222222222222222221"
+    "1222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222211002222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    # block 36
+    "1111122222222222222222222222222222222222222222221222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222221222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222221111111111122222222222222222"
+    # block 37
+    "2222222222222222222222222222222122222222222222222222222222222222"
+    "2222222211111111222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    # block 38
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    # block 39
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 40
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222111222222222222222222222222222222222222222222222222"
+    "2222222111111111111111111111111111111111111111111111111111111111"
+    # block 41
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111100001000000000011"
+    "1111111111111111111111111111110011111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111110011111111111111"
+    # block 42
+    "1101110111101111111111111111111111111001111101111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111001111111111111111111111111100000000000000000011111111111110"
+    # block 43
+    "1111111111111111111111111111111111111100000000111111111111111111"
+    "1111111000000000001111111111111122222222222222222222222222222111"
+    "0001111111111111111111111111111111111111111111111110110000110011"
+    "1111111111111111111111111111111111111011111111111111111111111111"
+    # block 44
+    "1111111111111111111111111111111111111111100000011001100111111111"
+    "1110111111110111111111111111111111111111111111111111111111110111"
+    "1111111111111111111111111111111111111111111111110100011001111100"
+    "1011111111111111111111111111111111111111111100111111110111111111"
+    # block 45
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111011011110111111111111111111"
+    # block 46
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222221111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 47
+    "1111111111111111111111111111110111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 48
+    "0000000000000000222222222211111100000000000000002222222222222222"
+    "2222222222222222222122222222222222222221222211111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111110"
+    # block 49
+    "1222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222221111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111122222221111111111111111110001111"
+    # block 50
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111011"
+    # block 51
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111101111111111111111111111111111111"
+    # block 52
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111110000011111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 53
+    "1000100111110000111111111111111111111111111111111111111100011110"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111001111111111111111111111111"
+    # block 54
+    "1111111111111111111111111111111111110000111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 55
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111001111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111000"
+    # block 56
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111110000000000011111111111111111111111111111111111111111111111"
+    "1100001111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 57
+    "1011111111111111111111111111111111111111111111111111111100000000"
+    "0000000111111111111111111111111111111111111111110110011111111110"
+    "0011111111111111111111111111111111111111111111111110000110011011"
+    "1101111111111011111111111111111111111111111111111111111111111111"
+    # block 58
+    "0001111111111111111111111111111111111110000010000000011111111111"
+    "1111111111111111111111111111111111111111111111111110111111111111"
+    "0011111111111111111111111111111111111111111111111111110000000001"
+    "1111111110000110111111111111111111111111111111111111111111111111"
+    # block 59
+    "1111111111111111111111111111111111111111111111100011010011111101"
+    "1011111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111011100000000111111111111111111111"
+    # block 60
+    "0011111111111111111111111111111111111111111111111111111111100111"
+    "0111111111111111111111111111111111111100000001110000011111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 61
+    "1111111111111111111111111111111111111111111111111111111100000000"
+    "1100010111111111111111111111110111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111110000001011110"
+    "0100111111111111111111111111111111111111111111111111111111111111"
+    # block 62
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111100001111110010"
+    "0111111111111111111111111111001111111111111111111111111111111111"
+    # block 63
+    "1111111111111111111111111111111111111111111111111110000000011010"
+    "0111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111010110000001011111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 64
+    "1111111111111111111111111111100011000010000011111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 65
+    "1111111111111111111111111111111111111111111111100000000010011111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 66
+    "1111111111111111111111111111111111111111111111111111111111100101"
+    "1110111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111100001100111101111111111111111111111111111111"
+    # block 67
+    "1000000000011111111111111111111111111111111111111110000001100001"
+    "1111111011111111100000011000111111111111111111111111111111111111"
+    "1111111111000000000000010011111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 68
+    "1111111111111111111111111111111111111111111111110000000100000010"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111110000000000000000000000110000000100100111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 69
+    "1111111111111111111111111111111111111111111111111000000111010010"
+    "0000001011111111111111111111111111111111111111111111111111111111"
+    "1111111111111111001110101111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 70
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111110011111111111"
+    # block 71
+    "0011111111111111111111111111111111111111111111111111110000011111"
+    "0101111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 72
+    "1111111111111111111111111111111111111111111111110000000000000000"
+    "0111111000000000000000111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 73
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111110000011111111111"
+    # block 74
+    "1111111111111111111111111111111111111111111111110000000111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 75
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111110111111111111111111111111111111111111111111111111"
+    "1111111111111110000111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111122220111111111112211111111111111"
+    # block 76
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222222211111111"
+    # block 77
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222111111111111111111111111111111111111111111"
+    # block 78
+    "2222222221111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 79
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111112222122222221221"
+    # block 80
+    "2222222222222222222222222222222222211111111111111121111111111111"
+    "1111111111111111222112111111111111112222111111112222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    # block 81
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222221111"
+    # block 82
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111100100001111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 83
+    "0000000000000000000000000000000000000000000000110000000000000000"
+    "0000000111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 84
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111110001111111110000000000000"
+    "0001100000001111111111111111111111111111110000111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 85
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1100011111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 86
+    "0000000000000000000000000000000000000000000000000000000111100000"
+    "0000000000000000000000000000000000000000000001111111101111111111"
+    "1111011111111111111111111110000010000000000000001111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 87
+    "0000000100000000000000000110000000100100000111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111110111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 88
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111011111111111111111"
+    "1111111111111111111111111111111111111111111100001111111111111111"
+    # block 89
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111100001111111111111111"
+    # block 90
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111000000011111111111111111111111111111111111111111"
+    # block 91
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111000000011111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 92
+    "1111211111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111112111111111111111111111111111111111111111111111111"
+    # block 93
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111121122222222221111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 94
+    "2221111111111111222222222222222222222222222222222222222222221111"
+    "2222222221111111221111111111111122222211111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 95
+    "2222222222222222222222222222222221111111111112222222221222222222"
+    "2222222222222222222222222222222222222222222222222222222222222122"
+    "2222222222222222222211111111111122222222222222222222222222222222"
+    "2222222222211112222211111111111122222222222222222111211122222222"
+    # block 96
+    "2222222222222222222222222222222222222222222222222222222222222221"
+    "2122222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222222112"
+    # block 97
+    "2222222222222222222222222222222222222222222222222222222222222211"
+    "1111111111122221222222222222222222222222111111111111111111211111"
+    "1111111111111111111112211111111111112111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111122222"
+    # block 98
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222111111111111111111111111111111111111111111111111"
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222221111112111222112221111222211111111111221111111222222222111"
+    # block 99
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111122222222222211112111111111111111"
+    # block 100
+    "1111111111112222222222222222222222222222222222222222222222212222"
+    "2222221222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    # block 101
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111112222222222222111"
+    "2222222221111111222222222222222222222222222222222222222222222212"
+    "2222221111111122222222222222111122222222211111112222222221111111"
+    # block 102
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222222222"
+    "2222222222222222222222222222222222222222222222222222222222222211"
+    # block 103
+    "1011111111111111111111111111111100000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    "1111111111111111111111111111111111111111111111111111111111111111"
+    # block 104
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000000000000000000000"
+    "0000000000000000000000000000000000000000000000001111111111111111"
+    )
+
+width_pages = bytearray(_pages)
+width_blocks = bytearray(B(_blocks).translate(
+    bytes3([max(i - 48, 0) for i in range(256)])))
+del _pages, _blocks
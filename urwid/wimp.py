@@ -610,7 +610,12 @@ class PopUpTarget(WidgetDecoration):
         self._current_widget = self._original_widget
 
     def _update_overlay(self, size, focus):
-        canv = self._original_widget.render(size, focus=focus)
+        if self._pop_up is not None:
+            # render the original widget the same way as the overlay
+            # will, so the canvas is reused and hidden parts culled
+            canv = self._current_widget._render_bottom(size)
+        else:
+            canv = self._original_widget.render(size, focus=focus)
         self._cache_original_canvas = canv # imperfect performance hack
         pop_up = canv.get_pop_up()
         if pop_up: